@@ -0,0 +1,148 @@
+import os
+
+
+# ======================================================
+# APP SETTINGS
+# Everything can be overridden with environment
+# variables, defaults are safe for local development.
+# ======================================================
+
+def env_str(name: str, default: str) -> str:
+    return os.getenv(name, default)
+
+
+def env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# ================= LOGGING =================
+
+LOG_LEVEL = env_str("SUKHA_LOG_LEVEL", "INFO")
+
+# ================= DATABASE =================
+
+DATABASE_URL = env_str("SUKHA_DATABASE_URL", "sqlite:///./sukha.db")
+
+# Log every SQL statement (slow, only for debugging)
+DB_ECHO = env_bool("SUKHA_DB_ECHO", False)
+
+# Write connections
+DB_POOL_SIZE = env_int("SUKHA_DB_POOL_SIZE", 5)
+DB_MAX_OVERFLOW = env_int("SUKHA_DB_MAX_OVERFLOW", 5)
+DB_POOL_TIMEOUT = env_int("SUKHA_DB_POOL_TIMEOUT", 30)
+
+# Read-only connections used by GET routes
+DB_READ_POOL_SIZE = env_int("SUKHA_DB_READ_POOL_SIZE", 10)
+DB_READ_MAX_OVERFLOW = env_int("SUKHA_DB_READ_MAX_OVERFLOW", 10)
+
+# ================= SQLITE PRAGMAS =================
+
+SQLITE_JOURNAL_MODE = env_str("SUKHA_SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = env_str("SUKHA_SQLITE_SYNCHRONOUS", "NORMAL")
+
+# Negative value = size in KiB (64 MiB)
+SQLITE_CACHE_SIZE = env_int("SUKHA_SQLITE_CACHE_SIZE", -65536)
+
+# Bytes of the file to memory-map (256 MiB)
+SQLITE_MMAP_SIZE = env_int("SUKHA_SQLITE_MMAP_SIZE", 268435456)
+
+SQLITE_BUSY_TIMEOUT_MS = env_int("SUKHA_SQLITE_BUSY_TIMEOUT_MS", 5000)
+
+# ================= AUTH =================
+
+# Authenticated users kept in memory between requests
+PRINCIPAL_CACHE_SIZE = env_int("SUKHA_PRINCIPAL_CACHE_SIZE", 1024)
+PRINCIPAL_CACHE_TTL_SECONDS = env_int("SUKHA_PRINCIPAL_CACHE_TTL_SECONDS", 300)
+
+# Argon2 runs in a separate process pool (0 = inline in the threadpool)
+PASSWORD_WORKERS = env_int("SUKHA_PASSWORD_WORKERS", 2)
+
+# Hash jobs allowed to wait or run at once; extra logins get 503
+PASSWORD_MAX_PENDING = env_int("SUKHA_PASSWORD_MAX_PENDING", 16)
+
+# Concurrent logins allowed per username; extra attempts get 429
+PASSWORD_PER_USER_LIMIT = env_int("SUKHA_PASSWORD_PER_USER_LIMIT", 1)
+
+# ================= ASYNC REQUEST PATH =================
+
+# Serve unit, stay and auth hot paths with async handlers
+# over an aiosqlite engine (needs the aiosqlite package)
+ASYNC_ROUTES = env_bool("SUKHA_ASYNC_ROUTES", False)
+
+# ================= ROOM BOARD =================
+
+# Encoded board responses kept per (route, role) for the
+# current occupancy version
+BOARD_CACHE_SIZE = env_int("SUKHA_BOARD_CACHE_SIZE", 32)
+
+# Live board stream: status changes kept for resuming clients,
+# and events queued per client before it must resync
+BOARD_STREAM_BUFFER_SIZE = env_int("SUKHA_BOARD_STREAM_BUFFER_SIZE", 1000)
+BOARD_STREAM_QUEUE_SIZE = env_int("SUKHA_BOARD_STREAM_QUEUE_SIZE", 100)
+
+# Comment line sent on idle streams to keep proxies open
+BOARD_STREAM_HEARTBEAT_SECONDS = env_int("SUKHA_BOARD_STREAM_HEARTBEAT_SECONDS", 15)
+
+# ================= METRICS =================
+
+# Requests slower than this are logged with their SQL and
+# EXPLAIN QUERY PLAN (0 = off)
+SLOW_REQUEST_MS = env_int("SUKHA_SLOW_REQUEST_MS", 500)
+
+# Statements kept per request for the slow-request log
+SLOW_REQUEST_MAX_STATEMENTS = env_int("SUKHA_SLOW_REQUEST_MAX_STATEMENTS", 50)
+
+# Static bearer token for Prometheus scrapes of /metrics
+# ("" = admin access token only)
+METRICS_TOKEN = env_str("SUKHA_METRICS_TOKEN", "")
+
+# Also log bound parameters (guest names, phone numbers...)
+# with each statement; for debugging only
+SLOW_REQUEST_LOG_PARAMETERS = env_bool("SUKHA_SLOW_REQUEST_LOG_PARAMETERS", False)
+
+# ================= STAY ARCHIVE =================
+
+# Completed stays whose checkout is older than this move to
+# stay_archive (0 = never archive)
+STAY_ARCHIVE_AFTER_DAYS = env_int("SUKHA_STAY_ARCHIVE_AFTER_DAYS", 365)
+
+# Stays moved per transaction, and the pause between
+# batches so request writes get the lock in between
+STAY_ARCHIVE_BATCH_SIZE = env_int("SUKHA_STAY_ARCHIVE_BATCH_SIZE", 1000)
+STAY_ARCHIVE_PAUSE_MS = env_int("SUKHA_STAY_ARCHIVE_PAUSE_MS", 50)
+
+# How often the background run looks for stays to archive
+STAY_ARCHIVE_INTERVAL_SECONDS = env_int("SUKHA_STAY_ARCHIVE_INTERVAL_SECONDS", 3600)
+
+# ================= DELTA SYNC =================
+
+# Change log entries kept for offline clients; older
+# cursors get a full snapshot
+SYNC_LOG_RETENTION_DAYS = env_int("SUKHA_SYNC_LOG_RETENTION_DAYS", 30)
+
+# How often the change log is compacted
+SYNC_COMPACT_INTERVAL_SECONDS = env_int("SUKHA_SYNC_COMPACT_INTERVAL_SECONDS", 3600)
+
+# Change log entries per /sync response
+SYNC_MAX_CHANGES = env_int("SUKHA_SYNC_MAX_CHANGES", 1000)
+
+# ================= AUDIT TRAIL =================
+
+# Events waiting for the background writer; when full,
+# requests wait up to AUDIT_ENQUEUE_TIMEOUT_MS, then write
+# their event themselves
+AUDIT_QUEUE_SIZE = env_int("SUKHA_AUDIT_QUEUE_SIZE", 10000)
+AUDIT_ENQUEUE_TIMEOUT_MS = env_int("SUKHA_AUDIT_ENQUEUE_TIMEOUT_MS", 200)
+
+# Events per transaction, and how long the writer waits
+# for more before committing a partial batch
+AUDIT_BATCH_SIZE = env_int("SUKHA_AUDIT_BATCH_SIZE", 500)
+AUDIT_FLUSH_MS = env_int("SUKHA_AUDIT_FLUSH_MS", 100)
@@ -1,16 +1,407 @@
+import logging
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import MetaData, and_, event, func, inspect, select, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.schema import CreateTable
 from sqlmodel import SQLModel, create_engine, Session
 
-# Local SQLite database (simple and beginner safe)
-DATABASE_URL = "sqlite:///./sukha.db"
+from app.core.config import (
+    DATABASE_URL,
+    DB_ECHO,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_READ_POOL_SIZE,
+    DB_READ_MAX_OVERFLOW,
+    ASYNC_ROUTES,
+    SQLITE_JOURNAL_MODE,
+    SQLITE_SYNCHRONOUS,
+    SQLITE_CACHE_SIZE,
+    SQLITE_MMAP_SIZE,
+    SQLITE_BUSY_TIMEOUT_MS,
+)
+
+logger = logging.getLogger("sukha.database")
+
+
+# ======================================================
+# ENGINE PROFILE
+# ======================================================
+
+def is_sqlite_file(url) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database not in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def engine_options(url, pool_size: int, max_overflow: int) -> dict:
+    if not is_sqlite_file(url):
+        return {}
+
+    return {
+        "connect_args": {
+            # Connections are shared by the threadpool
+            "check_same_thread": False,
+            "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000,
+        },
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": DB_POOL_TIMEOUT,
+    }
+
+
+def read_only_url(url):
+    """
+    sqlite:///./sukha.db → sqlite:///file:./sukha.db?mode=ro&uri=true
+    """
+    return url.set(
+        database=f"file:{url.database}",
+        query={"mode": "ro", "uri": "true"},
+    )
+
+
+def apply_sqlite_pragmas(engine, read_only: bool = False):
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+
+        # WAL is stored in the file, so only the writer sets it
+        if not read_only:
+            cursor.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+        else:
+            cursor.execute("PRAGMA query_only=ON")
+
+        cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA cache_size={SQLITE_CACHE_SIZE}")
+        cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.close()
+
+
+_url = make_url(DATABASE_URL)
 
 engine = create_engine(
-    DATABASE_URL,
-    echo=True  # shows SQL logs (good for learning)
+    _url,
+    echo=DB_ECHO,
+    **engine_options(_url, DB_POOL_SIZE, DB_MAX_OVERFLOW),
 )
 
+if is_sqlite_file(_url):
+    apply_sqlite_pragmas(engine)
+
+    # Separate read-only pool for GET routes, so readers
+    # never queue behind write connections
+    read_engine = create_engine(
+        read_only_url(_url),
+        echo=DB_ECHO,
+        **engine_options(_url, DB_READ_POOL_SIZE, DB_READ_MAX_OVERFLOW),
+    )
+    apply_sqlite_pragmas(read_engine, read_only=True)
+else:
+    read_engine = engine
+
+
+# ======================================================
+# ASYNC ENGINES (aiosqlite)
+# Created only when SUKHA_ASYNC_ROUTES is on, so the
+# aiosqlite driver stays an optional dependency.
+# ======================================================
+
+def async_url(url):
+    if url.get_backend_name() == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite")
+    return url
+
+
+async_engine = None
+async_read_engine = None
+
+if ASYNC_ROUTES:
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    async_engine = create_async_engine(
+        async_url(_url),
+        echo=DB_ECHO,
+        **engine_options(_url, DB_POOL_SIZE, DB_MAX_OVERFLOW),
+    )
+
+    if is_sqlite_file(_url):
+        apply_sqlite_pragmas(async_engine.sync_engine)
+
+        async_read_engine = create_async_engine(
+            async_url(read_only_url(_url)),
+            echo=DB_ECHO,
+            **engine_options(_url, DB_READ_POOL_SIZE, DB_READ_MAX_OVERFLOW),
+        )
+        apply_sqlite_pragmas(async_read_engine.sync_engine, read_only=True)
+    else:
+        async_read_engine = async_engine
+
+
 def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
+    create_missing_columns()
+    rebuild_for_autoincrement()
+    create_missing_indexes()
+
+def create_missing_columns():
+    # create_all() never alters existing tables, so nullable
+    # columns added to existing models are added here
+    inspector = inspect(engine)
+
+    with engine.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+
+                column_type = column.type.compile(engine.dialect)
+                conn.exec_driver_sql(
+                    f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+                )
+                logger.info("Added column %s.%s", table.name, column.name)
+
+def rebuild_for_autoincrement():
+    # AUTOINCREMENT is part of CREATE TABLE, so tables created
+    # before their model asked for it are rebuilt once: new
+    # table, rows copied with their ids. Indexes and triggers
+    # go with the old table: create_missing_indexes() and
+    # their owners (guest search) recreate them.
+    if engine.dialect.name != "sqlite":
+        return
+
+    for table in SQLModel.metadata.sorted_tables:
+        if not table.dialect_options["sqlite"]["autoincrement"]:
+            continue
+
+        with engine.connect() as conn:
+            sql = conn.exec_driver_sql(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (table.name,),
+            ).scalar()
+        if sql is None or "AUTOINCREMENT" in sql.upper():
+            continue
+
+        started = time.perf_counter()
+        rebuild_table(table)
+        logger.info(
+            "Rebuilt table %s with AUTOINCREMENT in %.0f ms",
+            table.name,
+            (time.perf_counter() - started) * 1000,
+        )
+
+def rebuild_table(table):
+    # SQLite's documented order: build the new table aside,
+    # copy, drop the old one, then take its name. Renaming
+    # the old table first would also rename it inside other
+    # tables' foreign keys.
+    new_name = f"_{table.name}_rebuild"
+    new_table = table.to_metadata(MetaData(), name=new_name)
+    columns = ", ".join(f'"{column.name}"' for column in table.columns)
+
+    # pysqlite would commit before each DDL statement: run
+    # the whole rebuild in one explicit transaction
+    with engine.connect() as conn:
+        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            conn.execute(CreateTable(new_table))
+            conn.exec_driver_sql(
+                f'INSERT INTO "{new_name}" ({columns}) SELECT {columns} FROM "{table.name}"'
+            )
+            conn.exec_driver_sql(f'DROP TABLE "{table.name}"')
+            conn.exec_driver_sql(f'ALTER TABLE "{new_name}" RENAME TO "{table.name}"')
+            conn.exec_driver_sql("COMMIT")
+        except Exception:
+            conn.exec_driver_sql("ROLLBACK")
+            raise
+
+def create_missing_indexes():
+    # create_all() only builds indexes together with new tables,
+    # so indexes added to existing models are created here
+    inspector = inspect(engine)
+
+    for table in SQLModel.metadata.sorted_tables:
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            if index.unique:
+                check_unique_index(index)
+            index.create(engine, checkfirst=True)
+            logger.info("Created index %s", index.name)
+
+class DuplicateRowsError(RuntimeError):
+    pass
+
+def check_unique_index(index):
+    """
+    Rows written before a unique index existed may already
+    break it. Fail with the offending rows instead of the
+    bare IntegrityError CREATE INDEX would raise.
+    """
+    with engine.connect() as conn:
+        conflicts = unique_index_conflicts(conn, index)
+
+    if not conflicts:
+        return
+
+    table = index.table.name
+    columns = ", ".join(column.name for column in index.columns)
+    lines = [
+        f"  {columns}={', '.join(map(str, key))}: {table} ids {', '.join(map(str, ids))}"
+        for key, ids in conflicts.items()
+    ]
+    raise DuplicateRowsError(
+        f"Cannot create unique index {index.name}: these {table} rows share "
+        f"{columns}. Fix them (e.g. close all but one), then restart.\n"
+        + "\n".join(lines)
+    )
+
+def unique_index_conflicts(conn, index) -> dict[tuple, list[int]]:
+    """
+    Key → ids of the rows sharing it, among the rows the
+    index covers (partial indexes: its WHERE clause).
+    """
+    table = index.table
+    columns = list(index.columns)
+    where = index.dialect_kwargs.get(f"{conn.dialect.name}_where")
+
+    duplicated = select(*columns).group_by(*columns).having(func.count() > 1)
+    if where is not None:
+        duplicated = duplicated.where(where)
+
+    conflicts = {}
+    for key in conn.execute(duplicated).all():
+        rows = select(table.c.id).where(
+            and_(*(column == value for column, value in zip(columns, key)))
+        )
+        if where is not None:
+            rows = rows.where(where)
+        conflicts[tuple(key)] = list(conn.execute(rows.order_by(table.c.id)).scalars())
+
+    return conflicts
 
 def get_session():
     with Session(engine) as session:
         yield session
+
+def get_read_session():
+    with Session(read_engine) as session:
+        yield session
+
+async def get_async_session():
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+async def get_async_read_session():
+    async with AsyncSession(async_read_engine) as session:
+        yield session
+
+async def dispose_async_engines():
+    for bind in {async_engine, async_read_engine} - {None}:
+        await bind.dispose()
+
+
+def all_sync_engines():
+    """
+    Every engine as a sync Engine, for event listeners
+    (async engines expose theirs as .sync_engine).
+    """
+    engines = [engine, read_engine]
+    for bind in (async_engine, async_read_engine):
+        if bind is not None:
+            engines.append(bind.sync_engine)
+
+    unique = []
+    for bind in engines:
+        if bind not in unique:
+            unique.append(bind)
+    return unique
+
+
+# ======================================================
+# STARTUP LOG: ACTIVE PRAGMAS
+# ======================================================
+
+def describe_engine_profile() -> dict:
+    profile = {
+        "url": _url.render_as_string(hide_password=True),
+        "echo": DB_ECHO,
+        "pool": f"{DB_POOL_SIZE}+{DB_MAX_OVERFLOW}",
+        "read_pool": f"{DB_READ_POOL_SIZE}+{DB_READ_MAX_OVERFLOW}"
+        if read_engine is not engine
+        else "shared",
+        "async_routes": ASYNC_ROUTES,
+    }
+
+    if _url.get_backend_name() != "sqlite":
+        return profile
+
+    with engine.connect() as conn:
+        for pragma in (
+            "journal_mode",
+            "synchronous",
+            "cache_size",
+            "mmap_size",
+            "busy_timeout",
+        ):
+            profile[pragma] = conn.execute(text(f"PRAGMA {pragma}")).scalar()
+
+    return profile
+
+
+def log_engine_profile():
+    profile = describe_engine_profile()
+    logger.info(
+        "Database profile: %s",
+        ", ".join(f"{key}={value}" for key, value in profile.items()),
+    )
+
+
+# ======================================================
+# SQL STATEMENT COUNTER
+# Used to check that hot paths issue a fixed number
+# of queries, no matter how many rows exist.
+# ======================================================
+
+class StatementCounter:
+    def __init__(self):
+        self.count = 0
+        self.statements: list[str] = []
+
+
+@contextmanager
+def count_statements(*binds):
+    """
+    Count every SQL statement executed on the engines
+    (write and read-only by default).
+
+    Example:
+        with count_statements() as counter:
+            client.get("/units/")
+        assert counter.count == 2
+    """
+    if not binds:
+        binds = all_sync_engines()
+    counter = StatementCounter()
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        counter.count += 1
+        counter.statements.append(statement)
+
+    for bind in binds:
+        event.listen(bind, "before_cursor_execute", _count)
+    try:
+        yield counter
+    finally:
+        for bind in binds:
+            event.remove(bind, "before_cursor_execute", _count)
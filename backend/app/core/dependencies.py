@@ -1,8 +1,11 @@
+from dataclasses import dataclass
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlmodel import Session
 
-from app.core.database import get_session
+from app.core.database import get_read_session, get_async_read_session
+from app.core.principal_cache import principal_cache
 from app.core.security import decode_token
 from app.models.user import User
 
@@ -11,26 +14,75 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
 # ======================================================
-# GET CURRENT USER FROM TOKEN
+# TOKEN CLAIMS (NO DATABASE ACCESS)
 # ======================================================
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    session: Session = Depends(get_session),
-):
+@dataclass(frozen=True)
+class TokenClaims:
+    user_id: int
+    role: str
+
+
+# async: pure CPU work, no need for a threadpool hop
+async def get_token_claims(token: str = Depends(oauth2_scheme)) -> TokenClaims:
     try:
         payload = decode_token(token)
-        user_id = payload.get("sub")
+        if payload.get("type") == "refresh":
+            raise ValueError("Refresh token used as access token")
+        return TokenClaims(
+            user_id=int(payload["sub"]),
+            role=str(payload.get("role")),
+        )
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token",
         )
 
-    user = session.get(User, int(user_id))
+
+# ======================================================
+# GET CURRENT USER FROM TOKEN
+# Served from the principal cache when possible
+# ======================================================
+def get_current_user(
+    claims: TokenClaims = Depends(get_token_claims),
+    session: Session = Depends(get_read_session),
+):
+    return load_user(session, claims.user_id)
+
+
+def load_user(session: Session, user_id: int) -> User:
+    user = principal_cache.get(user_id)
+    if user:
+        return user
+
+    user = session.get(User, user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+        )
+
+    principal_cache.put(user)
+    return user
+
+
+# ======================================================
+# GET CURRENT USER — ASYNC ROUTES
+# ======================================================
+async def get_current_user_async(
+    claims: TokenClaims = Depends(get_token_claims),
+    session=Depends(get_async_read_session),
+):
+    user = principal_cache.get(claims.user_id)
+    if user:
+        return user
+
+    user = await session.get(User, claims.user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
 
+    principal_cache.put(user)
     return user
@@ -0,0 +1,341 @@
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import (
+    SLOW_REQUEST_LOG_PARAMETERS,
+    SLOW_REQUEST_MAX_STATEMENTS,
+    SLOW_REQUEST_MS,
+)
+from app.core.database import all_sync_engines, read_engine
+
+logger = logging.getLogger("sukha.slow")
+
+
+# ======================================================
+# HISTOGRAMS
+# Prometheus-style: cumulative buckets, sum and count
+# per label set. Rendered in the text exposition format.
+# ======================================================
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SQL_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, buckets: tuple):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+
+        # labels → [bucket counts..., sum, count]
+        self._series: dict[tuple, list] = {}
+
+    def observe(self, labels: tuple, value: float):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * len(self.buckets) + [0.0, 0]
+
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[i] += 1
+
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self, label_names: tuple) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+
+        for labels, series in sorted(self._series.items()):
+            base = format_labels(label_names, labels)
+
+            for bound, count in zip(self.buckets, series):
+                lines.append(
+                    f'{self.name}_bucket{{{base},le="{bound}"}} {count}'
+                )
+            lines.append(f'{self.name}_bucket{{{base},le="+Inf"}} {series[-1]}')
+            lines.append(f"{self.name}_sum{{{base}}} {series[-2]:.6f}")
+            lines.append(f"{self.name}_count{{{base}}} {series[-1]}")
+
+        return lines
+
+
+def format_labels(names: tuple, values: tuple) -> str:
+    return ",".join(
+        f'{name}="{escape_label(str(value))}"' for name, value in zip(names, values)
+    )
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# ======================================================
+# REQUEST METRICS
+# ======================================================
+
+ROUTE_LABELS = ("method", "route")
+
+
+class RequestMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        self.latency = Histogram(
+            "sukha_http_request_duration_seconds",
+            "Request latency by route.",
+            LATENCY_BUCKETS,
+        )
+        self.sql_statements = Histogram(
+            "sukha_http_request_sql_statements",
+            "SQL statements executed per request.",
+            SQL_COUNT_BUCKETS,
+        )
+        self.db_time = Histogram(
+            "sukha_http_request_db_seconds",
+            "Time spent executing SQL per request.",
+            LATENCY_BUCKETS,
+        )
+
+        # (method, route, status) → count
+        self.responses: dict[tuple, int] = {}
+
+        # (method, route) → count
+        self.slow_requests: dict[tuple, int] = {}
+
+    def record(self, method: str, route: str, status: int, stats, seconds: float):
+        labels = (method, route)
+
+        with self._lock:
+            self.latency.observe(labels, seconds)
+            self.sql_statements.observe(labels, stats.sql_count)
+            self.db_time.observe(labels, stats.db_seconds)
+
+            key = (method, route, status)
+            self.responses[key] = self.responses.get(key, 0) + 1
+
+    def record_slow(self, method: str, route: str):
+        with self._lock:
+            key = (method, route)
+            self.slow_requests[key] = self.slow_requests.get(key, 0) + 1
+
+    def render(self) -> str:
+        with self._lock:
+            lines = [
+                "# HELP sukha_http_requests_total Responses by route and status.",
+                "# TYPE sukha_http_requests_total counter",
+            ]
+            for labels, count in sorted(self.responses.items()):
+                names = ROUTE_LABELS + ("status",)
+                lines.append(
+                    f"sukha_http_requests_total{{{format_labels(names, labels)}}} {count}"
+                )
+
+            lines += [
+                "# HELP sukha_slow_requests_total Requests over the slow threshold.",
+                "# TYPE sukha_slow_requests_total counter",
+            ]
+            for labels, count in sorted(self.slow_requests.items()):
+                lines.append(
+                    f"sukha_slow_requests_total{{{format_labels(ROUTE_LABELS, labels)}}} {count}"
+                )
+
+            for histogram in (self.latency, self.sql_statements, self.db_time):
+                lines += histogram.render(ROUTE_LABELS)
+
+        return "\n".join(lines) + "\n"
+
+
+request_metrics = RequestMetrics()
+
+
+# ======================================================
+# PER-REQUEST SQL STATS
+# Set by the middleware in a context variable. Sync
+# handlers run in the threadpool with a copy of the
+# context, so engine events there see the same object.
+# ======================================================
+
+class RequestStats:
+    def __init__(self):
+        self.sql_count = 0
+        self.db_seconds = 0.0
+
+        # (statement, parameters, seconds) for the slow log
+        self.statements: list[tuple[str, object, float]] = []
+
+
+_current_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "sukha_request_stats", default=None
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # One statement at a time per connection, so no stack
+    conn.info["sukha_query_start"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+
+    # Execute time only: SQLite steps remaining rows during
+    # fetch, so very large results are partly outside this
+    seconds = time.perf_counter() - conn.info["sukha_query_start"]
+    stats.sql_count += 1
+    stats.db_seconds += seconds
+
+    if len(stats.statements) < SLOW_REQUEST_MAX_STATEMENTS:
+        stats.statements.append(
+            (statement, None if executemany else parameters, seconds)
+        )
+
+
+def instrument_engines():
+    for bind in all_sync_engines():
+        if not event.contains(bind, "before_cursor_execute", _before_cursor_execute):
+            event.listen(bind, "before_cursor_execute", _before_cursor_execute)
+            event.listen(bind, "after_cursor_execute", _after_cursor_execute)
+
+
+# ======================================================
+# MIDDLEWARE (pure ASGI, so streamed responses are not
+# buffered). Routes are labelled by their path template,
+# unmatched paths share one label.
+# ======================================================
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current_stats.set(stats)
+        status = 500
+        started = time.perf_counter()
+
+        # Event streams stay open for hours: time them to the
+        # response start instead of to the end of the stream
+        stream_started: Optional[float] = None
+
+        async def send_wrapper(message):
+            nonlocal status, stream_started
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if is_event_stream(message):
+                    stream_started = time.perf_counter()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            seconds = (stream_started or time.perf_counter()) - started
+            _current_stats.reset(token)
+
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+
+            request_metrics.record(method, route_path, status, stats, seconds)
+
+            if SLOW_REQUEST_MS and seconds * 1000 >= SLOW_REQUEST_MS:
+                request_metrics.record_slow(method, route_path)
+                await run_in_threadpool(
+                    log_slow_request, method, scope["path"], status, stats, seconds
+                )
+
+
+def is_event_stream(message) -> bool:
+    return any(
+        name == b"content-type" and value.startswith(b"text/event-stream")
+        for name, value in message.get("headers", [])
+    )
+
+
+# ======================================================
+# SLOW REQUEST LOG
+# The response is already sent; EXPLAIN runs on the
+# read-only engine for the slowest SELECTs only.
+# Parameters hold guest data, so they are used for the
+# EXPLAIN but only logged with
+# SUKHA_SLOW_REQUEST_LOG_PARAMETERS=1.
+# ======================================================
+
+EXPLAIN_TOP_STATEMENTS = 3
+
+
+def log_slow_request(method: str, path: str, status: int, stats: RequestStats, seconds: float):
+    lines = [
+        f"Slow request: {method} {path} → {status} in {seconds * 1000:.1f} ms, "
+        f"{stats.sql_count} SQL statements, {stats.db_seconds * 1000:.1f} ms in DB"
+    ]
+
+    for statement, parameters, took in stats.statements:
+        line = f"  [{took * 1000:.1f} ms] {one_line(statement)}"
+        if SLOW_REQUEST_LOG_PARAMETERS and parameters:
+            line += f" {parameters}"
+        lines.append(line)
+
+    if stats.sql_count > len(stats.statements):
+        lines.append(f"  ... {stats.sql_count - len(stats.statements)} more")
+
+    slowest = sorted(
+        (item for item in stats.statements if is_explainable(item[0])),
+        key=lambda item: item[2],
+        reverse=True,
+    )
+    seen = set()
+    for statement, parameters, took in slowest:
+        if statement in seen:
+            continue
+        seen.add(statement)
+
+        lines.append(f"  EXPLAIN QUERY PLAN {one_line(statement)}")
+        lines += [f"    {row}" for row in explain_query_plan(statement, parameters)]
+
+        if len(seen) >= EXPLAIN_TOP_STATEMENTS:
+            break
+
+    logger.warning("\n".join(lines))
+
+
+def is_explainable(statement: str) -> bool:
+    return (
+        read_engine.dialect.name == "sqlite"
+        and statement.lstrip().upper().startswith(("SELECT", "WITH"))
+    )
+
+
+def explain_query_plan(statement: str, parameters) -> list[str]:
+    try:
+        with read_engine.connect() as conn:
+            rows = conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters or ()
+            ).all()
+    except Exception as exc:  # noqa: BLE001  (diagnostics must not fail)
+        return [f"(explain failed: {exc})"]
+
+    # (id, parent, notused, detail)
+    depth = {0: 0}
+    plan = []
+    for row_id, parent, _, detail in rows:
+        depth[row_id] = depth.get(parent, 0) + 1
+        plan.append("  " * (depth[row_id] - 1) + detail)
+    return plan
+
+
+def one_line(statement: str) -> str:
+    return " ".join(statement.split())
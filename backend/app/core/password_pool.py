@@ -0,0 +1,148 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import (
+    PASSWORD_WORKERS,
+    PASSWORD_MAX_PENDING,
+    PASSWORD_PER_USER_LIMIT,
+)
+from app.core.security import hash_password, verify_password
+
+
+# ======================================================
+# ERRORS
+# ======================================================
+
+class PasswordPoolBusy(Exception):
+    """Too many hash jobs queued, try again shortly."""
+
+
+class PasswordThrottled(Exception):
+    """Too many parallel attempts for the same username."""
+
+
+# ======================================================
+# PASSWORD POOL
+# Argon2 is CPU heavy (~100ms+). Jobs run in a small
+# process pool so a login burst at shift change cannot
+# starve the board and check-in requests.
+#
+# - at most `max_pending` jobs waiting or running
+# - at most `per_user_limit` in flight per username
+# ======================================================
+
+class PasswordPool:
+    def __init__(self, workers: int, max_pending: int, per_user_limit: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.per_user_limit = per_user_limit
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._per_user: dict[str, int] = {}
+
+        # Stats
+        self.completed = 0
+        self.rejected_busy = 0
+        self.rejected_throttled = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    # spawn: never fork a process that holds threads
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    # ======================================================
+    # ADMISSION
+    # ======================================================
+    def _acquire(self, username: Optional[str]):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected_busy += 1
+                raise PasswordPoolBusy()
+
+            if username is not None:
+                if self._per_user.get(username, 0) >= self.per_user_limit:
+                    self.rejected_throttled += 1
+                    raise PasswordThrottled()
+                self._per_user[username] = self._per_user.get(username, 0) + 1
+
+            self._pending += 1
+
+    def _release(self, username: Optional[str]):
+        with self._lock:
+            self._pending -= 1
+            self.completed += 1
+
+            if username is not None:
+                remaining = self._per_user[username] - 1
+                if remaining:
+                    self._per_user[username] = remaining
+                else:
+                    del self._per_user[username]
+
+    async def _run(self, username: Optional[str], func, *args):
+        self._acquire(username)
+        try:
+            if self.workers <= 0:
+                return await run_in_threadpool(func, *args)
+
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            try:
+                return await loop.run_in_executor(executor, func, *args)
+            except BrokenProcessPool:
+                # A worker died: start a fresh pool on the next call
+                with self._lock:
+                    if self._executor is executor:
+                        self._executor = None
+                raise PasswordPoolBusy()
+        finally:
+            self._release(username)
+
+    # ======================================================
+    # PUBLIC API
+    # ======================================================
+    async def verify(self, username: str, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(username, verify_password, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(None, hash_password, password)
+
+    def warm_up(self):
+        # Start worker processes at boot, not on the first login
+        if self.workers > 0:
+            executor = self._get_executor()
+            for _ in range(self.workers):
+                executor.submit(int)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "per_user_limit": self.per_user_limit,
+            "pending": self._pending,
+            "completed": self.completed,
+            "rejected_busy": self.rejected_busy,
+            "rejected_throttled": self.rejected_throttled,
+        }
+
+
+password_pool = PasswordPool(PASSWORD_WORKERS, PASSWORD_MAX_PENDING, PASSWORD_PER_USER_LIMIT)
@@ -0,0 +1,96 @@
+import logging
+import threading
+from datetime import datetime
+from typing import Callable, Optional
+
+logger = logging.getLogger("sukha.periodic")
+
+
+# ======================================================
+# PERIODIC BACKGROUND JOBS
+# One daemon thread per job, one run every
+# interval_seconds (0 = no thread). Admin routes can run
+# the same job on demand; only one run of a job happens
+# at a time.
+#
+# The job gets a threading.Event that is set on shutdown,
+# so long runs can stop between batches, and returns a
+# dict for the stats.
+# ======================================================
+
+class PeriodicJob:
+    def __init__(
+        self,
+        name: str,
+        interval_seconds: int,
+        job: Callable[[threading.Event], dict],
+        enabled: bool = True,
+    ):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.job = job
+        self.enabled = enabled
+
+        self._run_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Stats
+        self.runs = 0
+        self.last_run: Optional[dict] = None
+        self.last_error: Optional[str] = None
+
+    def run_once(self) -> Optional[dict]:
+        """
+        One run; None if a run is already in progress.
+        """
+        if not self._run_lock.acquire(blocking=False):
+            return None
+
+        try:
+            result = self.job(self._stop)
+        finally:
+            self._run_lock.release()
+
+        self.runs += 1
+        self.last_run = {**result, "finished_at": datetime.utcnow()}
+        return result
+
+    def start(self):
+        if not self.enabled or self.interval_seconds <= 0 or self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name=f"sukha-{self.name}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+            self._thread = None
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+                self.last_error = None
+            except Exception as e:
+                # Retried on the next run
+                self.last_error = repr(e)
+                logger.exception("%s run failed", self.name)
+
+            self._stop.wait(self.interval_seconds)
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "enabled": self.enabled,
+            "interval_seconds": self.interval_seconds,
+            "running": self._run_lock.locked(),
+            "runs": self.runs,
+            "last_run": self.last_run,
+            "last_error": self.last_error,
+        }
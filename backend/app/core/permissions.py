@@ -1,20 +1,53 @@
 from fastapi import Depends, HTTPException, status
+from sqlmodel import Session
 from typing import List
-from app.models.user import User
-from app.core.dependencies import get_current_user
+from app.core.database import get_read_session
+from app.core.dependencies import TokenClaims, get_token_claims, load_user
+
+
+def forbidden():
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="You don't have permission to access this resource",
+    )
 
 
 # ======================================================
 # ROLE GUARD
+# Rejects on the token's role claim first, then loads
+# the full User (through the cache) and checks again.
 # ======================================================
 
 def require_roles(allowed_roles: List[str]):
-    def role_checker(current_user: User = Depends(get_current_user)):
+    def role_checker(
+        claims: TokenClaims = Depends(get_token_claims),
+        session: Session = Depends(get_read_session),
+    ):
+        if claims.role not in allowed_roles:
+            raise forbidden()
+
+        current_user = load_user(session, claims.user_id)
         if current_user.role not in allowed_roles:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You don't have permission to access this resource",
-            )
+            raise forbidden()
         return current_user
 
     return role_checker
+
+
+# ======================================================
+# ROLE GUARD — CLAIMS ONLY (FAST PATH)
+# Authorizes from the token's "role" claim and never
+# loads the user. Use on routes that only need the
+# caller's id and role.
+#
+# NOTE: a role change applies to these routes once the
+# user's current access token expires.
+# ======================================================
+
+def require_role_claims(allowed_roles: List[str]):
+    async def claims_checker(claims: TokenClaims = Depends(get_token_claims)):
+        if claims.role not in allowed_roles:
+            raise forbidden()
+        return claims
+
+    return claims_checker
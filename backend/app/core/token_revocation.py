@@ -0,0 +1,61 @@
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, delete
+
+from app.core.security import REFRESH_TOKEN_EXPIRE_DAYS
+from app.models.revoked_token import RevokedToken
+
+
+# Run the expiry sweep at most this often
+SWEEP_INTERVAL_SECONDS = 3600
+
+_last_sweep = 0.0
+
+
+# ======================================================
+# CONSUME A REFRESH TOKEN (ONE-TIME USE)
+# The primary key makes this atomic: when two requests
+# present the same token, only one insert succeeds.
+# ======================================================
+
+def consume_refresh_token(session: Session, jti: str, expires_at: datetime) -> bool:
+    session.add(RevokedToken(jti=jti, expires_at=expires_at))
+    try:
+        session.commit()
+        return True
+    except IntegrityError:
+        session.rollback()
+        return False
+
+
+def is_family_revoked(session: Session, family_id: str) -> bool:
+    return session.get(RevokedToken, family_id) is not None
+
+
+def revoke_family(session: Session, family_id: str):
+    # Newest token of the family expires at most this late
+    expires_at = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+
+    if not is_family_revoked(session, family_id):
+        consume_refresh_token(session, family_id, expires_at)
+
+
+# ======================================================
+# EXPIRY SWEEP
+# ======================================================
+
+def sweep_expired_tokens(session: Session, force: bool = False) -> int:
+    global _last_sweep
+
+    now = time.monotonic()
+    if not force and now - _last_sweep < SWEEP_INTERVAL_SECONDS:
+        return 0
+    _last_sweep = now
+
+    result = session.exec(
+        delete(RevokedToken).where(RevokedToken.expires_at < datetime.utcnow())
+    )
+    session.commit()
+    return result.rowcount
@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Index
+from sqlmodel import SQLModel, Field
+
+
+# ======================================================
+# AUDIT EVENT
+# Who did what: one row per check-in and checkout, with
+# the acting user. Written in batches by the audit writer
+# (app/services/audit.py), never by the routes directly.
+# ======================================================
+
+class AuditEvent(SQLModel, table=True):
+    __tablename__ = "audit_event"
+
+    __table_args__ = (
+        # "What did this user do" / "what happened to this unit"
+        Index("ix_audit_event_actor_time", "actor_id", "occurred_at"),
+        Index("ix_audit_event_unit_time", "unit_id", "occurred_at"),
+        Index("ix_audit_event_time", "occurred_at"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    # When the action was committed (not when it was written here)
+    occurred_at: datetime
+
+    actor_id: int
+    actor_role: str
+
+    # check_in | checkout
+    action: str
+
+    unit_id: Optional[int] = None
+    stay_id: Optional[int] = None
+
+    # Extra context, e.g. "bulk"
+    detail: Optional[str] = None
@@ -0,0 +1,48 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Index
+from sqlmodel import SQLModel, Field
+
+
+# ======================================================
+# CHANGE LOG
+# One row per unit or stay written, appended in the same
+# transaction as the write (app/services/change_log.py).
+# The row id is the sync cursor handed to clients.
+# ======================================================
+
+class ChangeLog(SQLModel, table=True):
+    __tablename__ = "change_log"
+
+    __table_args__ = (
+        # Compaction: newest entry per entity
+        Index("ix_change_log_entity", "entity", "entity_id", "id"),
+        # Ids never reused, even after old entries are removed
+        {"sqlite_autoincrement": True},
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    # "unit" | "stay"
+    entity: str
+    entity_id: int
+
+    changed_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+# ======================================================
+# CHANGE LOG COMPACTION
+# One row per compaction that removed old entries. A
+# cursor below compacted_through may have missed changes,
+# so such clients get a full snapshot instead.
+# ======================================================
+
+class ChangeLogCompaction(SQLModel, table=True):
+    __tablename__ = "change_log_compaction"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    compacted_through: int = Field(index=True)
+
+    compacted_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,48 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Index, text
+from sqlmodel import SQLModel, Field
+
+
+# ======================================================
+# HOUSEKEEPING TASK
+# A unit to clean after a checkout. Created with the
+# checkout itself (app/services/housekeeping.py), then
+# claimed and finished by housekeeping staff.
+# ======================================================
+
+class HousekeepingTask(SQLModel, table=True):
+    __tablename__ = "housekeeping_task"
+
+    __table_args__ = (
+        # One open task per unit: a second checkout before
+        # the cleaning is done adds nothing
+        Index(
+            "ux_housekeeping_task_unit_open",
+            "unit_id",
+            unique=True,
+            sqlite_where=text("status != 'done'"),
+            postgresql_where=text("status != 'done'"),
+        ),
+        # Startup load of the queue
+        Index("ix_housekeeping_task_status", "status"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    unit_id: int
+
+    # The checkout that left the unit to clean
+    stay_id: int
+
+    # pending → waiting in the queue
+    # in_progress → claimed by assigned_to
+    # done → cleaned
+    status: str = "pending"
+
+    assigned_to: Optional[int] = None
+
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
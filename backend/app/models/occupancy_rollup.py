@@ -0,0 +1,61 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import UniqueConstraint
+from sqlmodel import SQLModel, Field
+
+
+# ======================================================
+# OCCUPANCY ROLLUP
+# Nights, arrivals, departures and tenant rent of
+# completed stays per (day, property, unit type, guest
+# source), plus the same totals per month. Written by
+# the rollup service (app/services/occupancy_rollup.py),
+# never by hand.
+#
+# Active stays are not stored here: their nights keep
+# growing, so reports add them live from the occupancy
+# index.
+# ======================================================
+
+class OccupancyRollup(SQLModel, table=True):
+    __tablename__ = "occupancy_rollup"
+
+    __table_args__ = (
+        # Upsert key, and the range scan for reports
+        UniqueConstraint(
+            "granularity",
+            "day",
+            "property_name",
+            "unit_type",
+            "guest_source",
+            name="ux_occupancy_rollup_key",
+        ),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    # day → totals of this day
+    # month → totals of the month starting on this day
+    granularity: str
+    day: date
+
+    property_name: str
+
+    # room | apartment
+    unit_type: str
+
+    # sukha | ayursiha
+    guest_source: str
+
+    # Unit nights occupied (one per unit per night)
+    occupied_nights: int = 0
+
+    # Stays checking in / out
+    arrivals: int = 0
+    departures: int = 0
+
+    # Tenant nights and the sum of their monthly rent, so
+    # average rent = rent_total / tenant_nights
+    tenant_nights: int = 0
+    rent_total: float = 0.0
@@ -0,0 +1,41 @@
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import Index, UniqueConstraint
+from sqlmodel import SQLModel, Field
+
+
+# ======================================================
+# RENT DUE MODEL
+# One row per rent installment of a monthly / yearly
+# tenant. Rows are written by the rent schedule engine
+# (app/services/rent_schedule.py) whenever a stay is
+# created or checked out, never by hand.
+# ======================================================
+
+class RentDue(SQLModel, table=True):
+    __tablename__ = "rent_due"
+
+    __table_args__ = (
+        UniqueConstraint("stay_id", "period", name="ux_rent_due_stay_period"),
+        # "due today / overdue / this week" → range scan
+        Index("ix_rent_due_status_date", "status", "due_date"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    stay_id: int
+    unit_id: int
+
+    # 1 = first month of the stay, 2 = second...
+    period: int
+
+    due_date: date
+    amount: float
+
+    # pending → not paid yet
+    # paid → collected
+    # cancelled → tenant left before this month
+    status: str = "pending"
+
+    paid_at: Optional[datetime] = None
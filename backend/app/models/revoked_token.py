@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from sqlmodel import SQLModel, Field
+
+
+# ======================================================
+# REVOKED TOKEN MODEL
+# One row per used refresh token id (jti), plus one row
+# per revoked token family (its family id is stored as
+# the jti). Rows are swept once the token would have
+# expired anyway, so the table stays small.
+# ======================================================
+
+class RevokedToken(SQLModel, table=True):
+    __tablename__ = "revoked_token"
+
+    jti: str = Field(primary_key=True)
+
+    expires_at: datetime = Field(index=True)
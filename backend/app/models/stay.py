@@ -1,6 +1,7 @@
 from typing import Optional
 from datetime import date, datetime, timedelta
 
+from sqlalchemy import Index, event, text
 from sqlmodel import SQLModel, Field
 
 
@@ -13,7 +14,12 @@ from sqlmodel import SQLModel, Field
 # - Yearly tenants
 # ======================================================
 
-class Stay(SQLModel, table=True):
+class StayBase(SQLModel):
+    """
+    The stay columns, shared by the stay table and its
+    archive (app/models/stay_archive.py).
+    """
+
     id: Optional[int] = Field(default=None, primary_key=True)
 
     # ======================================================
@@ -40,6 +46,10 @@ class Stay(SQLModel, table=True):
     # Used mainly for daily guests
     check_out_date: Optional[date] = None
 
+    # estimated_checkout() stored on every write, so
+    # departures can be found through an index
+    estimated_checkout_date: Optional[date] = None
+
     # ======================================================
     # TENANT DETAILS (Monthly / Yearly)
     # ======================================================
@@ -89,3 +99,46 @@ class Stay(SQLModel, table=True):
             return self.check_in_date + timedelta(days=30 * self.planned_months)
 
         return self.check_out_date
+
+
+class Stay(StayBase, table=True):
+    # ======================================================
+    # ONE ACTIVE STAY PER UNIT (enforced by the database)
+    # Partial unique index: only rows with status = 'active'
+    # take part, completed history is unrestricted.
+    # ======================================================
+    __table_args__ = (
+        Index(
+            "ux_stay_unit_active",
+            "unit_id",
+            unique=True,
+            sqlite_where=text("status = 'active'"),
+            postgresql_where=text("status = 'active'"),
+        ),
+        # Keyset pagination: newest first, (created_at, id) cursor
+        Index("ix_stay_status_created", "status", "created_at", "id"),
+        Index("ix_stay_created", "created_at", "id"),
+        # Departures / overdue: range scan on active stays
+        Index(
+            "ix_stay_status_estimated_checkout",
+            "status",
+            "estimated_checkout_date",
+        ),
+        # Arrivals of a day
+        Index("ix_stay_check_in", "check_in_date"),
+        # Ids never reused: archived stays keep theirs in
+        # stay_archive and the search index
+        {"sqlite_autoincrement": True},
+    )
+
+
+# ======================================================
+# KEEP estimated_checkout_date IN STEP
+# Recomputed on every insert and update, whatever the
+# route, so it can never disagree with the method.
+# ======================================================
+
+@event.listens_for(Stay, "before_insert")
+@event.listens_for(Stay, "before_update")
+def _store_estimated_checkout(mapper, connection, target):
+    target.estimated_checkout_date = target.estimated_checkout()
@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from sqlalchemy import Index
+from sqlmodel import Field
+
+from app.models.stay import StayBase
+
+
+# ======================================================
+# STAY ARCHIVE
+# Completed stays moved out of the stay table once they
+# are old enough (app/services/stay_archive.py), so the
+# active table and its indexes stay small. Same columns
+# and ids as the stay table; history, export and search
+# read both.
+# ======================================================
+
+class StayArchive(StayBase, table=True):
+    __tablename__ = "stay_archive"
+
+    __table_args__ = (
+        # Keyset pagination, as on the stay table
+        Index("ix_stay_archive_status_created", "status", "created_at", "id"),
+        Index("ix_stay_archive_created", "created_at", "id"),
+        Index("ix_stay_archive_check_in", "check_in_date"),
+    )
+
+    # When the stay was moved here
+    archived_at: datetime = Field(default_factory=datetime.utcnow)
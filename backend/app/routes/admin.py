@@ -0,0 +1,182 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlmodel import Session
+
+from app.core.database import get_session
+from app.core.dependencies import TokenClaims
+from app.core.password_pool import password_pool
+from app.core.permissions import require_role_claims
+from app.core.principal_cache import principal_cache
+
+from app.services.audit import audit_trail
+from app.services.availability import availability_index
+from app.services.board_cache import board_cache
+from app.services.board_stream import board_stream
+from app.services.change_log import change_log_compactor
+from app.services.housekeeping import housekeeping_queue
+from app.services.occupancy import occupancy_index
+from app.services.occupancy_rollup import rebuild_occupancy_rollup
+from app.services.rent_schedule import rebuild_rent_schedule
+from app.services.stay_archive import stay_archiver
+
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+# ======================================================
+# OCCUPANCY INDEX STATS
+# ======================================================
+@router.get("/occupancy-index")
+def get_occupancy_index_stats(
+    user: TokenClaims = Depends(require_role_claims(["admin"])),
+):
+    return occupancy_index.stats()
+
+
+# ======================================================
+# REBUILD OCCUPANCY INDEX FROM DATABASE
+# After writes that bypassed the ORM (imports, SQL fixes).
+# The availability index and housekeeping queue are kept
+# by the same hooks, so they are reloaded with it; the
+# queue last, its priorities read the occupancy index.
+# ======================================================
+@router.post("/occupancy-index/rebuild")
+def rebuild_occupancy_index(
+    session: Session = Depends(get_session),
+    user: TokenClaims = Depends(require_role_claims(["admin"])),
+):
+    occupancy_index.rebuild(session)
+    availability_index.rebuild(session)
+    housekeeping_queue.rebuild(session)
+    board_cache.bump()
+    board_stream.publish_reset()
+    return occupancy_index.stats()
+
+
+# ======================================================
+# PRINCIPAL CACHE STATS
+# ======================================================
+@router.get("/principal-cache")
+def get_principal_cache_stats(
+    user: TokenClaims = Depends(require_role_claims(["admin"])),
+):
+    return principal_cache.stats()
+
+
+# ======================================================
+# PASSWORD POOL STATS
+# ======================================================
+@router.get("/password-pool")
+def get_password_pool_stats(
+    user: TokenClaims = Depends(require_role_claims(["admin"])),
+):
+    return password_pool.stats()
+
+
+# ======================================================
+# ROOM BOARD CACHE STATS
+# ======================================================
+@router.get("/board-cache")
+def get_board_cache_stats(
+    user: TokenClaims = Depends(require_role_claims(["admin"])),
+):
+    return board_cache.stats()
+
+
+# ======================================================
+# LIVE BOARD STREAM STATS
+# ======================================================
+@router.get("/board-stream")
+def get_board_stream_stats(
+    user: TokenClaims = Depends(require_role_claims(["admin"])),
+):
+    return board_stream.stats()
+
+
+# ======================================================
+# RECOMPUTE RENT SCHEDULE (after imports / seeding)
+# ======================================================
+@router.post("/rent-schedule/rebuild")
+def rebuild_rent_schedule_route(
+    session: Session = Depends(get_session),
+    user: TokenClaims = Depends(require_role_claims(["admin"])),
+):
+    return rebuild_rent_schedule(session)
+
+
+# ======================================================
+# REBUILD OCCUPANCY ROLLUP FROM STAY HISTORY
+# ======================================================
+@router.post("/occupancy-rollup/rebuild")
+def rebuild_occupancy_rollup_route(
+    session: Session = Depends(get_session),
+    user: TokenClaims = Depends(require_role_claims(["admin"])),
+):
+    return rebuild_occupancy_rollup(session)
+
+
+# ======================================================
+# STAY ARCHIVE STATS / RUN A PASS NOW
+# ======================================================
+@router.get("/stay-archive")
+def get_stay_archive_stats(
+    user: TokenClaims = Depends(require_role_claims(["admin"])),
+):
+    return stay_archiver.stats()
+
+
+@router.post("/stay-archive/run")
+def run_stay_archive(
+    user: TokenClaims = Depends(require_role_claims(["admin"])),
+):
+    if not stay_archiver.enabled:
+        raise HTTPException(
+            status_code=409,
+            detail="Stay archive is off (SUKHA_STAY_ARCHIVE_AFTER_DAYS=0)",
+        )
+
+    result = stay_archiver.run_once()
+    if result is None:
+        raise HTTPException(status_code=409, detail="An archive run is already in progress")
+
+    return result
+
+
+# ======================================================
+# CHANGE LOG COMPACTION STATS / COMPACT NOW
+# ======================================================
+@router.get("/change-log")
+def get_change_log_stats(
+    user: TokenClaims = Depends(require_role_claims(["admin"])),
+):
+    return change_log_compactor.stats()
+
+
+@router.post("/change-log/compact")
+def compact_change_log_route(
+    user: TokenClaims = Depends(require_role_claims(["admin"])),
+):
+    result = change_log_compactor.run_once()
+    if result is None:
+        raise HTTPException(status_code=409, detail="A compaction is already in progress")
+
+    return result
+
+
+# ======================================================
+# AUDIT WRITER STATS
+# ======================================================
+@router.get("/audit-writer")
+def get_audit_writer_stats(
+    user: TokenClaims = Depends(require_role_claims(["admin"])),
+):
+    return audit_trail.stats()
+
+
+# ======================================================
+# HOUSEKEEPING QUEUE STATS
+# ======================================================
+@router.get("/housekeeping-queue")
+def get_housekeeping_queue_stats(
+    user: TokenClaims = Depends(require_role_claims(["admin"])),
+):
+    return housekeeping_queue.stats()
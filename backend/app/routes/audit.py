@@ -0,0 +1,96 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session, select, tuple_
+
+from app.core.database import get_read_session
+from app.core.dependencies import TokenClaims
+from app.core.permissions import require_role_claims
+
+from app.models.audit_event import AuditEvent
+from app.models.user import User
+from app.services.pagination import decode_cursor, encode_cursor
+
+
+router = APIRouter(prefix="/audit", tags=["Audit"])
+
+AUDIT_ROLES = [
+    "admin",
+    "hotel_owner",
+    "apartment_owner",
+]
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+# ======================================================
+# GET /audit/events → WHO DID WHAT
+# Newest first, keyset pagination like GET /stays. One
+# index range scan: (actor_id, occurred_at) for ?actor_id=,
+# (unit_id, occurred_at) for ?unit_id=, else occurred_at.
+# Events show up once the audit writer has flushed them
+# (within SUKHA_AUDIT_FLUSH_MS).
+# ======================================================
+@router.get("/events")
+def get_audit_events(
+    actor_id: Optional[int] = None,
+    unit_id: Optional[int] = None,
+    action: Optional[str] = Query(None, pattern="^(check_in|checkout)$"),
+    from_time: Optional[datetime] = Query(None, alias="from"),
+    to_time: Optional[datetime] = Query(None, alias="to"),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    session: Session = Depends(get_read_session),
+    user: TokenClaims = Depends(require_role_claims(AUDIT_ROLES)),
+):
+
+    statement = select(AuditEvent, User.username).outerjoin(
+        User, User.id == AuditEvent.actor_id
+    )
+
+    if actor_id is not None:
+        statement = statement.where(AuditEvent.actor_id == actor_id)
+    if unit_id is not None:
+        statement = statement.where(AuditEvent.unit_id == unit_id)
+    if action:
+        statement = statement.where(AuditEvent.action == action)
+    if from_time:
+        statement = statement.where(AuditEvent.occurred_at >= from_time)
+    if to_time:
+        statement = statement.where(AuditEvent.occurred_at < to_time)
+
+    after = decode_cursor(cursor)
+    if after:
+        statement = statement.where(tuple_(AuditEvent.occurred_at, AuditEvent.id) < after)
+
+    # One extra row tells us whether there is a next page
+    statement = statement.order_by(AuditEvent.occurred_at.desc(), AuditEvent.id.desc())
+    rows = session.exec(statement.limit(limit + 1)).all()
+
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        last_event = items[-1][0]
+        next_cursor = encode_cursor(last_event.occurred_at, last_event.id)
+
+    return {
+        "items": [build_audit_row(*row) for row in items],
+        "next_cursor": next_cursor,
+        "limit": limit,
+    }
+
+
+def build_audit_row(event: AuditEvent, username: Optional[str]):
+    return {
+        "id": event.id,
+        "occurred_at": event.occurred_at,
+        "actor_id": event.actor_id,
+        "actor_username": username,
+        "actor_role": event.actor_role,
+        "action": event.action,
+        "unit_id": event.unit_id,
+        "stay_id": event.stay_id,
+        "detail": event.detail,
+    }
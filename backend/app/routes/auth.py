@@ -1,16 +1,31 @@
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlmodel import Session, select
-
-from app.core.database import get_session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.database import get_read_session, get_session
+from app.core.dependencies import get_current_user, load_user
+from app.core.password_pool import (
+    password_pool,
+    PasswordPoolBusy,
+    PasswordThrottled,
+)
 from app.core.security import (
-    verify_password,
     create_access_token,
+    create_refresh_token,
+    decode_token,
     ACCESS_TOKEN_EXPIRE_MINUTES,
 )
+from app.core.token_revocation import (
+    consume_refresh_token,
+    is_family_revoked,
+    revoke_family,
+    sweep_expired_tokens,
+)
 from app.models.user import User
-from app.schemas.auth import TokenResponse
-from app.core.dependencies import get_current_user
+from app.schemas.auth import RefreshRequest, TokenResponse
 from app.core.permissions import require_roles
 
 
@@ -25,19 +40,42 @@ def build_welcome_message(user: User) -> str:
     return f"Welcome {user.full_name} 👋"
 
 
+# ======================================================
+# FIND USER BY USERNAME
+# ======================================================
+
+def find_user_statement(username: str):
+    return select(User).where(User.username == username)
+
+
+def find_user_by_username(session: Session, username: str):
+    return session.exec(find_user_statement(username)).first()
+
+
 # ======================================================
 # LOGIN (OAuth2 Swagger Compatible)
+# Async so Argon2 runs in the password pool, not in a
+# threadpool slot shared with every other request.
 # ======================================================
 
 @router.post("/login", response_model=TokenResponse)
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_read_session),
 ):
     # Find user
-    statement = select(User).where(User.username == form_data.username)
-    user = session.exec(statement).first()
+    user = await run_in_threadpool(find_user_by_username, session, form_data.username)
 
+    await check_credentials(user, form_data)
+
+    return build_token_response(user)
+
+
+# ======================================================
+# PASSWORD CHECK (shared by sync and async login)
+# ======================================================
+
+async def check_credentials(user: User | None, form_data: OAuth2PasswordRequestForm):
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -45,30 +83,103 @@ def login(
         )
 
     # Verify password
-    if not verify_password(form_data.password, user.hashed_password):
+    try:
+        password_ok = await password_pool.verify(
+            form_data.username, form_data.password, user.hashed_password
+        )
+    except PasswordThrottled:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Login already in progress for this user",
+            headers={"Retry-After": "1"},
+        )
+    except PasswordPoolBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many logins at once, please retry",
+            headers={"Retry-After": "1"},
+        )
+
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username or password",
         )
 
-    # Create JWT token
+
+# ======================================================
+# TOKEN PAIR (ACCESS + REFRESH)
+# ======================================================
+
+def build_token_response(user: User, family_id: str | None = None) -> TokenResponse:
     access_token = create_access_token(
         {"sub": str(user.id), "role": user.role}
     )
+    refresh_token = create_refresh_token({"sub": str(user.id)}, family_id)
 
     return TokenResponse(
         access_token=access_token,
-        refresh_token="",
+        refresh_token=refresh_token,
         expires_in=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
     )
 
 
+# ======================================================
+# REFRESH (ROTATING REFRESH TOKENS)
+# Each refresh token works once. Presenting a used one
+# again means it was stolen or replayed, so the whole
+# token family is revoked and the user must log in.
+# ======================================================
+
+def invalid_refresh_token(detail: str = "Invalid refresh token"):
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+    )
+
+
+@router.post("/refresh", response_model=TokenResponse)
+def refresh(
+    body: RefreshRequest,
+    session: Session = Depends(get_session),
+):
+    try:
+        payload = decode_token(body.refresh_token)
+        user_id = int(payload["sub"])
+        jti = payload["jti"]
+        family_id = payload["fam"]
+        expires_at = datetime.utcfromtimestamp(payload["exp"])
+    except Exception:
+        raise invalid_refresh_token()
+
+    if payload.get("type") != "refresh":
+        raise invalid_refresh_token()
+
+    if is_family_revoked(session, family_id):
+        raise invalid_refresh_token("Refresh token revoked")
+
+    if not consume_refresh_token(session, jti, expires_at):
+        revoke_family(session, family_id)
+        raise invalid_refresh_token("Refresh token reuse detected")
+
+    sweep_expired_tokens(session)
+
+    # Role may have changed since login: new token gets the current one
+    user = load_user(session, user_id)
+
+    return build_token_response(user, family_id)
+
+
 # ======================================================
 # CURRENT USER PROFILE + WELCOME MESSAGE
 # ======================================================
 
 @router.get("/me")
 def get_me(current_user: User = Depends(get_current_user)):
+    return build_profile(current_user)
+
+
+def build_profile(current_user: User):
     welcome_message = build_welcome_message(current_user)
 
     return {
@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends
+from fastapi.security import OAuth2PasswordRequestForm
+
+from app.core.database import get_async_read_session
+from app.core.dependencies import get_current_user_async
+from app.models.user import User
+from app.routes.auth import (
+    build_profile,
+    build_token_response,
+    check_credentials,
+    find_user_statement,
+)
+from app.schemas.auth import TokenResponse
+
+
+# ======================================================
+# ASYNC AUTH ROUTES (SUKHA_ASYNC_ROUTES=1)
+# Login and profile only; /auth/refresh and the test
+# endpoints keep their sync handlers.
+# ======================================================
+
+router = APIRouter(prefix="/auth", tags=["Authentication"])
+
+
+@router.post("/login", response_model=TokenResponse)
+async def login(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    session=Depends(get_async_read_session),
+):
+    user = (await session.exec(find_user_statement(form_data.username))).first()
+
+    await check_credentials(user, form_data)
+
+    return build_token_response(user)
+
+
+@router.get("/me")
+async def get_me(current_user: User = Depends(get_current_user_async)):
+    return build_profile(current_user)
@@ -0,0 +1,128 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import update
+from sqlmodel import Session
+
+from app.core.database import get_session
+from app.core.dependencies import TokenClaims
+from app.core.permissions import require_role_claims
+
+from app.models.housekeeping_task import HousekeepingTask
+from app.services.housekeeping import QueuedTask, housekeeping_queue
+
+
+router = APIRouter(prefix="/housekeeping", tags=["Housekeeping"])
+
+HOUSEKEEPING_ROLES = [
+    "admin",
+    "supervisor",
+    "housekeeping",
+]
+
+DEFAULT_QUEUE_SIZE = 20
+MAX_QUEUE_SIZE = 200
+
+
+# ======================================================
+# GET /housekeeping/queue → WHAT TO CLEAN NEXT
+# "next" is what POST /housekeeping/tasks/next would hand
+# the caller (their current floor first, see
+# app/services/housekeeping.py); "tasks" is everything
+# pending, most urgent first. Served from memory.
+# ======================================================
+@router.get("/queue")
+def get_queue(
+    limit: int = Query(DEFAULT_QUEUE_SIZE, ge=1, le=MAX_QUEUE_SIZE),
+    user: TokenClaims = Depends(require_role_claims(HOUSEKEEPING_ROLES)),
+):
+
+    next_task = housekeeping_queue.peek(user.user_id)
+
+    return {
+        "next": build_queue_row(next_task) if next_task else None,
+        "pending": housekeeping_queue.stats()["pending"],
+        "tasks": [build_queue_row(task) for task in housekeeping_queue.pending(limit)],
+    }
+
+
+# ======================================================
+# POST /housekeeping/tasks/next → CLAIM NEXT TASK
+# ======================================================
+@router.post("/tasks/next")
+def claim_next_task(
+    session: Session = Depends(get_session),
+    user: TokenClaims = Depends(require_role_claims(HOUSEKEEPING_ROLES)),
+):
+
+    while True:
+        task = housekeeping_queue.claim(user.user_id)
+        if task is None:
+            raise HTTPException(status_code=404, detail="Nothing to clean")
+
+        # Only if still pending: finished or claimed
+        # meanwhile → next one
+        claimed = session.connection().execute(
+            update(HousekeepingTask.__table__)
+            .where(
+                HousekeepingTask.id == task.task_id,
+                HousekeepingTask.status == "pending",
+            )
+            .values(
+                status="in_progress",
+                assigned_to=user.user_id,
+                started_at=datetime.utcnow(),
+            )
+        ).rowcount
+        session.commit()
+
+        if claimed:
+            return build_queue_row(task, status="in_progress")
+
+
+# ======================================================
+# PATCH /housekeeping/tasks/{task_id}/done → CLEANED
+# Also for tasks nobody claimed (cleaned on the spot).
+# ======================================================
+@router.patch("/tasks/{task_id}/done")
+def complete_task(
+    task_id: int,
+    session: Session = Depends(get_session),
+    user: TokenClaims = Depends(require_role_claims(HOUSEKEEPING_ROLES)),
+):
+
+    task = session.get(HousekeepingTask, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    if task.status == "done":
+        raise HTTPException(status_code=400, detail="Task already done")
+
+    if task.assigned_to is None:
+        task.assigned_to = user.user_id
+    task.status = "done"
+    task.completed_at = datetime.utcnow()
+
+    session.add(task)
+    session.commit()
+    session.refresh(task)
+
+    housekeeping_queue.remove(task.id)
+
+    return task
+
+
+def build_queue_row(task: QueuedTask, status: str = "pending") -> dict:
+    property_name, building_name, floor_number = task.floor
+
+    return {
+        "task_id": task.task_id,
+        "unit_id": task.unit_id,
+        "unit_number": task.unit_number,
+        "property_name": property_name,
+        "building_name": building_name or None,
+        "floor_number": floor_number,
+        "next_arrival": task.next_arrival,
+        "status": status,
+        "created_at": task.created_at,
+    }
@@ -0,0 +1,52 @@
+import secrets
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import PlainTextResponse
+
+from app.core.config import METRICS_TOKEN
+from app.core.dependencies import get_token_claims
+from app.core.metrics import request_metrics
+from app.core.permissions import forbidden
+
+
+router = APIRouter(tags=["Monitoring"])
+
+METRICS_ROLES = ["admin"]
+
+
+# ======================================================
+# METRICS ACCESS
+# Route names, traffic and error rates are not public:
+# an admin access token, or SUKHA_METRICS_TOKEN for a
+# scraper that cannot log in.
+# ======================================================
+async def require_metrics_access(request: Request):
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    if METRICS_TOKEN and secrets.compare_digest(token.encode(), METRICS_TOKEN.encode()):
+        return
+
+    claims = await get_token_claims(token)
+    if claims.role not in METRICS_ROLES:
+        raise forbidden()
+
+
+# ======================================================
+# GET /metrics → PROMETHEUS TEXT FORMAT
+# ======================================================
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    dependencies=[Depends(require_metrics_access)],
+)
+def get_metrics():
+    return PlainTextResponse(
+        request_metrics.render(),
+        media_type="text/plain; version=0.0.4",
+    )
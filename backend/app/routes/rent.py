@@ -0,0 +1,147 @@
+from datetime import date, datetime, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from app.core.database import get_read_session, get_session
+from app.core.dependencies import TokenClaims
+from app.core.permissions import require_role_claims
+
+from app.models.rent_due import RentDue
+from app.models.stay import Stay
+from app.models.stay_archive import StayArchive
+from app.models.unit import Unit
+
+
+router = APIRouter(prefix="/rent", tags=["Rent"])
+
+RENT_ROLES = [
+    "admin",
+    "hotel_owner",
+    "apartment_owner",
+    "reception",
+]
+
+MAX_RENT_ROWS = 1000
+
+
+# ======================================================
+# GET /rent/due?window=today|overdue|week
+# Pending installments only, one range scan on
+# (status, due_date).
+# ======================================================
+@router.get("/due")
+def get_rent_due(
+    window: str = Query("today", pattern="^(today|overdue|week)$"),
+    limit: int = Query(200, ge=1, le=MAX_RENT_ROWS),
+    session: Session = Depends(get_read_session),
+    user: TokenClaims = Depends(require_role_claims(RENT_ROLES)),
+):
+
+    today = date.today()
+    statement = rent_due_statement().where(RentDue.status == "pending")
+
+    if window == "today":
+        statement = statement.where(RentDue.due_date == today)
+    elif window == "overdue":
+        statement = statement.where(RentDue.due_date < today)
+    else:
+        statement = statement.where(
+            RentDue.due_date >= today,
+            RentDue.due_date < today + timedelta(days=7),
+        )
+
+    rows = session.exec(statement.limit(limit)).all()
+
+    return {
+        "window": window,
+        "date": today,
+        "count": len(rows),
+        "total_amount": sum(row[0].amount for row in rows),
+        "installments": [build_rent_row(*row, today) for row in rows],
+    }
+
+
+# ======================================================
+# GET /rent/stays/{stay_id} → FULL SCHEDULE OF ONE TENANT
+# ======================================================
+@router.get("/stays/{stay_id}")
+def get_stay_rent_schedule(
+    stay_id: int,
+    session: Session = Depends(get_read_session),
+    user: TokenClaims = Depends(require_role_claims(RENT_ROLES)),
+):
+
+    rows = session.exec(
+        rent_due_statement().where(RentDue.stay_id == stay_id)
+    ).all()
+
+    today = date.today()
+    return [build_rent_row(*row, today) for row in rows]
+
+
+# ======================================================
+# PATCH /rent/{rent_id}/pay → MARK INSTALLMENT PAID
+# ======================================================
+@router.patch("/{rent_id}/pay")
+def mark_rent_paid(
+    rent_id: int,
+    session: Session = Depends(get_session),
+    user: TokenClaims = Depends(require_role_claims(RENT_ROLES)),
+):
+
+    rent = session.get(RentDue, rent_id)
+    if not rent:
+        raise HTTPException(status_code=404, detail="Installment not found")
+
+    if rent.status != "pending":
+        raise HTTPException(
+            status_code=409,
+            detail=f"Installment is already {rent.status}",
+        )
+
+    rent.status = "paid"
+    rent.paid_at = datetime.utcnow()
+
+    session.add(rent)
+    session.commit()
+
+    return {"message": "Rent marked as paid", "paid_at": rent.paid_at}
+
+
+# ======================================================
+# HELPERS
+# ======================================================
+def rent_due_statement():
+    # Settled schedules of archived stays keep their guest
+    # name from the archive (pending rent is never archived)
+    return (
+        select(
+            RentDue,
+            func.coalesce(Stay.guest_name, StayArchive.guest_name),
+            Unit.unit_number,
+        )
+        .outerjoin(Stay, Stay.id == RentDue.stay_id)
+        .outerjoin(StayArchive, StayArchive.id == RentDue.stay_id)
+        .join(Unit, Unit.id == RentDue.unit_id)
+        .order_by(RentDue.due_date, RentDue.id)
+    )
+
+
+def build_rent_row(rent: RentDue, guest_name: str, unit_number: str, today: date):
+    return {
+        "id": rent.id,
+        "stay_id": rent.stay_id,
+        "unit_id": rent.unit_id,
+        "unit_number": unit_number,
+        "guest_name": guest_name,
+        "period": rent.period,
+        "due_date": rent.due_date,
+        "amount": rent.amount,
+        "status": rent.status,
+        "paid_at": rent.paid_at,
+        "days_overdue": max((today - rent.due_date).days, 0)
+        if rent.status == "pending"
+        else 0,
+    }
@@ -0,0 +1,331 @@
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import String, and_, cast, func, or_
+from sqlmodel import Session, select
+
+from app.core.database import get_read_session
+from app.core.dependencies import TokenClaims
+from app.core.permissions import require_role_claims
+
+from app.models.occupancy_rollup import OccupancyRollup
+from app.models.unit import Unit
+from app.services.availability import stay_interval
+from app.services.occupancy import occupancy_index
+from app.services.occupancy_rollup import tenant_rent
+
+
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+REPORT_ROLES = [
+    "admin",
+    "hotel_owner",
+    "apartment_owner",
+]
+
+# "2026-03-14" → day, "2026-03" → month
+LABEL_LENGTH = {"day": 10, "month": 7}
+
+MAX_REPORT_DAYS = {"day": 366, "month": 3660}
+
+
+# ======================================================
+# GET /reports/occupancy?from=&to=&granularity=day|month
+# Nights from "from" up to (not including) "to", per
+# property and period. Completed stays come from the
+# rollup (whole months from the monthly rows, partial
+# ones from the daily rows), active stays are added live
+# from the occupancy index (at most one per unit).
+# ======================================================
+@router.get("/occupancy")
+def get_occupancy_report(
+    from_date: date = Query(alias="from"),
+    to_date: date = Query(alias="to"),
+    granularity: str = Query("month", pattern="^(day|month)$"),
+    property_name: Optional[str] = None,
+    unit_type: Optional[str] = None,
+    session: Session = Depends(get_read_session),
+    user: TokenClaims = Depends(require_role_claims(REPORT_ROLES)),
+):
+
+    validate_report_range(from_date, to_date, granularity)
+
+    units = session.exec(
+        report_units_statement(property_name, unit_type)
+    ).all()
+
+    rollup = session.exec(
+        rollup_statement(from_date, to_date, granularity, property_name, unit_type)
+    ).all()
+
+    periods = ReportPeriods(from_date, to_date, granularity)
+    report = OccupancyReport(periods)
+
+    for unit in units:
+        report.add_unit(unit.property_name)
+
+    for period, property_, source, *values in rollup:
+        report.add_values(period, property_, source, values)
+
+    add_active_stays(report, {unit.id: unit.property_name for unit in units})
+
+    return {
+        "from": from_date,
+        "to": to_date,
+        "granularity": granularity,
+        "periods": report.build(),
+    }
+
+
+def validate_report_range(from_date: date, to_date: date, granularity: str):
+    if to_date <= from_date:
+        raise HTTPException(
+            status_code=400,
+            detail="'to' must be after 'from'",
+        )
+
+    max_days = MAX_REPORT_DAYS[granularity]
+    if (to_date - from_date).days > max_days:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range cannot exceed {max_days} days for {granularity} reports",
+        )
+
+
+def report_units_statement(property_name: Optional[str], unit_type: Optional[str]):
+    statement = select(Unit.id, Unit.property_name)
+    if property_name:
+        statement = statement.where(Unit.property_name == property_name)
+    if unit_type:
+        statement = statement.where(Unit.unit_type == unit_type)
+    return statement
+
+
+def rollup_statement(
+    from_date: date,
+    to_date: date,
+    granularity: str,
+    property_name: Optional[str],
+    unit_type: Optional[str],
+):
+    label = func.substr(cast(OccupancyRollup.day, String), 1, LABEL_LENGTH[granularity])
+
+    statement = (
+        select(
+            label,
+            OccupancyRollup.property_name,
+            OccupancyRollup.guest_source,
+            func.sum(OccupancyRollup.occupied_nights),
+            func.sum(OccupancyRollup.arrivals),
+            func.sum(OccupancyRollup.departures),
+            func.sum(OccupancyRollup.tenant_nights),
+            func.sum(OccupancyRollup.rent_total),
+        )
+        .where(rollup_range(from_date, to_date, granularity))
+        .group_by(label, OccupancyRollup.property_name, OccupancyRollup.guest_source)
+    )
+
+    if property_name:
+        statement = statement.where(OccupancyRollup.property_name == property_name)
+    if unit_type:
+        statement = statement.where(OccupancyRollup.unit_type == unit_type)
+
+    return statement
+
+
+def rollup_range(from_date: date, to_date: date, granularity: str):
+    """
+    Rows covering [from_date, to_date): monthly rows for
+    the whole months inside, daily rows for the rest.
+    """
+    def daily(start: date, end: date):
+        return and_(
+            OccupancyRollup.granularity == "day",
+            OccupancyRollup.day >= start,
+            OccupancyRollup.day < end,
+        )
+
+    if granularity == "day":
+        return daily(from_date, to_date)
+
+    first_month = from_date.replace(day=1)
+    if first_month < from_date:
+        first_month = next_month(first_month)
+    end_month = to_date.replace(day=1)
+
+    if first_month >= end_month:
+        return daily(from_date, to_date)
+
+    return or_(
+        daily(from_date, first_month),
+        and_(
+            OccupancyRollup.granularity == "month",
+            OccupancyRollup.day >= first_month,
+            OccupancyRollup.day < end_month,
+        ),
+        daily(end_month, to_date),
+    )
+
+
+def next_month(day: date) -> date:
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def add_active_stays(report: "OccupancyReport", unit_groups: dict):
+    """
+    Nights of active stays inside the report range. Like
+    availability, an active stay holds its unit until its
+    planned checkout, and at least through tonight.
+
+    One +1 / -1 pair per stay per (property, source), then
+    a sweep over the change points only.
+    """
+    periods = report.periods
+    first = periods.from_date.toordinal()
+    tonight = date.today().toordinal() + 1
+
+    # (property, source) → {day: [nights, tenant nights, rent]}
+    diffs = defaultdict(lambda: defaultdict(lambda: [0, 0, 0.0]))
+
+    for unit_id, stay in occupancy_index.snapshot().items():
+        property_ = unit_groups.get(unit_id)
+        if property_ is None:
+            continue
+
+        start, end, _ = stay_interval(stay)
+        start = max(start - first, 0)
+        end = min(max(end, tonight) - first, periods.days)
+        if start >= end:
+            continue
+
+        rent = tenant_rent(stay)
+        points = diffs[(property_, stay.guest_source)]
+        for day, sign in ((start, 1), (end, -1)):
+            change = points[day]
+            change[0] += sign
+            if rent:
+                change[1] += sign
+                change[2] += sign * rent
+
+    for (property_, source), points in diffs.items():
+        days = sorted(points)
+        running = [0, 0, 0.0]
+
+        for i, day in enumerate(days[:-1]):
+            for j, change in enumerate(points[day]):
+                running[j] += change
+
+            if not running[0]:
+                continue
+
+            nights, tenant_nights, rent = running
+            for label, count in periods.split(day, days[i + 1]):
+                report.add_values(
+                    label,
+                    property_,
+                    source,
+                    (nights * count, 0, 0, tenant_nights * count, rent * count),
+                )
+
+
+# ======================================================
+# REPORT ASSEMBLY
+# ======================================================
+
+class ReportPeriods:
+    """
+    The report range cut into labelled periods; days are
+    offsets from from_date.
+    """
+
+    def __init__(self, from_date: date, to_date: date, granularity: str):
+        self.from_date = from_date
+        self.days = (to_date - from_date).days
+
+        length = LABEL_LENGTH[granularity]
+
+        # First day offset of each period, and its label
+        self.starts: list[int] = []
+        self.labels: list[str] = []
+
+        for day in range(self.days):
+            label = (from_date + timedelta(days=day)).isoformat()[:length]
+            if not self.labels or self.labels[-1] != label:
+                self.starts.append(day)
+                self.labels.append(label)
+
+    def nights(self) -> list[tuple[str, int]]:
+        ends = self.starts[1:] + [self.days]
+        return [
+            (label, end - start)
+            for label, start, end in zip(self.labels, self.starts, ends)
+        ]
+
+    def split(self, start: int, end: int):
+        """
+        Yield (label, days) for the periods [start, end) touches.
+        """
+        i = bisect_right(self.starts, start) - 1
+
+        while start < end:
+            period_end = self.starts[i + 1] if i + 1 < len(self.starts) else self.days
+            stop = min(end, period_end)
+            yield self.labels[i], stop - start
+            start = stop
+            i += 1
+
+
+class OccupancyReport:
+    def __init__(self, periods: ReportPeriods):
+        self.periods = periods
+
+        # property → unit count
+        self.units: dict[str, int] = defaultdict(int)
+
+        # (period, property) → [nights, arrivals, departures, tenant nights, rent total]
+        self.values: dict[tuple, list] = defaultdict(lambda: [0, 0, 0, 0, 0.0])
+
+        # (period, property) → {source: nights}
+        self.sources: dict[tuple, dict] = defaultdict(lambda: defaultdict(int))
+
+    def add_unit(self, property_name: str):
+        self.units[property_name] += 1
+
+    def add_values(self, period: str, property_name: str, source: str, values):
+        key = (period, property_name)
+        current = self.values[key]
+        for i, value in enumerate(values):
+            current[i] += value or 0
+
+        self.sources[key][source] += values[0] or 0
+
+    def build(self) -> list[dict]:
+        rows = []
+
+        for period, period_nights in self.periods.nights():
+            for property_name, units in sorted(self.units.items()):
+                key = (period, property_name)
+                nights, arrivals, departures, tenant_nights, rent_total = self.values.get(
+                    key, (0, 0, 0, 0, 0.0)
+                )
+                unit_nights = units * period_nights
+
+                rows.append({
+                    "period": period,
+                    "property_name": property_name,
+                    "units": units,
+                    "unit_nights": unit_nights,
+                    "occupied_nights": nights,
+                    "occupancy_rate": round(nights / unit_nights, 4) if unit_nights else 0.0,
+                    "arrivals": arrivals,
+                    "departures": departures,
+                    "average_rent": round(rent_total / tenant_nights, 2)
+                    if tenant_nights
+                    else None,
+                    "guest_sources": dict(self.sources.get(key, {})),
+                })
+
+        return rows
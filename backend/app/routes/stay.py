@@ -1,29 +1,68 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
 from datetime import date
+from typing import Optional
 
-from app.core.database import get_session
-from app.core.dependencies import get_current_user
-from app.core.permissions import require_roles
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, col, select, tuple_
+
+from app.core.database import get_session, get_read_session
+from app.core.dependencies import TokenClaims, get_token_claims
+from app.core.permissions import require_role_claims
 
 from app.models.stay import Stay
 from app.models.unit import Unit
-from app.models.user import User
+from app.schemas.stay import (
+    BulkCheckoutRequest,
+    BulkItemResult,
+    BulkResponse,
+    StayFilters,
+)
+from app.services.departures import (
+    arrivals_statement,
+    build_front_desk_row,
+    departures_statement,
+    overdue_statement,
+)
+from app.services.export import EXPORT_FORMATS, stream_export
+from app.services.guest_search import search_stays
+from app.services.pagination import decode_cursor, encode_cursor
+from app.services.stay_archive import history_models
+from app.services.stay_events import stay_checked_in, stay_checked_out
 
 
 router = APIRouter(prefix="/stays", tags=["Stays"])
 
+CHECK_IN_ROLES = [
+    "admin",
+    "hotel_owner",
+    "apartment_owner",
+    "reception",
+    "supervisor",
+]
+
+CHECKOUT_ROLES = ["admin", "reception"]
+
+EXPORT_ROLES = ["admin", "hotel_owner", "apartment_owner"]
+
+# Morning lists also feed housekeeping
+FRONT_DESK_ROLES = CHECK_IN_ROLES + ["housekeeping"]
+
 
 # ======================================================
-# CHECK IF UNIT ALREADY OCCUPIED
+# PARSE REQUEST BODY
+# Table models skip validation when used as a body,
+# so dates would otherwise arrive as plain strings.
 # ======================================================
-def check_active_stay(session: Session, unit_id: int):
-    statement = (
-        select(Stay)
-        .where(Stay.unit_id == unit_id)
-        .where(Stay.status == "active")
-    )
-    return session.exec(statement).first()
+def parse_stay(stay: Stay) -> Stay:
+    try:
+        return Stay.model_validate(stay, from_attributes=True)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=422,
+            detail=e.errors(include_url=False, include_context=False),
+        )
 
 
 # ======================================================
@@ -33,31 +72,38 @@ def check_active_stay(session: Session, unit_id: int):
 def create_stay(
     stay: Stay,
     session: Session = Depends(get_session),
-    user: User = Depends(
-        require_roles(
-            [
-                "admin",
-                "hotel_owner",
-                "apartment_owner",
-                "reception",
-                "supervisor",
-            ]
-        )
-    ),
+    user: TokenClaims = Depends(require_role_claims(CHECK_IN_ROLES)),
 ):
 
+    stay = prepare_new_stay(stay)
+
     # Check unit exists
     unit = session.get(Unit, stay.unit_id)
     if not unit:
         raise HTTPException(status_code=404, detail="Unit not found")
 
-    # Prevent double occupancy
-    existing = check_active_stay(session, stay.unit_id)
-    if existing:
-        raise HTTPException(
-            status_code=400,
-            detail="This unit already has an active stay",
-        )
+    # Double occupancy is rejected by the ux_stay_unit_active
+    # unique index, which is safe for concurrent check-ins
+    session.add(stay)
+    try:
+        session.commit()
+    except IntegrityError as e:
+        session.rollback()
+        if not is_active_stay_conflict(e):
+            raise
+        raise unit_already_occupied()
+    session.refresh(stay)
+
+    stay_checked_in(stay, user)
+
+    return build_created_response(stay)
+
+
+# ======================================================
+# CHECK-IN RULES (shared by sync and async routes)
+# ======================================================
+def prepare_new_stay(stay: Stay) -> Stay:
+    stay = parse_stay(stay)
 
     # Auto logic for yearly tenant
     if stay.stay_type == "yearly" and not stay.planned_months:
@@ -77,10 +123,37 @@ def create_stay(
             detail="Monthly/Yearly stay requires planned_months",
         )
 
-    session.add(stay)
-    session.commit()
-    session.refresh(stay)
+    return stay
+
+
+def unit_already_occupied():
+    return HTTPException(
+        status_code=409,
+        detail="This unit already has an active stay",
+    )
+
+
+def stay_not_active():
+    return HTTPException(
+        status_code=409,
+        detail="Stay is not active",
+    )
+
 
+def is_active_stay_conflict(error: IntegrityError) -> bool:
+    """
+    Rejected by ux_stay_unit_active (one active stay per
+    unit). PostgreSQL names the index; SQLite only the
+    column, and it is the only unique index on unit_id.
+    """
+    message = str(error.orig)
+    return (
+        "ux_stay_unit_active" in message
+        or "UNIQUE constraint failed: stay.unit_id" in message
+    )
+
+
+def build_created_response(stay: Stay):
     return {
         "message": "Stay created successfully",
         "stay_id": stay.id,
@@ -89,18 +162,353 @@ def create_stay(
 
 
 # ======================================================
-# GET ALL ACTIVE STAYS
+# POST /stays/bulk → GROUP CHECK-IN
+# Whole group in one transaction: one query to validate
+# units, one to check occupancy, one commit. Invalid
+# items are reported per index, valid ones still go in.
 # ======================================================
+MAX_BULK_ITEMS = 200
+
+
+@router.post("/bulk", response_model=BulkResponse)
+def create_stays_bulk(
+    stays: list[Stay],
+    session: Session = Depends(get_session),
+    user: TokenClaims = Depends(require_role_claims(CHECK_IN_ROLES)),
+):
+
+    if len(stays) > MAX_BULK_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BULK_ITEMS} stays per request",
+        )
+
+    results: dict[int, BulkItemResult] = {}
+    pending: dict[int, Stay] = {}
+
+    for index, item in enumerate(stays):
+        try:
+            pending[index] = prepare_new_stay(item)
+        except HTTPException as e:
+            results[index] = BulkItemResult(
+                index=index, status_code=e.status_code, detail=e.detail
+            )
+
+    unit_ids = {stay.unit_id for stay in pending.values()}
+
+    existing_units = set(
+        session.exec(select(Unit.id).where(col(Unit.id).in_(unit_ids))).all()
+    )
+    occupied_units = set(
+        session.exec(
+            select(Stay.unit_id)
+            .where(col(Stay.unit_id).in_(unit_ids))
+            .where(Stay.status == "active")
+        ).all()
+    )
+
+    for index, stay in list(pending.items()):
+        if stay.unit_id not in existing_units:
+            detail, status_code = "Unit not found", 404
+        elif stay.unit_id in occupied_units:
+            detail, status_code = "This unit already has an active stay", 409
+        else:
+            # Also blocks the same unit twice in one group
+            occupied_units.add(stay.unit_id)
+            continue
+
+        del pending[index]
+        results[index] = BulkItemResult(
+            index=index, status_code=status_code, unit_id=stay.unit_id, detail=detail
+        )
+
+    # Keep values after commit: no refresh query per row
+    session.expire_on_commit = False
+
+    session.add_all(pending.values())
+    try:
+        session.commit()
+    except IntegrityError as e:
+        session.rollback()
+        if not is_active_stay_conflict(e):
+            raise
+
+        # Another check-in won a race for one of the units
+        for index, stay in pending.items():
+            results[index] = BulkItemResult(
+                index=index,
+                status_code=409,
+                unit_id=stay.unit_id,
+                detail="Concurrent check-in on one of the units, nothing saved, retry",
+            )
+        pending = {}
+
+    for index, stay in pending.items():
+        stay_checked_in(stay, user, detail="bulk")
+        results[index] = BulkItemResult(
+            index=index,
+            status_code=200,
+            stay_id=stay.id,
+            unit_id=stay.unit_id,
+            estimated_checkout=stay.estimated_checkout(),
+        )
+
+    return build_bulk_response(results)
+
+
+def build_bulk_response(results: dict[int, BulkItemResult]) -> BulkResponse:
+    ordered = [results[index] for index in sorted(results)]
+    succeeded = sum(1 for result in ordered if result.status_code == 200)
+
+    return BulkResponse(
+        succeeded=succeeded,
+        failed=len(ordered) - succeeded,
+        results=ordered,
+    )
+
+
+# ======================================================
+# LIST STAYS (KEYSET PAGINATION)
+# Newest first. The body stays a plain list of stays, as
+# it always was; when there is a next page its cursor
+# comes in the X-Next-Cursor header (and a Link rel=next
+# URL). Pass it back as ?cursor=. Cost stays flat however
+# deep you page, because each page is one index range
+# scan on (status, created_at, id).
+# ======================================================
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def get_stay_filters(
+    status: Optional[str] = Query(
+        "active", description='"active", "completed" or "all"'
+    ),
+    stay_type: Optional[str] = None,
+    guest_source: Optional[str] = None,
+    unit_id: Optional[int] = None,
+    check_in_from: Optional[date] = None,
+    check_in_to: Optional[date] = None,
+) -> StayFilters:
+    return StayFilters(
+        status=None if status == "all" else status,
+        stay_type=stay_type,
+        guest_source=guest_source,
+        unit_id=unit_id,
+        check_in_from=check_in_from,
+        check_in_to=check_in_to,
+    )
+
+
 @router.get("/")
 def get_all_stays(
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    response: Response,
+    filters: StayFilters = Depends(get_stay_filters),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    session: Session = Depends(get_read_session),
+    current_user: TokenClaims = Depends(get_token_claims),
+):
+
+    after = decode_cursor(cursor)
+
+    stays = []
+    for model in history_models(filters.status):
+        statement = stays_page_statement(filters, after, limit, model)
+        stays += session.exec(statement).all()
+
+    return build_stays_page(stays, limit, request, response)
+
+
+def filter_stays(statement, filters: StayFilters, model=Stay):
+    if filters.status:
+        statement = statement.where(model.status == filters.status)
+    if filters.stay_type:
+        statement = statement.where(model.stay_type == filters.stay_type)
+    if filters.guest_source:
+        statement = statement.where(model.guest_source == filters.guest_source)
+    if filters.unit_id is not None:
+        statement = statement.where(model.unit_id == filters.unit_id)
+    if filters.check_in_from:
+        statement = statement.where(model.check_in_date >= filters.check_in_from)
+    if filters.check_in_to:
+        statement = statement.where(model.check_in_date <= filters.check_in_to)
+    return statement
+
+
+def stays_page_statement(
+    filters: StayFilters, after: Optional[tuple], limit: int, model=Stay
+):
+    statement = filter_stays(select(model), filters, model)
+
+    if after:
+        statement = statement.where(tuple_(model.created_at, model.id) < after)
+
+    # One extra row tells us whether there is a next page
+    return statement.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+
+
+def build_stays_page(stays, limit: int, request: Request, response: Response):
+    # Pages of the stay table and the archive merged:
+    # each brought its own limit + 1 newest rows
+    stays = sorted(stays, key=lambda stay: (stay.created_at, stay.id), reverse=True)
+    items = stays[:limit]
+
+    if len(stays) > limit:
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+        next_url = request.url.include_query_params(cursor=next_cursor)
+        response.headers["X-Next-Cursor"] = next_cursor
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+
+    return items
+
+
+# ======================================================
+# FRONT DESK: DEPARTURES / OVERDUE / ARRIVALS
+# Each list is one index range scan, however many stays
+# the history holds.
+# ======================================================
+MAX_FRONT_DESK_ROWS = 1000
+
+
+@router.get("/departures")
+def get_departures(
+    day: Optional[date] = Query(None, alias="date"),
+    limit: int = Query(500, ge=1, le=MAX_FRONT_DESK_ROWS),
+    session: Session = Depends(get_read_session),
+    user: TokenClaims = Depends(require_role_claims(FRONT_DESK_ROLES)),
+):
+
+    today = date.today()
+    day = day or today
+
+    rows = session.exec(departures_statement(day).limit(limit)).all()
+    return build_front_desk_list(day, rows, today)
+
+
+@router.get("/overdue")
+def get_overdue_checkouts(
+    limit: int = Query(500, ge=1, le=MAX_FRONT_DESK_ROWS),
+    session: Session = Depends(get_read_session),
+    user: TokenClaims = Depends(require_role_claims(FRONT_DESK_ROLES)),
+):
+
+    today = date.today()
+
+    rows = session.exec(overdue_statement(today).limit(limit)).all()
+    return build_front_desk_list(today, rows, today)
+
+
+@router.get("/arrivals")
+def get_arrivals(
+    day: Optional[date] = Query(None, alias="date"),
+    limit: int = Query(500, ge=1, le=MAX_FRONT_DESK_ROWS),
+    session: Session = Depends(get_read_session),
+    user: TokenClaims = Depends(require_role_claims(FRONT_DESK_ROLES)),
 ):
 
-    statement = select(Stay).where(Stay.status == "active")
-    stays = session.exec(statement).all()
+    today = date.today()
+    day = day or today
 
-    return stays
+    rows = session.exec(arrivals_statement(day).limit(limit)).all()
+    return build_front_desk_list(day, rows, today)
+
+
+def build_front_desk_list(day: date, rows, today: date):
+    return {
+        "date": day,
+        "count": len(rows),
+        "stays": [build_front_desk_row(*row, today) for row in rows],
+    }
+
+
+# ======================================================
+# GUEST SEARCH → "did Mr. Nair stay with us last year?"
+# Matches over guest name, unit number and property from
+# the full-text index: best match first, newest first.
+# ======================================================
+MAX_SEARCH_RESULTS = 100
+
+
+@router.get("/search")
+def search_guests(
+    q: str = Query(min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=MAX_SEARCH_RESULTS),
+    session: Session = Depends(get_read_session),
+    user: TokenClaims = Depends(require_role_claims(CHECK_IN_ROLES)),
+):
+
+    mode, rows = search_stays(session, q, limit)
+
+    return {
+        "query": q,
+        "mode": mode,
+        "count": len(rows),
+        "matches": [build_search_match(*row) for row in rows],
+    }
+
+
+def build_search_match(stay: Stay, unit_number: str, property_name: str, match: str):
+    return {
+        "stay_id": stay.id,
+        "guest_name": stay.guest_name,
+        "guest_source": stay.guest_source,
+        "stay_type": stay.stay_type,
+        "status": stay.status,
+        "unit_id": stay.unit_id,
+        "unit_number": unit_number,
+        "property_name": property_name,
+        "check_in_date": stay.check_in_date,
+        "check_out_date": stay.check_out_date,
+        "estimated_checkout": stay.estimated_checkout_date,
+        "match": match,
+    }
+
+
+# ======================================================
+# EXPORT STAYS (STREAMING CSV / NDJSON)
+# For month-end reconciliation. Rows are streamed in
+# chunks, memory use does not grow with the table.
+# ======================================================
+@router.get("/export")
+def export_stays(
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    status: Optional[str] = Query("all", description='"active", "completed" or "all"'),
+    property_name: Optional[str] = None,
+    check_in_from: Optional[date] = None,
+    check_in_to: Optional[date] = None,
+    user: TokenClaims = Depends(require_role_claims(EXPORT_ROLES)),
+):
+
+    filters = StayFilters(
+        status=None if status == "all" else status,
+        check_in_from=check_in_from,
+        check_in_to=check_in_to,
+    )
+
+    # Archived history first, then the stay table; the same
+    # columns from both
+    statements = []
+    for model in reversed(history_models(filters.status)):
+        statement = filter_stays(
+            select(
+                *[getattr(model, column.name) for column in Stay.__table__.columns],
+                Unit.unit_number,
+                Unit.property_name,
+            ).join(Unit, Unit.id == model.unit_id),
+            filters,
+            model,
+        )
+        if property_name:
+            statement = statement.where(Unit.property_name == property_name)
+        statements.append(statement.order_by(model.id))
+
+    return StreamingResponse(
+        stream_export(statements, format),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="stays.{format}"'},
+    )
 
 
 # ======================================================
@@ -110,20 +518,95 @@ def get_all_stays(
 def checkout_stay(
     stay_id: int,
     session: Session = Depends(get_session),
-    user: User = Depends(require_roles(["admin", "reception"])),
+    user: TokenClaims = Depends(require_role_claims(CHECKOUT_ROLES)),
 ):
 
     stay = session.get(Stay, stay_id)
     if not stay:
         raise HTTPException(status_code=404, detail="Stay not found")
 
-    stay.status = "completed"
+    # Already checked out: nothing to record again
+    if stay.status != "active":
+        raise stay_not_active()
 
-    # Auto set checkout date if tenant
-    if not stay.check_out_date:
-        stay.check_out_date = date.today()
+    mark_checked_out(stay)
 
     session.add(stay)
     session.commit()
 
+    stay_checked_out(stay, user)
+
     return {"message": "Checkout completed"}
+
+
+# ======================================================
+# PATCH /stays/bulk-checkout → GROUP CHECKOUT
+# One query to load all stays, one commit.
+# ======================================================
+@router.patch("/bulk-checkout", response_model=BulkResponse)
+def checkout_stays_bulk(
+    body: BulkCheckoutRequest,
+    session: Session = Depends(get_session),
+    user: TokenClaims = Depends(require_role_claims(CHECKOUT_ROLES)),
+):
+
+    if len(body.stay_ids) > MAX_BULK_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BULK_ITEMS} stays per request",
+        )
+
+    stays = {
+        stay.id: stay
+        for stay in session.exec(
+            select(Stay).where(col(Stay.id).in_(body.stay_ids))
+        ).all()
+    }
+
+    results: dict[int, BulkItemResult] = {}
+    checked_out: dict[int, Stay] = {}
+
+    for index, stay_id in enumerate(body.stay_ids):
+        stay = stays.get(stay_id)
+
+        if not stay:
+            results[index] = BulkItemResult(
+                index=index, status_code=404, stay_id=stay_id, detail="Stay not found"
+            )
+        elif stay.status != "active":
+            results[index] = BulkItemResult(
+                index=index,
+                status_code=409,
+                stay_id=stay_id,
+                detail="Stay is not active",
+            )
+        else:
+            mark_checked_out(stay)
+            session.add(stay)
+            checked_out[index] = stay
+
+    # Keep values after commit: no refresh query per row
+    session.expire_on_commit = False
+    session.commit()
+
+    for index, stay in checked_out.items():
+        stay_checked_out(stay, user, detail="bulk")
+        results[index] = BulkItemResult(
+            index=index, status_code=200, stay_id=stay.id, unit_id=stay.unit_id
+        )
+
+    return build_bulk_response(results)
+
+
+def mark_checked_out(stay: Stay):
+    stay.status = "completed"
+    today = date.today()
+
+    # Auto set checkout date if tenant
+    if not stay.check_out_date:
+        stay.check_out_date = today
+
+    # Left before the planned date: the unit is free from
+    # today (availability, rollups), not from the planned day
+    elif today < stay.check_out_date:
+        stay.check_out_date = max(today, stay.check_in_date)
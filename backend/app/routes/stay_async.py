@@ -0,0 +1,113 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.exc import IntegrityError
+from starlette.concurrency import run_in_threadpool
+
+from app.core.database import get_async_read_session, get_async_session
+from app.core.dependencies import TokenClaims, get_token_claims
+from app.core.permissions import require_role_claims
+
+from app.models.stay import Stay
+from app.models.unit import Unit
+from app.routes.stay import (
+    CHECK_IN_ROLES,
+    CHECKOUT_ROLES,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    build_created_response,
+    build_stays_page,
+    get_stay_filters,
+    is_active_stay_conflict,
+    mark_checked_out,
+    prepare_new_stay,
+    stay_not_active,
+    stays_page_statement,
+    unit_already_occupied,
+)
+from app.schemas.stay import StayFilters
+from app.services.pagination import decode_cursor
+from app.services.stay_archive import history_models
+from app.services.stay_events import stay_checked_in, stay_checked_out
+
+
+# ======================================================
+# ASYNC STAY ROUTES (SUKHA_ASYNC_ROUTES=1)
+# Mirrors app/routes/stay.py; see app/routes/unit_async.py
+# ======================================================
+
+router = APIRouter(prefix="/stays", tags=["Stays"])
+
+
+@router.post("/")
+async def create_stay(
+    stay: Stay,
+    session=Depends(get_async_session),
+    user: TokenClaims = Depends(require_role_claims(CHECK_IN_ROLES)),
+):
+
+    stay = prepare_new_stay(stay)
+
+    unit = await session.get(Unit, stay.unit_id)
+    if not unit:
+        raise HTTPException(status_code=404, detail="Unit not found")
+
+    session.add(stay)
+    try:
+        await session.commit()
+    except IntegrityError as e:
+        await session.rollback()
+        if not is_active_stay_conflict(e):
+            raise
+        raise unit_already_occupied()
+
+    # Post-commit hooks may block (audit backpressure,
+    # housekeeping lookup): keep them off the event loop
+    await run_in_threadpool(stay_checked_in, stay, user)
+
+    return build_created_response(stay)
+
+
+@router.get("/")
+async def get_all_stays(
+    request: Request,
+    response: Response,
+    filters: StayFilters = Depends(get_stay_filters),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    session=Depends(get_async_read_session),
+    current_user: TokenClaims = Depends(get_token_claims),
+):
+
+    after = decode_cursor(cursor)
+
+    stays = []
+    for model in history_models(filters.status):
+        statement = stays_page_statement(filters, after, limit, model)
+        stays += (await session.exec(statement)).all()
+
+    return build_stays_page(stays, limit, request, response)
+
+
+@router.patch("/{stay_id:int}/checkout")
+async def checkout_stay(
+    stay_id: int,
+    session=Depends(get_async_session),
+    user: TokenClaims = Depends(require_role_claims(CHECKOUT_ROLES)),
+):
+
+    stay = await session.get(Stay, stay_id)
+    if not stay:
+        raise HTTPException(status_code=404, detail="Stay not found")
+
+    if stay.status != "active":
+        raise stay_not_active()
+
+    mark_checked_out(stay)
+
+    session.add(stay)
+    await session.commit()
+
+    await run_in_threadpool(stay_checked_out, stay, user)
+
+    return {"message": "Checkout completed"}
@@ -0,0 +1,34 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+
+from app.core.database import get_read_session
+from app.core.dependencies import TokenClaims
+from app.core.permissions import require_role_claims
+
+from app.routes.unit import BOARD_ROLES
+from app.services.change_log import sync_changes
+
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+# Desktop front-desk clients: same data as the room board
+SYNC_ROLES = BOARD_ROLES
+
+
+# ======================================================
+# GET /sync?since=<cursor> → CHANGES FOR OFFLINE CLIENTS
+# mode "delta": units / stays written since the cursor
+# (current rows) and the ids deleted since. Keep calling
+# with the returned cursor while has_more is true.
+# mode "snapshot": all units and active stays, replacing
+# the client's copy (first sync, or cursor too old).
+# ======================================================
+@router.get("")
+def sync(
+    since: Optional[int] = Query(None, ge=0),
+    session: Session = Depends(get_read_session),
+    user: TokenClaims = Depends(require_role_claims(SYNC_ROLES)),
+):
+    return sync_changes(session, since)
@@ -1,17 +1,42 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import json
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session, select
+from starlette.concurrency import run_in_threadpool
 
-from app.core.database import get_session
-from app.core.dependencies import get_current_user
-from app.core.permissions import require_roles
+from app.core.config import BOARD_STREAM_HEARTBEAT_SECONDS
+from app.core.database import get_read_session, read_engine
+from app.core.dependencies import TokenClaims, get_token_claims
+from app.core.permissions import require_role_claims
 
 from app.models.unit import Unit
 from app.models.stay import Stay
-from app.models.user import User
+from app.services.availability import availability_index, nights
+from app.services.board_cache import board_cache
+from app.services.board_stream import BoardEvent, board_stream
+from app.services.export import EXPORT_FORMATS, stream_export
+from app.services.occupancy import occupancy_index
 
 
 router = APIRouter(prefix="/units", tags=["Units"])
 
+# Roles allowed to see the room board and availability
+BOARD_ROLES = [
+    "admin",
+    "hotel_owner",
+    "apartment_owner",
+    "supervisor",
+    "reception",
+]
+
+# Live board stream also feeds housekeeping screens
+STREAM_ROLES = BOARD_ROLES + ["housekeeping"]
+
 
 # ======================================================
 # FORMAT DISPLAY NAME
@@ -25,7 +50,7 @@ def format_unit_display(unit: Unit) -> str:
 # ======================================================
 # BUILD LIVE STATUS USING STAY MODEL
 # ======================================================
-def build_unit_status(unit: Unit, stay: Stay | None):
+def build_unit_status(unit: Unit | None, stay: Stay | None):
 
     if not stay:
         return {
@@ -69,103 +94,310 @@ def build_unit_status(unit: Unit, stay: Stay | None):
     }
 
 
+# ======================================================
+# ROW BUILDERS
+# ======================================================
+def build_board_row(unit: Unit, stay: Stay | None):
+    status_info = build_unit_status(unit, stay)
+
+    return {
+        "id": unit.id,
+        "display_name": format_unit_display(unit),
+        "property_name": unit.property_name,
+        "unit_type": unit.unit_type,
+        "floor_number": unit.floor_number,
+        "building_name": unit.building_name,
+        "billing_mode": unit.billing_mode,
+        "status": status_info["status"],
+        "status_label": status_info["label"],
+        "guest_source": status_info["guest_source"],
+        "estimated_checkout": status_info["estimated_checkout"],
+    }
+
+
+def build_available_row(unit: Unit):
+    return {
+        "id": unit.id,
+        "display_name": format_unit_display(unit),
+        "property_name": unit.property_name,
+        "unit_type": unit.unit_type,
+        "floor_number": unit.floor_number,
+        "building_name": unit.building_name,
+    }
+
+
+def build_unit_detail(unit: Unit, stay: Stay | None):
+    status_info = build_unit_status(unit, stay)
+
+    return {
+        "id": unit.id,
+        "display_name": format_unit_display(unit),
+        "status": status_info["status"],
+        "status_label": status_info["label"],
+        "guest_source": status_info["guest_source"],
+        "estimated_checkout": status_info["estimated_checkout"],
+    }
+
+
+def all_units_statement():
+    return select(Unit).order_by(Unit.unit_number)
+
+
+def build_board(units: list[Unit]):
+    active_stays = occupancy_index.snapshot()
+    return [build_board_row(unit, active_stays.get(unit.id)) for unit in units]
+
+
+def build_available(units: list[Unit]):
+    occupied_unit_ids = occupancy_index.occupied_unit_ids()
+    return [
+        build_available_row(unit)
+        for unit in units
+        if unit.id not in occupied_unit_ids
+    ]
+
+
 # ======================================================
 # GET ALL UNITS WITH LIVE STAY STATUS
 # ======================================================
 @router.get("/")
 def get_all_units(
-    session: Session = Depends(get_session),
-    user: User = Depends(
-        require_roles(
-            [
-                "admin",
-                "hotel_owner",
-                "apartment_owner",
-                "supervisor",
-                "reception",
-            ]
-        )
-    ),
+    request: Request,
+    session: Session = Depends(get_read_session),
+    user: TokenClaims = Depends(require_role_claims(BOARD_ROLES)),
+):
+
+    cached = board_cache.lookup(request, "units", user.role)
+    if cached.response:
+        return cached.response
+
+    units = session.exec(all_units_statement()).all()
+
+    return cached.store(build_board(units))
+
+
+# ======================================================
+# GET AVAILABLE (VACANT) UNITS
+# MUST COME BEFORE /{unit_id}
+# ======================================================
+@router.get("/available")
+def get_available_units(
+    request: Request,
+    session: Session = Depends(get_read_session),
+    user: TokenClaims = Depends(require_role_claims(BOARD_ROLES)),
+):
+
+    cached = board_cache.lookup(request, "units-available", user.role)
+    if cached.response:
+        return cached.response
+
+    units = session.exec(all_units_statement()).all()
+
+    return cached.store(build_available(units))
+
+
+# ======================================================
+# DATE RANGE AVAILABILITY SEARCH
+# Nights from "from" up to (not including) "to".
+# MUST COME BEFORE /{unit_id}
+# ======================================================
+MAX_AVAILABILITY_DAYS = 366
+
+
+@router.get("/availability")
+def search_availability(
+    from_date: date = Query(alias="from"),
+    to_date: date = Query(alias="to"),
+    unit_type: Optional[str] = None,
+    property_name: Optional[str] = None,
+    session: Session = Depends(get_read_session),
+    user: TokenClaims = Depends(require_role_claims(BOARD_ROLES)),
 ):
 
-    statement = select(Unit).order_by(Unit.unit_number)
+    validate_date_range(from_date, to_date)
+
+    statement = availability_statement(unit_type, property_name)
     units = session.exec(statement).all()
 
-    response = []
+    return build_availability(units, from_date, to_date)
 
-    for unit in units:
-        stay_statement = (
-            select(Stay)
-            .where(Stay.unit_id == unit.id)
-            .where(Stay.status == "active")
-        )
-        stay = session.exec(stay_statement).first()
 
-        status_info = build_unit_status(unit, stay)
+def validate_date_range(from_date: date, to_date: date):
+    if to_date <= from_date:
+        raise HTTPException(
+            status_code=400,
+            detail="'to' must be after 'from'",
+        )
 
-        response.append(
-            {
-                "id": unit.id,
-                "display_name": format_unit_display(unit),
-                "property_name": unit.property_name,
-                "unit_type": unit.unit_type,
-                "floor_number": unit.floor_number,
-                "building_name": unit.building_name,
-                "billing_mode": unit.billing_mode,
-                "status": status_info["status"],
-                "status_label": status_info["label"],
-                "guest_source": status_info["guest_source"],
-                "estimated_checkout": status_info["estimated_checkout"],
-            }
+    if (to_date - from_date).days > MAX_AVAILABILITY_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range cannot exceed {MAX_AVAILABILITY_DAYS} days",
         )
 
-    return response
+
+def availability_statement(unit_type: Optional[str], property_name: Optional[str]):
+    statement = all_units_statement()
+    if unit_type:
+        statement = statement.where(Unit.unit_type == unit_type)
+    if property_name:
+        statement = statement.where(Unit.property_name == property_name)
+    return statement
+
+
+def build_availability(units: list[Unit], from_date: date, to_date: date):
+    windows = availability_index.free_windows(
+        [unit.id for unit in units], from_date, to_date
+    )
+    total_nights = (to_date - from_date).days
+
+    response = []
+
+    for unit in units:
+        free = windows[unit.id]
+        if not free:
+            continue
+
+        row = build_available_row(unit)
+        row["fully_available"] = nights(free[0]) == total_nights
+        row["free_windows"] = [
+            {"from": start, "to": end, "nights": nights((start, end))}
+            for start, end in free
+        ]
+        response.append(row)
+
+    return {
+        "from": from_date,
+        "to": to_date,
+        "nights": total_nights,
+        "fully_available_count": sum(
+            1 for row in response if row["fully_available"]
+        ),
+        "units": response,
+    }
 
 
 # ======================================================
-# GET AVAILABLE (VACANT) UNITS
+# EXPORT UNITS (STREAMING CSV / NDJSON)
 # MUST COME BEFORE /{unit_id}
 # ======================================================
-@router.get("/available")
-def get_available_units(
-    session: Session = Depends(get_session),
-    user: User = Depends(
-        require_roles(
-            [
-                "admin",
-                "hotel_owner",
-                "apartment_owner",
-                "reception",
-                "supervisor",
-            ]
-        )
+@router.get("/export")
+def export_units(
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    property_name: Optional[str] = None,
+    user: TokenClaims = Depends(
+        require_role_claims(["admin", "hotel_owner", "apartment_owner"])
     ),
 ):
 
-    active_stays_statement = select(Stay).where(Stay.status == "active")
-    active_stays = session.exec(active_stays_statement).all()
+    statement = select(*Unit.__table__.columns).order_by(Unit.id)
+    if property_name:
+        statement = statement.where(Unit.property_name == property_name)
+
+    return StreamingResponse(
+        stream_export([statement], format),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="units.{format}"'},
+    )
 
-    occupied_unit_ids = {stay.unit_id for stay in active_stays}
 
-    units_statement = select(Unit).order_by(Unit.unit_number)
-    units = session.exec(units_statement).all()
+# ======================================================
+# LIVE ROOM BOARD (SERVER-SENT EVENTS)
+# MUST COME BEFORE /{unit_id}
+#
+#   event: snapshot   data: {"units": [board rows]}
+#   event: unit       data: {"id", "status", "status_label",
+#                            "guest_source", "estimated_checkout"}
+#
+# Reconnect with Last-Event-ID to receive only missed
+# unit events; a snapshot is sent when they are gone.
+# ======================================================
+@router.get("/stream")
+async def stream_units(
+    last_event_id: Optional[str] = Header(None),
+    user: TokenClaims = Depends(require_role_claims(STREAM_ROLES)),
+):
 
-    available_units = []
+    return StreamingResponse(
+        board_events(last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
-    for unit in units:
-        if unit.id not in occupied_unit_ids:
-            available_units.append(
-                {
-                    "id": unit.id,
-                    "display_name": format_unit_display(unit),
-                    "property_name": unit.property_name,
-                    "unit_type": unit.unit_type,
-                    "floor_number": unit.floor_number,
-                    "building_name": unit.building_name,
-                }
-            )
 
-    return available_units
+async def board_events(last_event_id: Optional[str]):
+    subscriber, missed, seq = board_stream.subscribe(last_event_id)
+
+    try:
+        if missed is None:
+            yield await snapshot_frame(seq)
+        else:
+            for event in missed:
+                yield event_frame(event)
+
+        # Events up to here are already covered
+        sent = missed[-1].seq if missed else seq
+
+        while not subscriber.closed:
+            if subscriber.lagged:
+                sent = board_stream.resync(subscriber)
+                yield await snapshot_frame(sent)
+                continue
+
+            try:
+                event = await asyncio.wait_for(
+                    subscriber.queue.get(), BOARD_STREAM_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+
+            if event is None or event.seq <= sent:
+                continue
+            sent = event.seq
+
+            if event.kind == "reset":
+                yield await snapshot_frame(event.seq)
+            else:
+                yield event_frame(event)
+    finally:
+        board_stream.unsubscribe(subscriber)
+
+
+def load_board_snapshot():
+    with Session(read_engine) as session:
+        return build_board(session.exec(all_units_statement()).all())
+
+
+async def snapshot_frame(seq: int) -> str:
+    rows = await run_in_threadpool(load_board_snapshot)
+    return sse_frame("snapshot", seq, {"units": rows})
+
+
+def event_frame(event: BoardEvent) -> str:
+    # Same frame for every subscriber, encode once
+    if event.frame is None:
+        status_info = build_unit_status(None, event.stay)
+        event.frame = sse_frame(
+            "unit",
+            event.seq,
+            {
+                "id": event.unit_id,
+                "status": status_info["status"],
+                "status_label": status_info["label"],
+                "guest_source": status_info["guest_source"],
+                "estimated_checkout": status_info["estimated_checkout"],
+            },
+        )
+    return event.frame
+
+
+def sse_frame(kind: str, seq: int, data) -> str:
+    return (
+        f"event: {kind}\n"
+        f"id: {board_stream.event_id(seq)}\n"
+        f"data: {json.dumps(jsonable_encoder(data))}\n\n"
+    )
 
 
 # ======================================================
@@ -175,28 +407,14 @@ def get_available_units(
 @router.get("/{unit_id}")
 def get_unit(
     unit_id: int,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_read_session),
+    current_user: TokenClaims = Depends(get_token_claims),
 ):
 
     unit = session.get(Unit, unit_id)
     if not unit:
         raise HTTPException(status_code=404, detail="Unit not found")
 
-    stay_statement = (
-        select(Stay)
-        .where(Stay.unit_id == unit.id)
-        .where(Stay.status == "active")
-    )
-    stay = session.exec(stay_statement).first()
-
-    status_info = build_unit_status(unit, stay)
+    stay = occupancy_index.active_stay(unit.id)
 
-    return {
-        "id": unit.id,
-        "display_name": format_unit_display(unit),
-        "status": status_info["status"],
-        "status_label": status_info["label"],
-        "guest_source": status_info["guest_source"],
-        "estimated_checkout": status_info["estimated_checkout"],
-    }
+    return build_unit_detail(unit, stay)
@@ -0,0 +1,100 @@
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+
+from app.core.database import get_async_read_session
+from app.core.dependencies import TokenClaims, get_token_claims
+from app.core.permissions import require_role_claims
+
+from app.models.unit import Unit
+from app.routes.unit import (
+    BOARD_ROLES,
+    all_units_statement,
+    availability_statement,
+    build_availability,
+    build_available,
+    build_board,
+    build_unit_detail,
+    validate_date_range,
+)
+from app.services.board_cache import board_cache
+from app.services.occupancy import occupancy_index
+
+
+# ======================================================
+# ASYNC UNIT ROUTES (SUKHA_ASYNC_ROUTES=1)
+# Same responses as app/routes/unit.py, but handlers
+# await the database instead of holding a threadpool
+# slot. Included BEFORE the sync router, so routes not
+# defined here still fall through to the sync ones.
+# ======================================================
+
+router = APIRouter(prefix="/units", tags=["Units"])
+
+
+@router.get("/")
+async def get_all_units(
+    request: Request,
+    session=Depends(get_async_read_session),
+    user: TokenClaims = Depends(require_role_claims(BOARD_ROLES)),
+):
+
+    cached = board_cache.lookup(request, "units", user.role)
+    if cached.response:
+        return cached.response
+
+    units = (await session.exec(all_units_statement())).all()
+
+    return cached.store(build_board(units))
+
+
+@router.get("/available")
+async def get_available_units(
+    request: Request,
+    session=Depends(get_async_read_session),
+    user: TokenClaims = Depends(require_role_claims(BOARD_ROLES)),
+):
+
+    cached = board_cache.lookup(request, "units-available", user.role)
+    if cached.response:
+        return cached.response
+
+    units = (await session.exec(all_units_statement())).all()
+
+    return cached.store(build_available(units))
+
+
+@router.get("/availability")
+async def search_availability(
+    from_date: date = Query(alias="from"),
+    to_date: date = Query(alias="to"),
+    unit_type: Optional[str] = None,
+    property_name: Optional[str] = None,
+    session=Depends(get_async_read_session),
+    user: TokenClaims = Depends(require_role_claims(BOARD_ROLES)),
+):
+
+    validate_date_range(from_date, to_date)
+
+    statement = availability_statement(unit_type, property_name)
+    units = (await session.exec(statement)).all()
+
+    return build_availability(units, from_date, to_date)
+
+
+# ":int" so non-numeric paths (/units/export...) reach the sync router
+@router.get("/{unit_id:int}")
+async def get_unit(
+    unit_id: int,
+    session=Depends(get_async_read_session),
+    current_user: TokenClaims = Depends(get_token_claims),
+):
+
+    unit = await session.get(Unit, unit_id)
+    if not unit:
+        raise HTTPException(status_code=404, detail="Unit not found")
+
+    stay = occupancy_index.active_stay(unit.id)
+
+    return build_unit_detail(unit, stay)
@@ -22,6 +22,13 @@ class LoginRequest(BaseModel):
     password: str
 
 
+# -------------------------------------------------------------------
+# REFRESH REQUEST
+# -------------------------------------------------------------------
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+
 # -------------------------------------------------------------------
 # TOKEN RESPONSE (JWT)
 # -------------------------------------------------------------------
@@ -0,0 +1,45 @@
+from datetime import date
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+
+# -------------------------------------------------------------------
+# STAY LIST FILTERS
+# -------------------------------------------------------------------
+class StayFilters(BaseModel):
+    # "active" | "completed" | None (= any status)
+    status: Optional[str] = "active"
+    stay_type: Optional[str] = None
+    guest_source: Optional[str] = None
+    unit_id: Optional[int] = None
+
+    # Inclusive range on check_in_date
+    check_in_from: Optional[date] = None
+    check_in_to: Optional[date] = None
+
+
+# -------------------------------------------------------------------
+# BULK CHECKOUT REQUEST
+# -------------------------------------------------------------------
+class BulkCheckoutRequest(BaseModel):
+    stay_ids: list[int]
+
+
+# -------------------------------------------------------------------
+# BULK RESULT (ONE PER INPUT ITEM)
+# -------------------------------------------------------------------
+class BulkItemResult(BaseModel):
+    index: int
+    status_code: int
+    stay_id: Optional[int] = None
+    unit_id: Optional[int] = None
+    estimated_checkout: Optional[date] = None
+    # A message, or the field errors of a 422 as they are
+    detail: Any = None
+
+
+class BulkResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: list[BulkItemResult]
@@ -0,0 +1,328 @@
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+from sqlmodel import Session, select
+
+from app.core.database import create_db_and_tables, engine
+from app.models.stay import Stay
+from app.models.unit import Unit
+from app.seeders.unit_seeder import insert_units
+
+
+# ======================================================
+# SYNTHETIC LARGE DATASET
+#
+# Many properties, thousands of units and millions of
+# historical stays, written with batched Core inserts.
+# Used to reproduce production-scale slowness locally:
+#
+#   python -m app.seeders.synthetic_seeder \
+#       --properties 40 --units-per-property 50 --stays 1000000
+#
+# Each unit's history is generated backwards from today,
+# so stays never overlap and at most one is active.
+# Only units created by this run get stays, a second run
+# with the same arguments adds nothing.
+# ======================================================
+
+BATCH_SIZE = 10_000
+
+FIRST_NAMES = [
+    "Aarav", "Anika", "Arjun", "Diya", "Ishaan", "Kavya", "Meera",
+    "Nikhil", "Priya", "Rahul", "Riya", "Rohan", "Sanjay", "Sneha",
+    "Tara", "Vikram", "Anna", "Lukas", "Sofia", "James", "Emma", "Noah",
+]
+
+LAST_NAMES = [
+    "Sharma", "Patel", "Iyer", "Nair", "Menon", "Reddy", "Gupta",
+    "Kumar", "Das", "Pillai", "Joshi", "Rao", "Schmidt", "Rossi",
+    "Smith", "Brown", "Müller", "Martin",
+]
+
+# Nights per daily stay (weighted by repetition)
+DAILY_NIGHTS = [1, 1, 1, 2, 2, 2, 2, 3, 3, 3, 4, 4, 5, 6, 7, 7, 10, 14]
+
+# Ayursiha treatment programmes run in whole weeks
+AYURSIHA_NIGHTS = [7, 7, 14, 14, 14, 21, 21, 28]
+
+# Mean empty nights between daily stays, by month.
+# Busy winter season, quiet monsoon.
+DAILY_GAP_BY_MONTH = {
+    1: 0.5, 2: 0.5, 3: 1.0, 4: 1.5, 5: 2.5, 6: 4.0,
+    7: 4.0, 8: 3.5, 9: 2.5, 10: 1.5, 11: 1.0, 12: 0.5,
+}
+
+# Tenants take longer to replace
+TENANT_GAP_FACTOR = 8
+
+# Average days per (stay + gap), used to spread stays so
+# every unit's history covers roughly the same period.
+DAILY_CYCLE_DAYS = 9
+TENANT_CYCLE_DAYS = 170
+
+
+# ======================================================
+# UNITS
+# Roughly 60% hotels (daily rooms), 40% apartment
+# buildings where half the units are monthly.
+# ======================================================
+
+def property_name(index: int) -> str:
+    return f"Synthetic {'Retreats' if is_hotel(index) else 'Residency'} {index:03d}"
+
+
+def is_hotel(index: int) -> bool:
+    return index % 5 < 3
+
+
+def build_unit_rows(properties: int, units_per_property: int, rng: random.Random):
+    rooms_per_floor = 20
+
+    for p in range(1, properties + 1):
+        hotel = is_hotel(p)
+        name = property_name(p)
+
+        for n in range(units_per_property):
+            floor = n // rooms_per_floor + 1
+            room = n % rooms_per_floor + 1
+            block = None if hotel else "ABCD"[n % 4]
+
+            yield dict(
+                property_name=name,
+                unit_number=f"S{p:03d}-{block or ''}{floor}{room:02d}",
+                unit_type="room" if hotel else "apartment",
+                floor_number=floor,
+                building_block=block,
+                building_name=None if hotel else "Tower",
+                billing_mode="daily" if hotel or rng.random() < 0.5 else "monthly",
+                status="maintenance" if rng.random() < 0.01 else "active",
+            )
+
+
+# ======================================================
+# STAYS
+# ======================================================
+
+def guest_name(rng: random.Random) -> str:
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+def gap_days(rng: random.Random, before: date, tenant: bool) -> int:
+    mean = DAILY_GAP_BY_MONTH[before.month] * (TENANT_GAP_FACTOR if tenant else 1)
+    return int(rng.expovariate(1 / mean)) if mean else 0
+
+
+def created_at(rng: random.Random, check_in: date) -> datetime:
+    booked = check_in - timedelta(days=rng.choice([0, 0, 0, 1, 3, 7, 30]))
+    return datetime.combine(booked, datetime.min.time()) + timedelta(
+        seconds=rng.randrange(8 * 3600, 22 * 3600)
+    )
+
+
+def daily_stay(rng: random.Random, unit_id: int, end: date, active: bool, today: date):
+    ayursiha = rng.random() < 0.25
+    nights = rng.choice(AYURSIHA_NIGHTS if ayursiha else DAILY_NIGHTS)
+
+    if active:
+        check_in = today - timedelta(days=rng.randrange(nights))
+    else:
+        check_in = end - timedelta(days=nights)
+
+    return dict(
+        unit_id=unit_id,
+        guest_name=guest_name(rng),
+        guest_source="ayursiha" if ayursiha else "sukha",
+        stay_type="daily",
+        check_in_date=check_in,
+        check_out_date=check_in + timedelta(days=nights),
+        estimated_checkout_date=check_in + timedelta(days=nights),
+        planned_months=None,
+        monthly_due_day=None,
+        monthly_rent=None,
+        advance_amount=rng.choice([None, None, 2000.0, 5000.0]),
+        advance_refunded=False,
+        status="active" if active else "completed",
+        created_at=created_at(rng, check_in),
+    )
+
+
+def tenant_stay(rng: random.Random, unit_id: int, end: date, active: bool, today: date):
+    yearly = rng.random() < 0.2
+    months = 12 if yearly else rng.randint(1, 6)
+    planned_days = 30 * months
+
+    if active:
+        check_in = today - timedelta(days=rng.randrange(planned_days))
+        check_out = None
+    else:
+        # Tenants leave around the planned date, not on it
+        actual_days = max(1, planned_days + rng.randint(-10, 10))
+        check_in = end - timedelta(days=actual_days)
+        check_out = end
+
+    rent = float(rng.randrange(12_000, 45_000, 500))
+
+    return dict(
+        unit_id=unit_id,
+        guest_name=guest_name(rng),
+        guest_source="sukha",
+        stay_type="yearly" if yearly else "monthly",
+        check_in_date=check_in,
+        check_out_date=check_out,
+        estimated_checkout_date=check_in + timedelta(days=planned_days),
+        planned_months=months,
+        monthly_due_day=min(check_in.day, 28),
+        monthly_rent=rent,
+        advance_amount=rent * 2,
+        advance_refunded=not active and rng.random() < 0.9,
+        status="active" if active else "completed",
+        created_at=created_at(rng, check_in),
+    )
+
+
+def unit_stays(
+    rng: random.Random,
+    unit_id: int,
+    billing_mode: str,
+    count: int,
+    occupancy: float,
+    today: date,
+):
+    """
+    Yield `count` stays for one unit, newest first.
+    The newest is active with probability `occupancy`.
+    """
+    tenant = billing_mode == "monthly"
+    build = tenant_stay if tenant else daily_stay
+
+    cursor = today
+    for i in range(count):
+        active = i == 0 and rng.random() < occupancy
+
+        if not active:
+            cursor -= timedelta(days=gap_days(rng, cursor, tenant))
+
+        row = build(rng, unit_id, cursor, active, today)
+        cursor = row["check_in_date"]
+        yield row
+
+
+def stay_quotas(units: list[tuple[int, str]], total: int) -> list[int]:
+    """
+    Split `total` stays so daily units get more, shorter
+    stays and tenant units fewer, longer ones.
+    """
+    weights = [
+        1 / (TENANT_CYCLE_DAYS if mode == "monthly" else DAILY_CYCLE_DAYS)
+        for _, mode in units
+    ]
+    scale = total / sum(weights) if weights else 0
+    return [round(w * scale) for w in weights]
+
+
+# ======================================================
+# BATCHED INSERT
+# ======================================================
+
+def insert_batched(session: Session, model, rows, batch_size: int) -> int:
+    inserted = 0
+    batch = []
+
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            session.execute(insert(model.__table__), batch)
+            session.commit()
+            inserted += len(batch)
+            batch = []
+
+    if batch:
+        session.execute(insert(model.__table__), batch)
+        session.commit()
+        inserted += len(batch)
+
+    return inserted
+
+
+# ======================================================
+# SEEDER FUNCTION
+# ======================================================
+
+def seed_synthetic(
+    properties: int = 20,
+    units_per_property: int = 100,
+    stays: int = 200_000,
+    occupancy: float = 0.7,
+    seed: int = 42,
+    batch_size: int = BATCH_SIZE,
+):
+    rng = random.Random(seed)
+    today = date.today()
+    started = time.perf_counter()
+
+    create_db_and_tables()
+
+    with Session(engine) as session:
+        unit_rows = list(build_unit_rows(properties, units_per_property, rng))
+        added_units = insert_units(session, unit_rows)
+        session.commit()
+
+        if added_units:
+            # Units that already had rows keep their history
+            existing_with_stays = set(
+                session.exec(select(Stay.unit_id).distinct()).all()
+            )
+            names = {row["property_name"] for row in unit_rows}
+            units = [
+                (unit_id, mode)
+                for unit_id, mode in session.exec(
+                    select(Unit.id, Unit.billing_mode)
+                    .where(Unit.property_name.in_(names))
+                    .order_by(Unit.id)
+                )
+                if unit_id not in existing_with_stays
+            ]
+        else:
+            units = []
+
+        quotas = stay_quotas(units, stays)
+
+        all_stays = (
+            row
+            for (unit_id, mode), count in zip(units, quotas)
+            for row in unit_stays(rng, unit_id, mode, count, occupancy, today)
+        )
+        added_stays = insert_batched(session, Stay, all_stays, batch_size)
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"✅ Seeded {added_units} units and {added_stays} stays "
+        f"in {elapsed:.1f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a large synthetic dataset")
+    parser.add_argument("--properties", type=int, default=20)
+    parser.add_argument("--units-per-property", type=int, default=100)
+    parser.add_argument("--stays", type=int, default=200_000)
+    parser.add_argument("--occupancy", type=float, default=0.7)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    seed_synthetic(
+        properties=args.properties,
+        units_per_property=args.units_per_property,
+        stays=args.stays,
+        occupancy=args.occupancy,
+        seed=args.seed,
+        batch_size=args.batch_size,
+    )
+
+
+if __name__ == "__main__":
+    main()
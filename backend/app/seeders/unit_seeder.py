@@ -1,3 +1,4 @@
+from sqlalchemy import insert
 from sqlmodel import Session, select
 
 from app.core.database import engine
@@ -6,11 +7,30 @@ from app.models.unit import Unit
 
 # ======================================================
 # HELPER: Avoid duplicate inserts
+# One IN query for the whole batch instead of one
+# SELECT per unit.
 # ======================================================
 
-def unit_exists(session: Session, unit_number: str) -> bool:
-    statement = select(Unit).where(Unit.unit_number == unit_number)
-    return session.exec(statement).first() is not None
+def existing_unit_numbers(session: Session, unit_numbers: list[str]) -> set[str]:
+    if not unit_numbers:
+        return set()
+
+    statement = select(Unit.unit_number).where(Unit.unit_number.in_(unit_numbers))
+    return set(session.exec(statement).all())
+
+
+def insert_units(session: Session, rows: list[dict]) -> int:
+    """
+    Insert unit rows that are not in the database yet.
+    Returns how many rows were inserted.
+    """
+    existing = existing_unit_numbers(session, [row["unit_number"] for row in rows])
+    new_rows = [row for row in rows if row["unit_number"] not in existing]
+
+    if new_rows:
+        session.execute(insert(Unit.__table__), new_rows)
+
+    return len(new_rows)
 
 
 # ======================================================
@@ -32,21 +52,18 @@ def seed_units():
 
         for floor in [1, 2, 3]:
             for room in range(2, 8):  # 02 to 07
-                unit_number = f"{floor}0{room}"
-
-                if not unit_exists(session, unit_number):
-                    units_to_add.append(
-                        Unit(
-                            property_name="Sukha Retreats",
-                            unit_number=unit_number,
-                            unit_type="room",
-                            floor_number=floor,
-                            building_block=None,
-                            building_name=None,
-                            billing_mode="daily",
-                            status="active",
-                        )
+                units_to_add.append(
+                    dict(
+                        property_name="Sukha Retreats",
+                        unit_number=f"{floor}0{room}",
+                        unit_type="room",
+                        floor_number=floor,
+                        building_block=None,
+                        building_name=None,
+                        billing_mode="daily",
+                        status="active",
                     )
+                )
 
         # ======================================================
         # 🏢 Sukha Paradise — New Building Apartments
@@ -64,19 +81,18 @@ def seed_units():
         ]
 
         for unit_number, floor in new_apartments:
-            if not unit_exists(session, unit_number):
-                units_to_add.append(
-                    Unit(
-                        property_name="Sukha Paradise",
-                        unit_number=unit_number,
-                        unit_type="apartment",
-                        floor_number=floor,
-                        building_block=unit_number[0],
-                        building_name="New Building",
-                        billing_mode="daily",
-                        status="active",
-                    )
+            units_to_add.append(
+                dict(
+                    property_name="Sukha Paradise",
+                    unit_number=unit_number,
+                    unit_type="apartment",
+                    floor_number=floor,
+                    building_block=unit_number[0],
+                    building_name="New Building",
+                    billing_mode="daily",
+                    status="active",
                 )
+            )
 
         # ======================================================
         # 🏚 Sukha Paradise — Old Building Apartments
@@ -91,28 +107,28 @@ def seed_units():
         ]
 
         for unit_number, floor in old_apartments:
-            if not unit_exists(session, unit_number):
-                units_to_add.append(
-                    Unit(
-                        property_name="Sukha Paradise",
-                        unit_number=unit_number,
-                        unit_type="apartment",
-                        floor_number=floor,
-                        building_block=unit_number[0],
-                        building_name="Old Building",
-                        billing_mode="monthly",
-                        status="active",
-                    )
+            units_to_add.append(
+                dict(
+                    property_name="Sukha Paradise",
+                    unit_number=unit_number,
+                    unit_type="apartment",
+                    floor_number=floor,
+                    building_block=unit_number[0],
+                    building_name="Old Building",
+                    billing_mode="monthly",
+                    status="active",
                 )
+            )
 
         # ======================================================
         # SAVE ALL
         # ======================================================
 
-        session.add_all(units_to_add)
+        added = insert_units(session, units_to_add)
         session.commit()
 
-        print(f"✅ Seeded {len(units_to_add)} units successfully!")
+        print(f"✅ Seeded {added} units successfully!")
+
+
 if __name__ == "__main__":
     seed_units()
-
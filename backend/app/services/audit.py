@@ -0,0 +1,209 @@
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import insert
+
+from app.core.config import (
+    AUDIT_BATCH_SIZE,
+    AUDIT_ENQUEUE_TIMEOUT_MS,
+    AUDIT_FLUSH_MS,
+    AUDIT_QUEUE_SIZE,
+)
+from app.core.database import engine
+from app.models.audit_event import AuditEvent
+
+logger = logging.getLogger("sukha.audit")
+
+
+# ======================================================
+# AUDIT TRAIL (GROUP COMMIT)
+#
+# Routes hand events to a bounded in-process queue after
+# their own commit and return; one writer thread takes
+# whatever has queued up (up to AUDIT_BATCH_SIZE, waiting
+# at most AUDIT_FLUSH_MS for more) and inserts it in one
+# transaction. A burst of check-ins costs one commit, not
+# one each.
+#
+# Backpressure: a full queue means the writer is behind.
+# The request then waits up to AUDIT_ENQUEUE_TIMEOUT_MS
+# for room, and past that writes its own event, so events
+# are never dropped and a stuck writer only slows
+# requests down.
+#
+# Shutdown stops the writer after everything queued
+# before it has been written.
+# ======================================================
+
+WRITE_RETRIES = 3
+
+# Tells the writer to stop
+_STOP = object()
+
+
+class AuditTrail:
+    def __init__(
+        self,
+        queue_size: int,
+        batch_size: int,
+        flush_ms: int,
+        enqueue_timeout_ms: int,
+    ):
+        self.batch_size = batch_size
+        self.flush_seconds = flush_ms / 1000
+        self.enqueue_timeout = enqueue_timeout_ms / 1000
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+
+        # Stats
+        self.recorded = 0
+        self.written = 0
+        self.batches = 0
+        self.written_inline = 0
+        self.failed = 0
+
+    # ======================================================
+    # PRODUCERS (routes, after commit)
+    # ======================================================
+    def record(
+        self,
+        action: str,
+        actor_id: int,
+        actor_role: str,
+        unit_id: Optional[int] = None,
+        stay_id: Optional[int] = None,
+        detail: Optional[str] = None,
+    ):
+        event = {
+            "occurred_at": datetime.utcnow(),
+            "actor_id": actor_id,
+            "actor_role": actor_role,
+            "action": action,
+            "unit_id": unit_id,
+            "stay_id": stay_id,
+            "detail": detail,
+        }
+        self.recorded += 1
+
+        if self._thread is None:
+            # No writer (scripts, tests): write straight away
+            self.write([event])
+            return
+
+        try:
+            self._queue.put(event, timeout=self.enqueue_timeout)
+        except queue.Full:
+            self.written_inline += 1
+            self.write([event])
+
+    # ======================================================
+    # WRITER
+    # ======================================================
+    def write(self, events: list[dict]):
+        for attempt in range(1, WRITE_RETRIES + 1):
+            try:
+                with engine.begin() as conn:
+                    conn.execute(insert(AuditEvent.__table__), events)
+                self.written += len(events)
+                return
+            except Exception:
+                if attempt == WRITE_RETRIES:
+                    # Keep the events in the log at least
+                    self.failed += len(events)
+                    logger.exception("Lost %d audit events: %r", len(events), events)
+                    return
+                time.sleep(0.1 * attempt)
+
+    def _next_batch(self) -> tuple[list[dict], bool]:
+        """
+        (events, stop): blocks for the first event, then
+        takes more until the batch is full or the flush
+        window has passed.
+        """
+        first = self._queue.get()
+        if first is _STOP:
+            return [], True
+
+        batch = [first]
+        deadline = time.monotonic() + self.flush_seconds
+
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                event = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if event is _STOP:
+                return batch, True
+            batch.append(event)
+
+        return batch, False
+
+    def _run(self):
+        stop = False
+        while not stop:
+            batch, stop = self._next_batch()
+            if batch:
+                self.write(batch)
+                self.batches += 1
+
+    def start(self):
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(
+            target=self._run, name="sukha-audit", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """
+        Flush everything queued, then stop the writer.
+        """
+        if self._thread is None:
+            return
+
+        self._queue.put(_STOP)
+        self._thread.join(timeout=30)
+        self._thread = None
+
+        # Anything that raced in behind the stop marker
+        leftovers = []
+        while True:
+            try:
+                event = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if event is not _STOP:
+                leftovers.append(event)
+        if leftovers:
+            self.write(leftovers)
+
+    def stats(self) -> dict:
+        return {
+            "running": self._thread is not None,
+            "queued": self._queue.qsize(),
+            "queue_size": self._queue.maxsize,
+            "recorded": self.recorded,
+            "written": self.written,
+            "batches": self.batches,
+            "written_inline": self.written_inline,
+            "failed": self.failed,
+        }
+
+
+audit_trail = AuditTrail(
+    AUDIT_QUEUE_SIZE,
+    AUDIT_BATCH_SIZE,
+    AUDIT_FLUSH_MS,
+    AUDIT_ENQUEUE_TIMEOUT_MS,
+)
@@ -0,0 +1,259 @@
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from typing import Optional
+
+from sqlalchemy import union_all
+from sqlmodel import Session, select
+
+from app.core.database import engine, read_engine
+from app.models.stay import Stay
+from app.services.stay_archive import history_models
+
+
+# ======================================================
+# AVAILABILITY (INTERVAL) INDEX
+#
+# Per unit, every stay becomes a night interval
+# [check_in, end) stored as date ordinals. Intervals are
+# merged into sorted, non-overlapping lists, so a date
+# range query is one bisect per unit instead of a loop
+# over every stay in history.
+#
+# Completed stays end on check_out_date (the actual
+# checkout day when a guest leaves early). History never
+# changes, so it is kept only as merged intervals in
+# compact int arrays (8 bytes per busy span).
+# Active stays end on estimated_checkout(), but never
+# before tomorrow (an overdue guest still holds the room),
+# and are kept per stay until checkout.
+# ======================================================
+
+LOAD_BATCH_SIZE = 10_000
+
+
+class AvailabilityIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.loaded = False
+
+        # unit_id → (starts, ends) merged completed history
+        self._completed: dict[int, tuple[array, array]] = {}
+
+        # unit_id → {stay_id: (start, planned_end)}
+        self._active: dict[int, dict[int, tuple[int, int]]] = {}
+
+        # unit_id → (starts, ends) history + active, merged
+        self._merged: dict[int, tuple[array, array]] = {}
+
+        # Units whose merged lists must be rebuilt
+        self._dirty: set[int] = set()
+
+        # Active intervals depend on "today"
+        self._merged_on: int = date.today().toordinal()
+
+    # ======================================================
+    # LOAD / REBUILD
+    # Streams stays ordered by unit and check-in, so each
+    # completed interval either extends the last span or
+    # starts a new one. No per-stay state is kept.
+    # ======================================================
+    def rebuild(self, session: Session):
+        # Archived stays too: the index answers for past
+        # dates as well
+        statement = (
+            union_all(
+                *[
+                    select(
+                        model.id,
+                        model.unit_id,
+                        model.stay_type,
+                        model.status,
+                        model.check_in_date,
+                        model.check_out_date,
+                        model.planned_months,
+                    )
+                    for model in history_models(None)
+                ]
+            )
+            .order_by("unit_id", "check_in_date")
+            .execution_options(yield_per=LOAD_BATCH_SIZE)
+        )
+
+        completed: dict[int, tuple[array, array]] = {}
+        active: dict[int, dict[int, tuple[int, int]]] = {}
+
+        for row in session.connection().execute(statement):
+            start, end, is_active = stay_interval(row)
+
+            if is_active:
+                active.setdefault(row.unit_id, {})[row.id] = (start, end)
+                continue
+
+            starts, ends = completed.setdefault(
+                row.unit_id, (array("l"), array("l"))
+            )
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+
+        with self._lock:
+            self._completed = completed
+            self._active = active
+            self._merged = {}
+            self._dirty = set(completed) | set(active)
+            self._merged_on = date.today().toordinal()
+            self.loaded = True
+
+    def _ensure_loaded(self):
+        if not self.loaded:
+            with Session(read_engine) as session:
+                self.rebuild(session)
+
+    # ======================================================
+    # WRITE-THROUGH (call after commit)
+    # ======================================================
+    def record_stay(self, stay: Stay):
+        if not self.loaded:
+            return
+
+        start, end, is_active = stay_interval(stay)
+
+        with self._lock:
+            unit_active = self._active.setdefault(stay.unit_id, {})
+
+            if is_active:
+                unit_active[stay.id] = (start, end)
+            else:
+                unit_active.pop(stay.id, None)
+                starts, ends = self._completed.setdefault(
+                    stay.unit_id, (array("l"), array("l"))
+                )
+                add_interval(starts, ends, start, end)
+
+            self._dirty.add(stay.unit_id)
+
+    # ======================================================
+    # QUERY
+    # ======================================================
+    def free_windows(
+        self,
+        unit_ids: list[int],
+        from_date: date,
+        to_date: date,
+    ) -> dict[int, list[tuple[date, date]]]:
+        """
+        Free night windows per unit inside [from_date, to_date).
+        """
+        self._ensure_loaded()
+
+        start = from_date.toordinal()
+        end = to_date.toordinal()
+
+        with self._lock:
+            self._refresh_merged()
+
+            result = {}
+            for unit_id in unit_ids:
+                starts, ends = self._merged.get(unit_id, ([], []))
+                result[unit_id] = [
+                    (date.fromordinal(a), date.fromordinal(b))
+                    for a, b in gaps(starts, ends, start, end)
+                ]
+
+            return result
+
+    def _refresh_merged(self):
+        today = date.today().toordinal()
+
+        # New day → re-merge only units holding an active stay
+        if today != self._merged_on:
+            self._dirty.update(
+                unit_id for unit_id, stays in self._active.items() if stays
+            )
+            self._merged_on = today
+
+        for unit_id in self._dirty:
+            history = self._completed.get(unit_id, (array("l"), array("l")))
+            stays = self._active.get(unit_id)
+
+            if not stays:
+                # No copy needed, history arrays are shared
+                self._merged[unit_id] = history
+                continue
+
+            starts, ends = array("l", history[0]), array("l", history[1])
+            for stay_start, stay_end in stays.values():
+                add_interval(starts, ends, stay_start, max(stay_end, today + 1))
+            self._merged[unit_id] = (starts, ends)
+
+        self._dirty.clear()
+
+
+# ======================================================
+# HELPERS
+# ======================================================
+
+def stay_interval(stay) -> tuple[int, int, bool]:
+    """
+    (start, planned_end, is_active) as date ordinals.
+    Works on Stay objects and on selected column rows.
+    """
+    start = stay.check_in_date.toordinal()
+
+    if stay.status == "active":
+        planned_end: Optional[date] = Stay.estimated_checkout(stay)
+    else:
+        planned_end = stay.check_out_date or Stay.estimated_checkout(stay)
+
+    end = planned_end.toordinal() if planned_end else start + 1
+
+    return start, max(end, start + 1), stay.status == "active"
+
+
+def add_interval(starts: array, ends: array, start: int, end: int):
+    """
+    Insert [start, end) into merged, sorted spans in place,
+    joining every span it overlaps or touches.
+    """
+    i = bisect_left(ends, start)
+    j = bisect_right(starts, end)
+
+    if i < j:
+        start = min(start, starts[i])
+        end = max(end, ends[j - 1])
+
+    starts[i:j] = array(starts.typecode, [start])
+    ends[i:j] = array(ends.typecode, [end])
+
+
+def gaps(starts: list[int], ends: list[int], start: int, end: int):
+    """
+    Yield free [a, b) spans between merged busy intervals.
+    """
+    i = bisect_right(ends, start)
+    cursor = start
+
+    while i < len(starts) and starts[i] < end:
+        if starts[i] > cursor:
+            yield cursor, starts[i]
+        cursor = max(cursor, ends[i])
+        i += 1
+
+    if cursor < end:
+        yield cursor, end
+
+
+def nights(window: tuple[date, date]) -> int:
+    return (window[1] - window[0]) // timedelta(days=1)
+
+
+availability_index = AvailabilityIndex()
+
+
+def load_availability_index():
+    with Session(engine) as session:
+        availability_index.rebuild(session)
@@ -0,0 +1,178 @@
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import BOARD_CACHE_SIZE
+from app.models.unit import Unit
+
+
+# ======================================================
+# ROOM BOARD VERSION + RESPONSE CACHE
+#
+# Every change that can alter the board (check-in,
+# checkout, unit edits) bumps one version number AFTER
+# the change is committed and the in-memory indexes are
+# updated. The version is the ETag, so an unchanged
+# board costs a header comparison (304), and a changed
+# one is encoded once per (route, role, version).
+#
+# The ETag also carries a per-process id: with several
+# workers each has its own version, and a tag from one
+# must never match in another.
+# ======================================================
+
+class BoardCache:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._version = 0
+        self._process_id = uuid.uuid4().hex[:8]
+
+        # (route, role, version) → (etag, encoded body)
+        self._entries: OrderedDict[tuple, tuple[str, bytes]] = OrderedDict()
+
+        # Stats
+        self.not_modified = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def bump(self):
+        with self._lock:
+            self._version += 1
+
+            # Older versions can never be served again
+            self._entries.clear()
+
+    def etag(self, route: str, role: str, version: int) -> str:
+        return f'"{self._process_id}-{version}-{route}-{role}"'
+
+    # ======================================================
+    # LOOKUP → 304, cached 200, or a miss to fill with store()
+    # ======================================================
+    def lookup(self, request: Request, route: str, role: str) -> "BoardLookup":
+        version = self._version
+        key = (route, role, version)
+        etag = self.etag(route, role, version)
+
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            with self._lock:
+                self.not_modified += 1
+            return BoardLookup(self, key, etag, not_modified_response(etag))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return BoardLookup(self, key, etag, board_response(*entry))
+
+            self.misses += 1
+
+        return BoardLookup(self, key, etag, None)
+
+    def store(self, key: tuple, etag: str, payload) -> Response:
+        body = JSONResponse(jsonable_encoder(payload)).body
+
+        with self._lock:
+            # A bump while building: keep the answer out of
+            # the cache, its version is already stale
+            if key[2] == self._version:
+                self._entries[key] = (etag, body)
+                self._entries.move_to_end(key)
+
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+        return board_response(etag, body)
+
+    def stats(self):
+        return {
+            "version": self._version,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "not_modified": self.not_modified,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class BoardLookup:
+    def __init__(self, cache: BoardCache, key: tuple, etag: str, response: Optional[Response]):
+        self.cache = cache
+        self.key = key
+        self.etag = etag
+        self.response = response
+
+    def store(self, payload) -> Response:
+        return self.cache.store(self.key, self.etag, payload)
+
+
+# ======================================================
+# HELPERS
+# ======================================================
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+
+    # Weak comparison, as If-None-Match requires
+    candidates = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return etag in candidates
+
+
+def board_response(etag: str, body: bytes) -> Response:
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
+
+board_cache = BoardCache(BOARD_CACHE_SIZE)
+
+
+# ======================================================
+# UNIT CHANGES
+# Mapper events fire at flush, before commit, so they
+# only mark the session; the bump happens after commit.
+# ======================================================
+
+@event.listens_for(Unit, "after_insert")
+@event.listens_for(Unit, "after_update")
+@event.listens_for(Unit, "after_delete")
+def _mark_board_changed(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info["board_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_after_commit(session):
+    if session.info.pop("board_changed", False):
+        board_cache.bump()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_after_rollback(session):
+    session.info.pop("board_changed", None)
@@ -0,0 +1,191 @@
+import asyncio
+import threading
+import uuid
+from collections import deque
+from typing import Optional
+
+from app.core.config import BOARD_STREAM_BUFFER_SIZE, BOARD_STREAM_QUEUE_SIZE
+from app.models.stay import Stay
+from app.services.occupancy import detached_copy
+
+
+# ======================================================
+# LIVE ROOM BOARD STREAM
+#
+# Every unit status change gets the next sequence number
+# and is kept in a ring buffer. Subscribers (SSE clients)
+# each own an asyncio queue; publishing from a threadpool
+# thread hands events to their loop thread-safely.
+#
+# Resume: a client reconnecting with its last sequence
+# number gets the buffered events after it. If those
+# were already dropped from the buffer, or the client
+# fell behind, it gets a full snapshot instead.
+#
+# Event ids are "<stream id>:<seq>". The stream id is new
+# for every process, so ids from before a restart (or from
+# another worker) always lead to a snapshot.
+# ======================================================
+
+class BoardEvent:
+    def __init__(self, seq: int, kind: str, unit_id: Optional[int], stay: Optional[Stay]):
+        self.seq = seq
+
+        # "unit" (status change) | "reset" (refetch everything)
+        self.kind = kind
+        self.unit_id = unit_id
+        self.stay = stay
+
+        # Encoded once by the route, shared by all subscribers
+        self.frame: Optional[str] = None
+
+
+class Subscriber:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=BOARD_STREAM_QUEUE_SIZE)
+
+        # Set when the queue overflowed: events were lost,
+        # the client needs a fresh snapshot
+        self.lagged = False
+        self.closed = False
+
+    def deliver(self, event: Optional[BoardEvent]):
+        # Runs on the subscriber's loop; None = stream closed
+        if event is None:
+            self.closed = True
+
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.lagged = True
+
+
+class BoardStream:
+    def __init__(self, buffer_size: int):
+        self._lock = threading.Lock()
+        self.stream_id = uuid.uuid4().hex[:8]
+        self._seq = 0
+        self._buffer: deque[BoardEvent] = deque(maxlen=buffer_size)
+        self._subscribers: set[Subscriber] = set()
+
+        # Stats
+        self.published = 0
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    def event_id(self, seq: int) -> str:
+        return f"{self.stream_id}:{seq}"
+
+    def parse_event_id(self, event_id: Optional[str]) -> Optional[int]:
+        """
+        Sequence number of one of our ids, else None.
+        """
+        stream_id, _, seq = (event_id or "").partition(":")
+        if stream_id != self.stream_id or not seq.isdigit():
+            return None
+        return int(seq)
+
+    # ======================================================
+    # PUBLISH (any thread)
+    # ======================================================
+    def publish_unit(self, unit_id: int, stay: Optional[Stay]):
+        """
+        Unit changed status; stay is its active stay or None.
+        """
+        self._publish("unit", unit_id, detached_copy(stay) if stay else None)
+
+    def publish_reset(self):
+        self._publish("reset", None, None)
+
+    def _publish(self, kind: str, unit_id: Optional[int], stay: Optional[Stay]):
+        with self._lock:
+            self._seq += 1
+            event = BoardEvent(self._seq, kind, unit_id, stay)
+            self._buffer.append(event)
+            self.published += 1
+            subscribers = list(self._subscribers)
+
+        for subscriber in subscribers:
+            notify(subscriber, event)
+
+    # ======================================================
+    # SUBSCRIBE (event loop)
+    # ======================================================
+    def subscribe(self, last_event_id: Optional[str]) -> tuple[Subscriber, Optional[list[BoardEvent]], int]:
+        """
+        Register a subscriber and return (subscriber, missed, seq).
+
+        missed is the list of events after last_event_id, or None
+        when they are no longer buffered (send a snapshot).
+        seq is the sequence number the snapshot stands for.
+        """
+        subscriber = Subscriber(asyncio.get_running_loop())
+        last_seq = self.parse_event_id(last_event_id)
+
+        with self._lock:
+            self._subscribers.add(subscriber)
+            missed = self._events_after(last_seq)
+            return subscriber, missed, self._seq
+
+    def unsubscribe(self, subscriber: Subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def resync(self, subscriber: Subscriber) -> int:
+        """
+        Drop whatever a lagging subscriber has queued; the
+        caller sends a snapshot for the returned seq.
+        """
+        with self._lock:
+            while not subscriber.queue.empty():
+                subscriber.queue.get_nowait()
+            subscriber.lagged = False
+            return self._seq
+
+    def _events_after(self, last_seq: Optional[int]) -> Optional[list[BoardEvent]]:
+        if last_seq is None or last_seq > self._seq:
+            return None
+
+        if last_seq == self._seq:
+            return []
+
+        oldest = self._buffer[0].seq if self._buffer else self._seq + 1
+        if last_seq + 1 < oldest:
+            return None
+
+        return [event for event in self._buffer if event.seq > last_seq]
+
+    def close(self):
+        """
+        End every open stream (shutdown).
+        """
+        with self._lock:
+            subscribers = list(self._subscribers)
+            self._subscribers.clear()
+
+        for subscriber in subscribers:
+            notify(subscriber, None)
+
+    def stats(self):
+        return {
+            "stream_id": self.stream_id,
+            "seq": self._seq,
+            "buffered": len(self._buffer),
+            "buffer_size": self._buffer.maxlen,
+            "subscribers": len(self._subscribers),
+            "published": self.published,
+        }
+
+
+def notify(subscriber: Subscriber, event: Optional[BoardEvent]):
+    try:
+        subscriber.loop.call_soon_threadsafe(subscriber.deliver, event)
+    except RuntimeError:
+        # Loop already closed (client gone during shutdown)
+        pass
+
+
+board_stream = BoardStream(BOARD_STREAM_BUFFER_SIZE)
@@ -0,0 +1,235 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import Optional
+
+from sqlalchemy import delete, event, func, insert
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, select
+
+from app.core.config import (
+    SYNC_COMPACT_INTERVAL_SECONDS,
+    SYNC_LOG_RETENTION_DAYS,
+    SYNC_MAX_CHANGES,
+)
+from app.core.database import engine
+from app.core.periodic import PeriodicJob
+from app.models.change_log import ChangeLog, ChangeLogCompaction
+from app.models.stay import Stay
+from app.models.unit import Unit
+from app.services.stay_archive import history_models
+
+logger = logging.getLogger("sukha.sync")
+
+
+# ======================================================
+# CHANGE LOG / DELTA SYNC
+#
+# Every flush that writes units or stays appends one
+# entry per written row (entity, id) in the same
+# transaction: check-in, checkout, bulk and async routes
+# alike. SQLite serialises writers, so entry ids grow in
+# commit order and "entries after cursor N" is exactly
+# what a client holding N has not seen.
+#
+# A delta sends the current row of every entity changed
+# since the cursor (or its id under "deleted"), so the
+# response grows with the changes, not the dataset.
+#
+# Compaction keeps only the newest entry per entity and
+# drops entries older than SYNC_LOG_RETENTION_DAYS.
+# Clients with a cursor from before the dropped entries
+# (or none, or one from another database) get a full
+# snapshot.
+#
+# Rows written without the ORM (seeders, imports) are not
+# logged; moving stays to the archive is not a change.
+# ======================================================
+
+SYNCED_MODELS = {
+    Unit: "unit",
+    Stay: "stay",
+}
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _log_changes(session, flush_context):
+    changed = set()
+
+    for target in chain(session.new, session.dirty, session.deleted):
+        entity = SYNCED_MODELS.get(type(target))
+        if entity is None:
+            continue
+        if target in session.dirty and not session.is_modified(target):
+            continue
+        changed.add((entity, target.id))
+
+    if not changed:
+        return
+
+    now = datetime.utcnow()
+    session.connection().execute(
+        insert(ChangeLog.__table__),
+        [
+            {"entity": entity, "entity_id": entity_id, "changed_at": now}
+            for entity, entity_id in sorted(changed)
+        ],
+    )
+
+
+# ======================================================
+# READ (GET /sync)
+# ======================================================
+
+def compacted_through(session: Session) -> int:
+    return session.exec(
+        select(func.coalesce(func.max(ChangeLogCompaction.compacted_through), 0))
+    ).one()
+
+
+def latest_cursor(session: Session) -> int:
+    newest = session.exec(select(func.max(ChangeLog.id))).one()
+    return max(newest or 0, compacted_through(session))
+
+
+def sync_changes(session: Session, since: Optional[int]) -> dict:
+    """
+    Everything a client holding cursor `since` is missing:
+    a delta when the log still covers it, else a snapshot.
+    """
+    head = latest_cursor(session)
+
+    if since is None or since < compacted_through(session) or since > head:
+        return sync_snapshot(session, head)
+
+    entries = session.exec(
+        select(ChangeLog.id, ChangeLog.entity, ChangeLog.entity_id)
+        .where(ChangeLog.id > since)
+        .order_by(ChangeLog.id)
+        .limit(SYNC_MAX_CHANGES)
+    ).all()
+
+    if not entries:
+        return build_sync_response("delta", since, [], [])
+
+    ids = {"unit": set(), "stay": set()}
+    for _, entity, entity_id in entries:
+        ids[entity].add(entity_id)
+
+    # Rows read after the entries: a change in between is
+    # sent now and again next time, never lost
+    units = []
+    if ids["unit"]:
+        units = session.exec(select(Unit).where(Unit.id.in_(ids["unit"]))).all()
+
+    stays = []
+    missing = set(ids["stay"])
+    for model in history_models(None):
+        if not missing:
+            break
+        found = session.exec(select(model).where(model.id.in_(missing))).all()
+        stays += found
+        missing -= {stay.id for stay in found}
+
+    response = build_sync_response("delta", entries[-1][0], units, stays)
+    response["deleted"] = {
+        "units": sorted(ids["unit"] - {unit.id for unit in units}),
+        "stays": sorted(missing),
+    }
+    response["has_more"] = len(entries) == SYNC_MAX_CHANGES
+    return response
+
+
+def sync_snapshot(session: Session, head: int) -> dict:
+    """
+    All units and active stays, with the cursor read
+    before them (see sync_changes).
+    """
+    units = session.exec(select(Unit).order_by(Unit.id)).all()
+    stays = session.exec(
+        select(Stay).where(Stay.status == "active").order_by(Stay.id)
+    ).all()
+
+    return build_sync_response("snapshot", head, units, stays)
+
+
+def build_sync_response(mode: str, cursor: int, units, stays) -> dict:
+    return {
+        "mode": mode,
+        "cursor": cursor,
+        "has_more": False,
+        "units": units,
+        "stays": stays,
+        "deleted": {"units": [], "stays": []},
+    }
+
+
+# ======================================================
+# COMPACTION
+# ======================================================
+
+def compact_change_log(
+    session: Session, retention_days: int = SYNC_LOG_RETENTION_DAYS
+) -> dict:
+    started = time.perf_counter()
+    table = ChangeLog.__table__
+
+    # A delta sends current rows, so an older entry of an
+    # entity changed again later adds nothing
+    newest = select(func.max(table.c.id)).group_by(table.c.entity, table.c.entity_id)
+    superseded = session.connection().execute(
+        delete(table).where(table.c.id.not_in(newest))
+    ).rowcount
+
+    # Ids grow with time: the expired entries are a prefix
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    first_kept = session.exec(
+        select(ChangeLog.id)
+        .where(ChangeLog.changed_at >= cutoff)
+        .order_by(ChangeLog.id)
+        .limit(1)
+    ).first()
+
+    last_expired = select(func.max(ChangeLog.id))
+    if first_kept is not None:
+        last_expired = last_expired.where(ChangeLog.id < first_kept)
+    through = session.exec(last_expired).one()
+
+    expired = 0
+    if through is not None:
+        expired = session.connection().execute(
+            delete(table).where(table.c.id <= through)
+        ).rowcount
+        session.add(ChangeLogCompaction(compacted_through=through))
+
+    session.commit()
+
+    return {
+        "superseded": superseded,
+        "expired": expired,
+        "compacted_through": compacted_through(session),
+        "ms": round((time.perf_counter() - started) * 1000, 3),
+    }
+
+
+def run_change_log_compaction(stop: threading.Event) -> dict:
+    with Session(engine) as session:
+        result = compact_change_log(session)
+
+    if result["superseded"] or result["expired"]:
+        logger.info(
+            "Compacted change log: %d superseded, %d expired entries in %.0f ms",
+            result["superseded"],
+            result["expired"],
+            result["ms"],
+        )
+    return result
+
+
+change_log_compactor = PeriodicJob(
+    "change-log-compaction",
+    SYNC_COMPACT_INTERVAL_SECONDS,
+    run_change_log_compaction,
+)
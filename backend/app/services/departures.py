@@ -0,0 +1,152 @@
+import logging
+import time
+from datetime import date
+
+from sqlalchemy import bindparam, or_, update
+from sqlmodel import Session, select
+
+from app.core.database import engine
+from app.models.stay import Stay
+from app.models.unit import Unit
+
+logger = logging.getLogger("sukha.departures")
+
+
+# ======================================================
+# ARRIVALS / DEPARTURES
+# Front-desk lists straight off the indexes:
+#   departures, overdue → (status, estimated_checkout_date)
+#   arrivals            → (check_in_date)
+# ======================================================
+
+def front_desk_statement():
+    return (
+        select(Stay, Unit.unit_number, Unit.property_name)
+        .join(Unit, Unit.id == Stay.unit_id)
+    )
+
+
+def departures_statement(day: date):
+    return (
+        front_desk_statement()
+        .where(
+            Stay.status == "active",
+            Stay.estimated_checkout_date == day,
+        )
+        .order_by(Stay.id)
+    )
+
+
+def overdue_statement(today: date):
+    return (
+        front_desk_statement()
+        .where(
+            Stay.status == "active",
+            Stay.estimated_checkout_date < today,
+        )
+        .order_by(Stay.estimated_checkout_date, Stay.id)
+    )
+
+
+def arrivals_statement(day: date):
+    return (
+        front_desk_statement()
+        .where(Stay.check_in_date == day)
+        .order_by(Stay.id)
+    )
+
+
+def build_front_desk_row(stay: Stay, unit_number: str, property_name: str, today: date):
+    estimated = stay.estimated_checkout_date
+
+    return {
+        "stay_id": stay.id,
+        "unit_id": stay.unit_id,
+        "unit_number": unit_number,
+        "property_name": property_name,
+        "guest_name": stay.guest_name,
+        "guest_source": stay.guest_source,
+        "stay_type": stay.stay_type,
+        "status": stay.status,
+        "check_in_date": stay.check_in_date,
+        "estimated_checkout": estimated,
+        "days_overdue": max((today - estimated).days, 0)
+        if estimated and stay.status == "active"
+        else 0,
+    }
+
+
+# ======================================================
+# BACKFILL
+# Stays written before the column existed (or by Core
+# inserts) get their estimated checkout once, in id
+# order batches. Stays with nothing to estimate from
+# stay NULL, exactly as estimated_checkout() returns.
+# ======================================================
+
+BACKFILL_BATCH_SIZE = 10_000
+
+
+def backfill_estimated_checkout(session: Session) -> dict:
+    started = time.perf_counter()
+
+    table = Stay.__table__
+    statement = (
+        update(table)
+        .where(table.c.id == bindparam("stay_id"))
+        .values(estimated_checkout_date=bindparam("estimated"))
+    )
+
+    updated = 0
+    after_id = 0
+
+    while True:
+        stays = session.exec(
+            select(
+                Stay.id,
+                Stay.stay_type,
+                Stay.check_in_date,
+                Stay.check_out_date,
+                Stay.planned_months,
+            )
+            .where(
+                Stay.id > after_id,
+                Stay.estimated_checkout_date.is_(None),
+                or_(
+                    Stay.check_out_date.is_not(None),
+                    Stay.planned_months.is_not(None),
+                ),
+            )
+            .order_by(Stay.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+
+        if not stays:
+            break
+
+        rows = [
+            {"stay_id": stay.id, "estimated": Stay.estimated_checkout(stay)}
+            for stay in stays
+        ]
+        session.connection().execute(statement, rows)
+        session.commit()
+
+        updated += len(rows)
+        after_id = stays[-1].id
+
+    return {
+        "updated": updated,
+        "ms": round((time.perf_counter() - started) * 1000, 3),
+    }
+
+
+def load_estimated_checkout():
+    with Session(engine) as session:
+        result = backfill_estimated_checkout(session)
+
+    if result["updated"]:
+        logger.info(
+            "Stored estimated checkout for %d stays in %.0f ms",
+            result["updated"],
+            result["ms"],
+        )
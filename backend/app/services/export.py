@@ -0,0 +1,82 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+
+from sqlmodel import Session
+
+from app.core.database import read_engine
+
+
+# ======================================================
+# STREAMING EXPORT (CSV / NDJSON)
+# Rows are pulled from the database in chunks and
+# written out chunk by chunk, so memory stays flat no
+# matter how many rows the table has.
+# ======================================================
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+CHUNK_SIZE = 1000
+
+
+def plain_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def stream_export(statements: list, fmt: str):
+    """
+    Generator for StreamingResponse. Opens its own session
+    so it outlives the request's dependencies. The
+    statements (same columns) are read one after another,
+    as one file.
+    """
+    with Session(read_engine) as session:
+        # All started up front: open together, they read the
+        # same snapshot of the database
+        results = [
+            session.exec(statement.execution_options(yield_per=CHUNK_SIZE))
+            for statement in statements
+        ]
+        columns = list(results[0].keys())
+        partitions = (rows for result in results for rows in result.partitions())
+
+        if fmt == "csv":
+            yield from csv_chunks(partitions, columns)
+        else:
+            yield from ndjson_chunks(partitions, columns)
+
+
+def csv_chunks(partitions, columns):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+
+    for rows in partitions:
+        for row in rows:
+            writer.writerow(
+                ["" if value is None else plain_value(value) for value in row]
+            )
+
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def ndjson_chunks(partitions, columns):
+    for rows in partitions:
+        yield "".join(
+            json.dumps(
+                {column: plain_value(value) for column, value in zip(columns, row)}
+            )
+            + "\n"
+            for row in rows
+        )
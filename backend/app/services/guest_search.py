@@ -0,0 +1,400 @@
+import logging
+import re
+import threading
+import time
+import unicodedata
+from typing import Optional
+
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from app.core.database import engine
+from app.models.unit import Unit
+from app.services.stay_archive import history_models
+
+logger = logging.getLogger("sukha.search")
+
+
+# ======================================================
+# GUEST SEARCH (SQLite FTS5)
+#
+# stay_fts holds, per stay (rowid = stay.id), the guest
+# name and the unit number and property it stayed in.
+# SQLite triggers keep it in step with every write, ORM
+# or Core (seeders, imports) alike, inside the same
+# transaction.
+#
+# Matches come in tiers, newest stay first inside each:
+#   1. the words, exactly, in the guest name
+#   2. the words, exactly, in any field
+#   3. every word as a prefix ("nai" → Nair)
+#   4. only when nothing matched: fuzzy, each word
+#      replaced by the indexed terms within a small edit
+#      distance ("shrama" → sharma)
+# Each tier walks the index in rowid (= stay id) order and
+# stops after `limit` rows, so the cost does not depend on
+# how many stays share a common name. (bm25 ranking would
+# score every one of them.)
+#
+# Archived stays stay in the index: moving a stay to
+# stay_archive deletes it from stay only after copying
+# it, and the delete trigger skips ids found there.
+#
+# Other databases (no FTS5) fall back to LIKE on the
+# guest name.
+# ======================================================
+
+SCHEMA = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS stay_fts USING fts5(
+        guest_name,
+        unit_number,
+        property_name,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3'
+    )
+    """,
+    "CREATE VIRTUAL TABLE IF NOT EXISTS stay_fts_vocab USING fts5vocab(stay_fts, 'row')",
+    """
+    CREATE TRIGGER IF NOT EXISTS stay_fts_insert AFTER INSERT ON stay BEGIN
+        INSERT INTO stay_fts (rowid, guest_name, unit_number, property_name)
+        SELECT new.id, new.guest_name, unit.unit_number, unit.property_name
+        FROM unit WHERE unit.id = new.unit_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS stay_fts_update AFTER UPDATE OF guest_name, unit_id ON stay BEGIN
+        DELETE FROM stay_fts WHERE rowid = old.id;
+        INSERT INTO stay_fts (rowid, guest_name, unit_number, property_name)
+        SELECT new.id, new.guest_name, unit.unit_number, unit.property_name
+        FROM unit WHERE unit.id = new.unit_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS stay_fts_delete AFTER DELETE ON stay
+    WHEN NOT EXISTS (SELECT 1 FROM stay_archive WHERE id = old.id) BEGIN
+        DELETE FROM stay_fts WHERE rowid = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS stay_fts_unit_update
+    AFTER UPDATE OF unit_number, property_name ON unit BEGIN
+        UPDATE stay_fts
+        SET unit_number = new.unit_number, property_name = new.property_name
+        WHERE rowid IN (
+            SELECT id FROM stay WHERE unit_id = new.id
+            UNION ALL
+            SELECT id FROM stay_archive WHERE unit_id = new.id
+        );
+    END
+    """,
+]
+
+POPULATE = """
+    INSERT INTO stay_fts (rowid, guest_name, unit_number, property_name)
+    SELECT stay.id, stay.guest_name, unit.unit_number, unit.property_name
+    FROM stay JOIN unit ON unit.id = stay.unit_id
+    UNION ALL
+    SELECT stay_archive.id, stay_archive.guest_name, unit.unit_number, unit.property_name
+    FROM stay_archive JOIN unit ON unit.id = stay_archive.unit_id
+"""
+
+# Dropped and created again on every start, so existing
+# databases pick up changed trigger bodies
+TRIGGERS = [
+    "stay_fts_insert",
+    "stay_fts_update",
+    "stay_fts_delete",
+    "stay_fts_unit_update",
+]
+
+
+def fts_available(bind) -> bool:
+    if bind.dialect.name != "sqlite":
+        return False
+
+    with bind.connect() as conn:
+        return bool(
+            conn.exec_driver_sql(
+                "SELECT sqlite_compileoption_used('ENABLE_FTS5')"
+            ).scalar()
+        )
+
+
+class SearchIndexState:
+    # Set once the index and its triggers exist
+    ready = False
+
+
+search_index = SearchIndexState()
+
+
+# ======================================================
+# SETUP (startup)
+# Creates the index and triggers; the first time, fills
+# the index from the existing history (both tables) in
+# one statement.
+# ======================================================
+
+def create_guest_search_index():
+    if not fts_available(engine):
+        logger.info("FTS5 not available, guest search uses LIKE")
+        return
+
+    started = time.perf_counter()
+
+    with engine.begin() as conn:
+        exists = conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stay_fts'"
+        ).first()
+
+        for name in TRIGGERS:
+            conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name}")
+
+        for statement in SCHEMA:
+            conn.exec_driver_sql(statement)
+
+        if not exists:
+            conn.exec_driver_sql(POPULATE)
+            logger.info(
+                "Built guest search index in %.0f ms",
+                (time.perf_counter() - started) * 1000,
+            )
+
+    search_index.ready = True
+
+    # Load the fuzzy vocabulary now, not on the first typo
+    with Session(engine) as session:
+        vocabulary.current(session)
+
+
+# ======================================================
+# SEARCH
+# ======================================================
+
+MAX_QUERY_WORDS = 6
+
+# unicode61 splits on everything but letters and digits
+WORD = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def query_words(query: str) -> list[str]:
+    return [fold(word) for word in WORD.findall(query)][:MAX_QUERY_WORDS]
+
+
+def fold(word: str) -> str:
+    """
+    Lowercase without diacritics, as the index stores terms.
+    """
+    decomposed = unicodedata.normalize("NFKD", word.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def quoted(word: str) -> str:
+    # Quoted, so user input can never be FTS5 syntax
+    return f'"{word}"'
+
+
+def match_tiers(words: list[str]) -> list[tuple[str, str]]:
+    exact = " AND ".join(quoted(word) for word in words)
+
+    # One letter as a prefix matches half the index: exact only
+    prefix = " AND ".join(
+        quoted(word) + ("*" if len(word) > 1 else "") for word in words
+    )
+
+    return [
+        ("name", f"guest_name : ({exact})"),
+        ("exact", exact),
+        ("prefix", prefix),
+    ]
+
+
+def search_stays(session: Session, query: str, limit: int) -> tuple[str, list]:
+    """
+    (mode, rows) where rows are (stay, unit_number,
+    property_name, match) best first, the stay from either
+    table; mode is "fts" or "like", match the tier that
+    found the stay.
+    """
+    words = query_words(query)
+    if not words:
+        return "fts", []
+
+    if not search_index.ready:
+        return "like", [(*row, "like") for row in like_search(session, words, limit)]
+
+    found: dict[int, str] = {}
+
+    for tier, expression in match_tiers(words):
+        add_matches(session, found, tier, expression, limit)
+        if len(found) >= limit:
+            break
+
+    if not found:
+        expression = fuzzy_expression(session, words)
+        if expression:
+            add_matches(session, found, "fuzzy", expression, limit)
+
+    return "fts", load_matches(session, found)
+
+
+def add_matches(session: Session, found: dict, tier: str, expression: str, limit: int):
+    # Ask for enough rows to fill up after skipping the
+    # stays an earlier tier already found
+    stay_ids = session.connection().execute(
+        text(
+            "SELECT rowid FROM stay_fts WHERE stay_fts MATCH :expression "
+            "ORDER BY rowid DESC LIMIT :limit"
+        ),
+        {"expression": expression, "limit": limit},
+    ).scalars()
+
+    for stay_id in stay_ids:
+        if len(found) >= limit:
+            break
+        found.setdefault(stay_id, tier)
+
+
+def load_matches(session: Session, found: dict) -> list:
+    rows = []
+    missing = list(found)
+
+    # Recent stays first, the archive only for the rest
+    for model in history_models(None):
+        if not missing:
+            break
+        rows += session.exec(
+            select(model, Unit.unit_number, Unit.property_name)
+            .join(Unit, Unit.id == model.unit_id)
+            .where(model.id.in_(missing))
+        ).all()
+        loaded = {row[0].id for row in rows}
+        missing = [stay_id for stay_id in missing if stay_id not in loaded]
+
+    order = {stay_id: position for position, stay_id in enumerate(found)}
+    rows = sorted(rows, key=lambda row: order[row[0].id])
+    return [(*row, found[row[0].id]) for row in rows]
+
+
+def like_search(session: Session, words: list[str], limit: int) -> list:
+    rows = []
+
+    for model in history_models(None):
+        statement = (
+            select(model, Unit.unit_number, Unit.property_name)
+            .join(Unit, Unit.id == model.unit_id)
+            .order_by(model.id.desc())
+            .limit(limit)
+        )
+        for word in words:
+            statement = statement.where(model.guest_name.ilike(f"%{word}%"))
+
+        rows += session.exec(statement).all()
+
+    rows.sort(key=lambda row: row[0].id, reverse=True)
+    return rows[:limit]
+
+
+# ======================================================
+# FUZZY MATCHING
+# Candidate terms come from the index vocabulary, so a
+# typo only ever expands to words that really occur.
+#
+# Reading fts5vocab walks the whole index, so the terms
+# are kept in memory: loaded once, then topped up from
+# the stays added since (new rowids), tokenized here the
+# way unicode61 does.
+# ======================================================
+
+class Vocabulary:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.terms: set[str] = set()
+        self.max_rowid: Optional[int] = None
+
+    def current(self, session: Session) -> set[str]:
+        conn = session.connection()
+
+        with self._lock:
+            if self.max_rowid is None:
+                self.max_rowid = conn.exec_driver_sql(
+                    "SELECT coalesce(max(rowid), 0) FROM stay_fts"
+                ).scalar()
+                self.terms = set(
+                    conn.exec_driver_sql("SELECT term FROM stay_fts_vocab").scalars()
+                )
+                return self.terms
+
+            new_rows = conn.execute(
+                text(
+                    "SELECT rowid, guest_name, unit_number, property_name "
+                    "FROM stay_fts WHERE rowid > :after ORDER BY rowid"
+                ),
+                {"after": self.max_rowid},
+            ).all()
+
+            for rowid, *fields in new_rows:
+                for field in fields:
+                    self.terms.update(fold(word) for word in WORD.findall(field or ""))
+                self.max_rowid = rowid
+
+            return self.terms
+
+
+vocabulary = Vocabulary()
+
+
+def max_distance(word: str) -> int:
+    return 1 if len(word) <= 4 else 2
+
+
+def fuzzy_expression(session: Session, words: list[str]) -> str:
+    terms = vocabulary.current(session)
+
+    groups = []
+    for word in words:
+        distance = max_distance(word)
+        candidates = [
+            term
+            for term in terms
+            if abs(len(term) - len(word)) <= distance
+            and edit_distance(word, term, distance) <= distance
+        ]
+        if candidates:
+            groups.append("(" + " OR ".join(quoted(term) for term in candidates) + ")")
+
+    return " AND ".join(groups)
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Levenshtein distance counting a swap of two neighbours
+    as one edit ("niar" → nair). Gives up (limit + 1) as
+    soon as every path is already over the limit.
+    """
+    before_previous = None
+    previous = list(range(len(b) + 1))
+
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            cost = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            )
+            if (
+                before_previous
+                and j > 1
+                and char_a == b[j - 2]
+                and a[i - 2] == char_b
+            ):
+                cost = min(cost, before_previous[j - 2] + 1)
+            current.append(cost)
+
+        if min(current) > limit:
+            return limit + 1
+        before_previous, previous = previous, current
+
+    return previous[-1]
@@ -0,0 +1,376 @@
+import heapq
+import threading
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import event, insert, inspect
+from sqlmodel import Session, select
+
+from app.core.database import engine, read_engine
+from app.models.housekeeping_task import HousekeepingTask
+from app.models.stay import Stay
+from app.models.unit import Unit
+from app.services.occupancy import occupancy_index
+
+
+# ======================================================
+# HOUSEKEEPING QUEUE
+#
+# Checkout leaves the unit to clean: a mapper event adds
+# a HousekeepingTask in the same flush (sync, async and
+# bulk routes alike), at most one open task per unit.
+#
+# Pending tasks wait in process-local heaps, one per
+# floor, ordered by urgency:
+#   1. the unit's next arrival (its active stay's
+#      check-in; a guest already in comes first, units
+#      nobody is booked into come last)
+#   2. the arriving guest's source (retreat guests first)
+#   3. oldest task first
+# A second heap holds each floor's best task, so the most
+# urgent floor is found without looking at every floor.
+#
+# A housekeeper keeps working their current floor while
+# it has a task due the same day as the most urgent one,
+# then moves on: less walking, nobody arrives to a dirty
+# room. Claiming the next task is O(log n).
+#
+# Changed priorities (a check-in into a unit waiting to
+# be cleaned) and tasks finished straight from the list
+# are handled by lazy deletion: the old heap entries stay
+# and are skipped when they surface.
+#
+# NOTE: one queue per process, like the occupancy index.
+# ======================================================
+
+# Lower = cleaned first; unknown sources after these
+SOURCE_PRIORITY = {
+    "ayursiha": 0,
+    "sukha": 1,
+}
+
+NO_ARRIVAL = date.max.toordinal()
+
+
+@event.listens_for(Stay, "after_update")
+def _task_for_checkout(mapper, connection, target):
+    history = inspect(target).attrs.status.history
+    if target.status != "completed" or "active" not in history.deleted:
+        return
+
+    open_task = connection.execute(
+        select(HousekeepingTask.id).where(
+            HousekeepingTask.unit_id == target.unit_id,
+            HousekeepingTask.status != "done",
+        )
+    ).first()
+
+    if open_task is None:
+        connection.execute(
+            insert(HousekeepingTask.__table__).values(
+                unit_id=target.unit_id,
+                stay_id=target.id,
+                status="pending",
+                created_at=datetime.utcnow(),
+            )
+        )
+
+
+class QueuedTask:
+    __slots__ = (
+        "task_id",
+        "unit_id",
+        "unit_number",
+        "floor",
+        "created_at",
+        "key",
+        "version",
+    )
+
+    def __init__(self, task_id, unit_id, unit_number, floor, created_at):
+        self.task_id = task_id
+        self.unit_id = unit_id
+        self.unit_number = unit_number
+
+        # (property_name, building_name, floor_number)
+        self.floor = floor
+        self.created_at = created_at
+
+        # (arrival ordinal, source rank, task id); bumped
+        # version = older heap entries are stale
+        self.key: tuple = ()
+        self.version = 0
+
+    @property
+    def next_arrival(self) -> Optional[date]:
+        if self.key[0] == NO_ARRIVAL:
+            return None
+        return date.fromordinal(self.key[0])
+
+
+class HousekeepingQueue:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.loaded = False
+
+        # task_id → pending task
+        self._tasks: dict[int, QueuedTask] = {}
+
+        # unit_id → its pending task_id
+        self._by_unit: dict[int, int] = {}
+
+        # floor → heap of (key, version)
+        self._floors: dict[tuple, list] = {}
+
+        # heap of (key, floor): each floor's best task
+        self._floor_tops: list = []
+
+        # housekeeper user id → floor of their last task
+        self._location: dict[int, tuple] = {}
+
+        # Stats
+        self.claimed = 0
+        self.reprioritized = 0
+        self.stale_skipped = 0
+
+    # ======================================================
+    # LOAD / REBUILD
+    # ======================================================
+    def rebuild(self, session: Session):
+        rows = session.exec(
+            select(
+                HousekeepingTask.id,
+                HousekeepingTask.unit_id,
+                HousekeepingTask.created_at,
+                Unit.unit_number,
+                Unit.property_name,
+                Unit.building_name,
+                Unit.floor_number,
+            )
+            .join(Unit, Unit.id == HousekeepingTask.unit_id)
+            .where(HousekeepingTask.status == "pending")
+        ).all()
+
+        with self._lock:
+            self._tasks = {}
+            self._by_unit = {}
+            self._floors = {}
+            self._floor_tops = []
+
+            for row in rows:
+                self._add(queued_task(row))
+
+            self.loaded = True
+
+    def _ensure_loaded(self):
+        if not self.loaded:
+            with Session(read_engine) as session:
+                self.rebuild(session)
+
+    # ======================================================
+    # WRITE-THROUGH (call after commit)
+    # ======================================================
+    def record_checkout(self, stay: Stay):
+        """
+        Queue the task the checkout created, if any. Not
+        loaded yet: the first read loads it with the rest.
+        """
+        if not self.loaded:
+            return
+
+        with Session(read_engine) as session:
+            row = session.exec(
+                select(
+                    HousekeepingTask.id,
+                    HousekeepingTask.unit_id,
+                    HousekeepingTask.created_at,
+                    Unit.unit_number,
+                    Unit.property_name,
+                    Unit.building_name,
+                    Unit.floor_number,
+                )
+                .join(Unit, Unit.id == HousekeepingTask.unit_id)
+                .where(
+                    HousekeepingTask.unit_id == stay.unit_id,
+                    HousekeepingTask.status == "pending",
+                )
+            ).first()
+
+        if row is None:
+            return
+
+        with self._lock:
+            if row.id not in self._tasks:
+                self._add(queued_task(row))
+
+    def record_check_in(self, stay: Stay):
+        """
+        A guest is due in a unit still waiting to be
+        cleaned: move its task up.
+        """
+        with self._lock:
+            task_id = self._by_unit.get(stay.unit_id)
+            if task_id is not None:
+                self._push(self._tasks[task_id])
+                self.reprioritized += 1
+
+    def remove(self, task_id: int):
+        """
+        Finished without being claimed from the queue.
+        """
+        with self._lock:
+            task = self._tasks.pop(task_id, None)
+            if task is not None:
+                del self._by_unit[task.unit_id]
+
+    # ======================================================
+    # READ
+    # ======================================================
+    def peek(self, user_id: int) -> Optional[QueuedTask]:
+        """
+        The task claim() would hand this housekeeper now.
+        """
+        self._ensure_loaded()
+
+        with self._lock:
+            floor = self._floor_for(user_id)
+            if floor is None:
+                return None
+            return self._tasks[self._floor_top(floor)[0][-1]]
+
+    def claim(self, user_id: int) -> Optional[QueuedTask]:
+        """
+        Take this housekeeper's next task off the queue.
+        """
+        self._ensure_loaded()
+
+        with self._lock:
+            floor = self._floor_for(user_id)
+            if floor is None:
+                return None
+
+            heap = self._floors[floor]
+            key, _ = heapq.heappop(heap)
+            task = self._tasks.pop(key[-1])
+            del self._by_unit[task.unit_id]
+
+            # The floor's next task becomes its best
+            top = self._floor_top(floor)
+            if top is not None:
+                heapq.heappush(self._floor_tops, (top[0], floor))
+
+            self._location[user_id] = floor
+            self.claimed += 1
+            return task
+
+    def pending(self, limit: int) -> list[QueuedTask]:
+        """
+        Pending tasks, most urgent first (floors ignored).
+        """
+        self._ensure_loaded()
+
+        with self._lock:
+            return heapq.nsmallest(limit, self._tasks.values(), key=lambda task: task.key)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "loaded": self.loaded,
+                "pending": len(self._tasks),
+                "floors": sum(1 for heap in self._floors.values() if heap),
+                "claimed": self.claimed,
+                "reprioritized": self.reprioritized,
+                "stale_skipped": self.stale_skipped,
+            }
+
+    # ======================================================
+    # HEAPS (call with the lock held)
+    # ======================================================
+    def _add(self, task: QueuedTask):
+        self._tasks[task.task_id] = task
+        self._by_unit[task.unit_id] = task.task_id
+        self._push(task)
+
+    def _push(self, task: QueuedTask):
+        task.version += 1
+        task.key = priority(task)
+
+        heap = self._floors.setdefault(task.floor, [])
+        heapq.heappush(heap, (task.key, task.version))
+
+        if self._floor_top(task.floor)[0] == task.key:
+            heapq.heappush(self._floor_tops, (task.key, task.floor))
+
+    def _is_current(self, entry: tuple) -> bool:
+        key, version = entry
+        task = self._tasks.get(key[-1])
+        return task is not None and task.version == version
+
+    def _floor_top(self, floor: tuple) -> Optional[tuple]:
+        heap = self._floors.get(floor)
+        while heap and not self._is_current(heap[0]):
+            heapq.heappop(heap)
+            self.stale_skipped += 1
+        return heap[0] if heap else None
+
+    def _best_floor(self) -> Optional[tuple]:
+        """
+        (key, floor) of the most urgent task anywhere.
+        """
+        while self._floor_tops:
+            key, floor = self._floor_tops[0]
+            top = self._floor_top(floor)
+            if top is not None and top[0] == key:
+                return key, floor
+
+            # The floor's best task changed since: re-file
+            # the floor under its current best
+            heapq.heappop(self._floor_tops)
+            if top is not None:
+                heapq.heappush(self._floor_tops, (top[0], floor))
+        return None
+
+    def _floor_for(self, user_id: int) -> Optional[tuple]:
+        best = self._best_floor()
+        if best is None:
+            return None
+
+        best_key, best_floor = best
+        home = self._location.get(user_id)
+
+        if home is not None and home != best_floor:
+            top = self._floor_top(home)
+            if top is not None and top[0][0] == best_key[0]:
+                return home
+
+        return best_floor
+
+
+def priority(task: QueuedTask) -> tuple:
+    stay = occupancy_index.active_stay(task.unit_id)
+    if stay is None:
+        return NO_ARRIVAL, len(SOURCE_PRIORITY), task.task_id
+
+    return (
+        stay.check_in_date.toordinal(),
+        SOURCE_PRIORITY.get(stay.guest_source, len(SOURCE_PRIORITY)),
+        task.task_id,
+    )
+
+
+def queued_task(row) -> QueuedTask:
+    return QueuedTask(
+        row.id,
+        row.unit_id,
+        row.unit_number,
+        (row.property_name, row.building_name or "", row.floor_number),
+        row.created_at,
+    )
+
+
+housekeeping_queue = HousekeepingQueue()
+
+
+def load_housekeeping_queue():
+    with Session(engine) as session:
+        housekeeping_queue.rebuild(session)
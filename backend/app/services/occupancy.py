@@ -0,0 +1,141 @@
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+from sqlmodel import Session, select
+
+from app.core.database import engine, read_engine
+from app.models.stay import Stay
+
+
+# ======================================================
+# OCCUPANCY INDEX
+# Process-local map: unit_id → active stay.
+#
+# Loaded once at startup, then kept up to date
+# write-through by check-in and checkout, so board and
+# availability reads never touch the stay table.
+#
+# NOTE: one index per process. When running several
+# workers, call the rebuild endpoint after bulk edits
+# made outside the API.
+# ======================================================
+
+class OccupancyIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_unit: dict[int, Stay] = {}
+        self.loaded = False
+
+        # Stats: reads served, and reads that had to load
+        # the index from the database first
+        self.reads = 0
+        self.loads = 0
+        self.rebuilds = 0
+        self.last_rebuild_at: Optional[datetime] = None
+        self.last_rebuild_ms: Optional[float] = None
+
+    # ======================================================
+    # LOAD / REBUILD
+    # ======================================================
+    def rebuild(self, session: Session):
+        started = time.perf_counter()
+
+        statement = (
+            select(Stay)
+            .where(Stay.status == "active")
+            .order_by(Stay.id)
+        )
+        stays = session.exec(statement).all()
+
+        by_unit = {}
+        for stay in stays:
+            # Keep the first active stay per unit
+            by_unit.setdefault(stay.unit_id, detached_copy(stay))
+
+        with self._lock:
+            self._by_unit = by_unit
+            self.loaded = True
+            self.rebuilds += 1
+            self.last_rebuild_at = datetime.utcnow()
+            self.last_rebuild_ms = round(
+                (time.perf_counter() - started) * 1000, 3
+            )
+
+    def _ensure_loaded(self):
+        with self._lock:
+            self.reads += 1
+            if self.loaded:
+                return
+            self.loads += 1
+
+        with Session(read_engine) as session:
+            self.rebuild(session)
+
+    # ======================================================
+    # READS
+    # ======================================================
+    def active_stay(self, unit_id: int) -> Optional[Stay]:
+        self._ensure_loaded()
+        return self._by_unit.get(unit_id)
+
+    def occupied_unit_ids(self) -> set[int]:
+        self._ensure_loaded()
+        with self._lock:
+            return set(self._by_unit)
+
+    def snapshot(self) -> dict[int, Stay]:
+        self._ensure_loaded()
+        with self._lock:
+            return dict(self._by_unit)
+
+    # ======================================================
+    # WRITE-THROUGH (call after commit)
+    # ======================================================
+    def record_check_in(self, stay: Stay):
+        if not self.loaded:
+            return
+
+        with self._lock:
+            self._by_unit.setdefault(stay.unit_id, detached_copy(stay))
+
+    def record_checkout(self, stay: Stay):
+        if not self.loaded:
+            return
+
+        with self._lock:
+            current = self._by_unit.get(stay.unit_id)
+            if current and current.id == stay.id:
+                del self._by_unit[stay.unit_id]
+
+    # ======================================================
+    # STATS (admin endpoint)
+    # ======================================================
+    def stats(self):
+        with self._lock:
+            return {
+                "loaded": self.loaded,
+                "size": len(self._by_unit),
+                "reads": self.reads,
+                "loads": self.loads,
+                "rebuilds": self.rebuilds,
+                "last_rebuild_at": self.last_rebuild_at,
+                "last_rebuild_ms": self.last_rebuild_ms,
+            }
+
+
+def detached_copy(stay: Stay) -> Stay:
+    """
+    Copy a stay out of its session so the index never
+    holds ORM state that could expire or lazy-load.
+    """
+    return Stay(**stay.model_dump())
+
+
+occupancy_index = OccupancyIndex()
+
+
+def load_occupancy_index():
+    with Session(engine) as session:
+        occupancy_index.rebuild(session)
@@ -0,0 +1,452 @@
+import time
+from collections import defaultdict
+from datetime import date
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Optional
+
+from sqlalchemy import String, delete, event, insert, inspect, type_coerce, union_all
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import object_session
+from sqlalchemy.orm.util import identity_key
+from sqlmodel import Session, select
+
+from app.core.database import engine
+from app.models.occupancy_rollup import OccupancyRollup
+from app.models.stay import Stay
+from app.models.unit import Unit
+from app.services.availability import stay_interval
+from app.services.stay_archive import history_models
+
+
+# ======================================================
+# OCCUPANCY ROLLUP
+#
+# Keeps occupancy_rollup in step with the stay table:
+# arrivals are counted when a stay is created, nights,
+# tenant rent and the departure when it is completed.
+# Mapper events run inside the same flush (sync, async
+# and bulk routes alike), as one upsert per change that
+# adds the difference to the affected days.
+#
+# The backfill builds the table from history without
+# expanding stays into nights one by one: every stay is
+# a +1 / -1 pair in a per-group difference map, and one
+# sweep over the change points yields the daily totals.
+# ======================================================
+
+GROUP_FIELDS = ("property_name", "unit_type", "guest_source")
+VALUE_FIELDS = ("occupied_nights", "arrivals", "departures", "tenant_nights", "rent_total")
+NIGHTS, ARRIVALS, DEPARTURES, TENANT_NIGHTS, RENT_TOTAL = range(len(VALUE_FIELDS))
+
+TENANT_STAY_TYPES = ("monthly", "yearly")
+
+# Stay fields the rollup depends on
+TRACKED_FIELDS = (
+    "unit_id",
+    "guest_source",
+    "stay_type",
+    "status",
+    "check_in_date",
+    "check_out_date",
+    "planned_months",
+    "monthly_rent",
+)
+
+
+def empty_values() -> list:
+    return [0, 0, 0, 0, 0.0]
+
+
+def stay_contribution(stay) -> dict[int, list]:
+    """
+    date ordinal → values this stay adds to its group.
+    Works on Stay objects, selected rows and snapshots.
+
+    Active stays only count their arrival: their nights are
+    still open and are added live by the reports.
+    """
+    result = defaultdict(empty_values)
+    result[stay.check_in_date.toordinal()][ARRIVALS] += 1
+
+    if stay.status == "active":
+        return result
+
+    start, end, _ = stay_interval(stay)
+    rent = tenant_rent(stay)
+
+    for day in range(start, end):
+        values = result[day]
+        values[NIGHTS] += 1
+        if rent:
+            values[TENANT_NIGHTS] += 1
+            values[RENT_TOTAL] += rent
+
+    result[end][DEPARTURES] += 1
+    return result
+
+
+def tenant_rent(stay) -> float:
+    if stay.stay_type in TENANT_STAY_TYPES and stay.monthly_rent:
+        return stay.monthly_rent
+    return 0.0
+
+
+# ======================================================
+# INCREMENTAL UPDATES (mapper events)
+# ======================================================
+
+@event.listens_for(Stay, "after_insert")
+def _rollup_new_stay(mapper, connection, target):
+    group = unit_group(
+        connection, target.unit_id, target.guest_source, object_session(target)
+    )
+    if group:
+        apply_changes(connection, {group: stay_contribution(target)})
+
+
+@event.listens_for(Stay, "after_update")
+def _rollup_changed_stay(mapper, connection, target):
+    state = inspect(target)
+    if not any(state.attrs[name].history.has_changes() for name in TRACKED_FIELDS):
+        return
+
+    before = previous_values(state)
+    changes = defaultdict(dict)
+
+    new_group = unit_group(
+        connection, target.unit_id, target.guest_source, object_session(target)
+    )
+    if new_group:
+        merge_into(changes[new_group], stay_contribution(target))
+
+    if before.unit_id == target.unit_id:
+        old_group = new_group and new_group[:2] + (before.guest_source,)
+    else:
+        old_group = unit_group(connection, before.unit_id, before.guest_source)
+    if old_group:
+        merge_into(changes[old_group], stay_contribution(before), sign=-1)
+
+    apply_changes(connection, changes)
+
+
+@event.listens_for(Unit, "after_update")
+def _rollup_moved_unit(mapper, connection, target):
+    """
+    Renamed property or changed unit type: move the unit's
+    whole history to its new group.
+    """
+    state = inspect(target)
+    history = {name: state.attrs[name].history for name in ("property_name", "unit_type")}
+    if not any(item.has_changes() for item in history.values()):
+        return
+
+    old = {
+        name: item.deleted[0] if item.deleted else getattr(target, name)
+        for name, item in history.items()
+    }
+
+    stays = []
+    for model in history_models(None):
+        stays += connection.execute(
+            select(*[getattr(model, name) for name in TRACKED_FIELDS]).where(
+                model.unit_id == target.id
+            )
+        ).all()
+
+    changes = defaultdict(dict)
+    for stay in stays:
+        contribution = stay_contribution(stay)
+        merge_into(
+            changes[(old["property_name"], old["unit_type"], stay.guest_source)],
+            contribution,
+            sign=-1,
+        )
+        merge_into(
+            changes[(target.property_name, target.unit_type, stay.guest_source)],
+            contribution,
+        )
+
+    apply_changes(connection, changes)
+
+
+def previous_values(state) -> SimpleNamespace:
+    """
+    The tracked fields as they were before this flush.
+    """
+    values = {}
+    for name in TRACKED_FIELDS:
+        history = state.attrs[name].history
+        values[name] = history.deleted[0] if history.deleted else getattr(state.object, name)
+    return SimpleNamespace(**values)
+
+
+def unit_group(connection, unit_id: int, guest_source: str, session=None):
+    # Check-in routes have loaded the unit already
+    unit = session.identity_map.get(identity_key(Unit, unit_id)) if session else None
+
+    if unit is None:
+        unit = connection.execute(
+            select(Unit.property_name, Unit.unit_type).where(Unit.id == unit_id)
+        ).first()
+    if unit is None:
+        return None
+    return unit.property_name, unit.unit_type, guest_source
+
+
+def merge_into(target: dict, contribution: dict, sign: int = 1):
+    for day, values in contribution.items():
+        current = target.setdefault(day, empty_values())
+        for i, value in enumerate(values):
+            current[i] += sign * value
+
+
+def apply_changes(connection, changes: dict):
+    """
+    Add {group: {day: values}} to the daily and monthly
+    rows. Days whose changes cancel out are skipped.
+    """
+    rows = []
+    for group, days in changes.items():
+        rows += rollup_rows(group, days.items())
+
+    if rows:
+        connection.execute(upsert_statement(connection.dialect.name), rows)
+
+
+def rollup_rows(group: tuple, days) -> list[dict]:
+    """
+    Daily rows for (ordinal, values) pairs, plus their
+    month totals.
+    """
+    rows = []
+    months = defaultdict(empty_values)
+
+    for day, values in days:
+        if not any(values):
+            continue
+
+        rows.append(rollup_row("day", group, day, values))
+
+        month = months[month_start(day)]
+        for i, value in enumerate(values):
+            month[i] += value
+
+    rows += [
+        rollup_row("month", group, day, values)
+        for day, values in months.items()
+        if any(values)
+    ]
+    return rows
+
+
+@lru_cache(maxsize=4096)
+def month_start(day: int) -> int:
+    return date.fromordinal(day).replace(day=1).toordinal()
+
+
+def rollup_row(granularity: str, group: tuple, day: int, values: list) -> dict:
+    row = dict(zip(GROUP_FIELDS, group))
+    row["granularity"] = granularity
+    row["day"] = date.fromordinal(day)
+    row.update(zip(VALUE_FIELDS, values))
+    row["rent_total"] = round(row["rent_total"], 2)
+    return row
+
+
+def upsert_statement(dialect_name: str):
+    """
+    INSERT ... ON CONFLICT (key) DO UPDATE SET value = value + new.
+    """
+    table = OccupancyRollup.__table__
+    insert_for = postgresql_insert if dialect_name == "postgresql" else sqlite_insert
+
+    statement = insert_for(table)
+    return statement.on_conflict_do_update(
+        index_elements=["granularity", "day", *GROUP_FIELDS],
+        set_={name: table.c[name] + statement.excluded[name] for name in VALUE_FIELDS},
+    )
+
+
+# ======================================================
+# BACKFILL
+# Rebuilds the whole table from the stay history (stay
+# table and archive), for first deployment and for stays
+# written without the ORM (seeders, imports).
+# ======================================================
+
+BACKFILL_BATCH_SIZE = 10_000
+
+
+class GroupDiff:
+    """
+    Difference maps of one group: change of the running
+    totals at each date ordinal, plus per-day counters.
+    """
+
+    def __init__(self):
+        self.nights = defaultdict(int)
+        self.tenant_nights = defaultdict(int)
+        self.rent = defaultdict(float)
+        self.arrivals = defaultdict(int)
+        self.departures = defaultdict(int)
+
+    def add(self, start: int, end: Optional[int], rent: float):
+        """
+        One stay as date ordinals; end is None while active.
+        """
+        self.arrivals[start] += 1
+
+        if end is None:
+            return
+
+        self.nights[start] += 1
+        self.nights[end] -= 1
+        self.departures[end] += 1
+
+        if rent:
+            self.tenant_nights[start] += 1
+            self.tenant_nights[end] -= 1
+            self.rent[start] += rent
+            self.rent[end] -= rent
+
+    def days(self):
+        """
+        Yield (ordinal, values) for every day with activity.
+        """
+        days = defaultdict(empty_values)
+
+        for day, count in self.arrivals.items():
+            days[day][ARRIVALS] = count
+        for day, count in self.departures.items():
+            days[day][DEPARTURES] = count
+
+        points = sorted(self.nights)
+        nights = tenant_nights = 0
+        rent = 0.0
+
+        for i, point in enumerate(points[:-1]):
+            nights += self.nights[point]
+            tenant_nights += self.tenant_nights.get(point, 0)
+            rent += self.rent.get(point, 0.0)
+
+            if nights:
+                for day in range(point, points[i + 1]):
+                    values = days[day]
+                    values[NIGHTS] = nights
+                    values[TENANT_NIGHTS] = tenant_nights
+                    values[RENT_TOTAL] = rent
+
+        return days.items()
+
+
+def rebuild_occupancy_rollup(session: Session) -> dict:
+    started = time.perf_counter()
+
+    # Stay table and archive alike. Dates as stored text: a
+    # history has a few thousand distinct days but millions
+    # of stays, so each day is parsed once (see ordinal_of)
+    statement = union_all(
+        *[
+            select(
+                Unit.property_name,
+                Unit.unit_type,
+                model.guest_source,
+                model.stay_type,
+                model.status,
+                type_coerce(model.check_in_date, String),
+                type_coerce(model.check_out_date, String),
+                model.planned_months,
+                model.monthly_rent,
+            ).join(Unit, Unit.id == model.unit_id)
+            for model in history_models(None)
+        ]
+    ).execution_options(yield_per=BACKFILL_BATCH_SIZE)
+
+    groups: dict[tuple, GroupDiff] = defaultdict(GroupDiff)
+    ordinal_of = OrdinalCache()
+    stays = 0
+
+    # Plain tuples off the connection: ORM row processing
+    # costs more than the diff maps for large histories
+    for (
+        property_name,
+        unit_type,
+        guest_source,
+        stay_type,
+        status,
+        check_in,
+        check_out,
+        planned_months,
+        monthly_rent,
+    ) in session.connection().execute(statement):
+        start = ordinal_of(check_in)
+        is_tenant = stay_type in TENANT_STAY_TYPES
+
+        if status == "active":
+            end = None
+        else:
+            # stay_interval() rules for completed stays
+            if check_out:
+                end = ordinal_of(check_out)
+            elif is_tenant and planned_months:
+                end = start + 30 * planned_months
+            else:
+                end = start + 1
+            end = max(end, start + 1)
+
+        groups[(property_name, unit_type, guest_source)].add(
+            start, end, monthly_rent if is_tenant and monthly_rent else 0.0
+        )
+        stays += 1
+
+    session.execute(delete(OccupancyRollup))
+
+    rows = 0
+    for group, diff in groups.items():
+        group_rows = rollup_rows(group, diff.days())
+
+        for i in range(0, len(group_rows), BACKFILL_BATCH_SIZE):
+            session.execute(
+                insert(OccupancyRollup.__table__),
+                group_rows[i : i + BACKFILL_BATCH_SIZE],
+            )
+        rows += len(group_rows)
+
+    session.commit()
+
+    return {
+        "stays": stays,
+        "groups": len(groups),
+        "rows": rows,
+        "ms": round((time.perf_counter() - started) * 1000, 3),
+    }
+
+
+class OrdinalCache(dict):
+    """
+    "YYYY-MM-DD" → date ordinal, parsed once per distinct day.
+    (Drivers with a native date type hand back dates.)
+    """
+
+    def __call__(self, value) -> int:
+        ordinal = self.get(value)
+        if ordinal is None:
+            ordinal = self[value] = date.fromisoformat(str(value)).toordinal()
+        return ordinal
+
+
+def load_occupancy_rollup():
+    """
+    Backfill on first start: stays exist, rollup is empty.
+    """
+    with Session(engine) as session:
+        has_rollup = session.exec(select(OccupancyRollup.id).limit(1)).first()
+        has_stays = any(
+            session.exec(select(model.id).limit(1)).first() is not None
+            for model in history_models(None)
+        )
+
+        if has_stays and has_rollup is None:
+            rebuild_occupancy_rollup(session)
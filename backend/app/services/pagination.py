@@ -0,0 +1,30 @@
+import base64
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException
+
+
+# ======================================================
+# KEYSET CURSORS
+# A page ends at a (timestamp, id) pair; the next page
+# starts right after it. Opaque to clients: base64 of
+# "<timestamp>|<id>". Shared by the stay list and the
+# audit trail.
+# ======================================================
+
+def encode_cursor(timestamp: datetime, row_id: int) -> str:
+    raw = f"{timestamp.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[tuple]:
+    if not cursor:
+        return None
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, row_id = raw.split("|")
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
@@ -0,0 +1,274 @@
+import calendar
+import time
+from datetime import date
+from functools import lru_cache
+
+from sqlalchemy import String, delete, event, insert, inspect, type_coerce, update
+from sqlmodel import Session, select
+
+from app.core.database import engine
+from app.models.rent_due import RentDue
+from app.models.stay import Stay
+
+
+# ======================================================
+# RENT SCHEDULE ENGINE
+#
+# Monthly and yearly tenants pay monthly_rent once per
+# planned month, on monthly_due_day. Each installment is
+# a RentDue row, so "due today / overdue / this week" is
+# an index range scan instead of date maths over every
+# tenant.
+#
+# Rows follow the stay through mapper events, which run
+# inside the same flush (sync, async and bulk routes
+# alike): created with the stay, cancelled from the
+# checkout date on when a tenant leaves early.
+# ======================================================
+
+TENANT_STAY_TYPES = ("monthly", "yearly")
+
+# Changing any of these rewrites the unpaid installments
+SCHEDULE_FIELDS = (
+    "check_in_date",
+    "planned_months",
+    "monthly_due_day",
+    "monthly_rent",
+    "stay_type",
+)
+
+
+@lru_cache(maxsize=4096)
+def due_date(year: int, month: int, day: int) -> date:
+    """
+    Due day clamped to the month: day 31 → Feb 28/29,
+    Apr 30...
+    """
+    last_day = calendar.monthrange(year, month)[1]
+    return date(year, month, min(max(day, 1), last_day))
+
+
+def add_months(year: int, month: int, months: int) -> tuple[int, int]:
+    index = year * 12 + (month - 1) + months
+    return index // 12, index % 12 + 1
+
+
+def installments(stay) -> list[tuple[int, date, str]]:
+    """
+    (period, due_date, status) per planned month. Works on
+    Stay objects and on selected column rows.
+
+    Installment 1 falls in the check-in month; when its due
+    day is already past at check-in, it is due on arrival.
+    """
+    if (
+        stay.stay_type not in TENANT_STAY_TYPES
+        or not stay.planned_months
+        or not stay.monthly_rent
+    ):
+        return []
+
+    check_in = stay.check_in_date
+    due_day = stay.monthly_due_day or check_in.day
+
+    # Left early: later months will never be collected
+    left_on = stay.check_out_date if stay.status == "completed" else None
+
+    result = []
+    for period in range(1, stay.planned_months + 1):
+        year, month = add_months(check_in.year, check_in.month, period - 1)
+        due = max(due_date(year, month, due_day), check_in)
+        result.append(
+            (period, due, "cancelled" if left_on and due > left_on else "pending")
+        )
+
+    return result
+
+
+def schedule_rows(stay) -> list[dict]:
+    return [
+        installment_row(stay, period, due, status)
+        for period, due, status in installments(stay)
+    ]
+
+
+def installment_row(stay, period: int, due: date, status: str) -> dict:
+    return {
+        "stay_id": stay.id,
+        "unit_id": stay.unit_id,
+        "period": period,
+        "due_date": due,
+        "amount": stay.monthly_rent,
+        "status": status,
+        "paid_at": None,
+    }
+
+
+# ======================================================
+# INCREMENTAL UPDATES (mapper events)
+# ======================================================
+
+@event.listens_for(Stay, "after_insert")
+def _schedule_new_stay(mapper, connection, target):
+    rows = schedule_rows(target)
+    if rows:
+        connection.execute(insert(RentDue.__table__), rows)
+
+
+@event.listens_for(Stay, "after_update")
+def _reschedule_stay(mapper, connection, target):
+    state = inspect(target)
+
+    def changed(name):
+        return state.attrs[name].history.has_changes()
+
+    if any(changed(name) for name in SCHEDULE_FIELDS):
+        reschedule_stay(connection, target)
+
+    elif changed("status") or changed("check_out_date"):
+        cancel_after_checkout(connection, target)
+
+
+def reschedule_stay(connection, stay):
+    """
+    Rewrite unpaid installments, keeping paid ones.
+    """
+    paid_periods = set(
+        connection.execute(
+            select(RentDue.period).where(
+                RentDue.stay_id == stay.id,
+                RentDue.status == "paid",
+            )
+        ).scalars()
+    )
+
+    connection.execute(
+        delete(RentDue)
+        .where(
+            RentDue.stay_id == stay.id,
+            RentDue.status != "paid",
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    rows = [row for row in schedule_rows(stay) if row["period"] not in paid_periods]
+    if rows:
+        connection.execute(insert(RentDue.__table__), rows)
+
+
+def cancel_after_checkout(connection, stay):
+    if stay.status != "completed" or not stay.check_out_date:
+        return
+
+    connection.execute(
+        update(RentDue)
+        .where(
+            RentDue.stay_id == stay.id,
+            RentDue.status == "pending",
+            RentDue.due_date > stay.check_out_date,
+        )
+        .values(status="cancelled")
+    )
+
+
+# ======================================================
+# FULL RECOMPUTE
+# For stays written without the ORM (seeders, imports).
+# Recomputes the installments of every active tenant and
+# writes only the difference: unchanged rows stay, paid
+# rows are never touched.
+# ======================================================
+
+REBUILD_CHUNK_SIZE = 500
+
+
+def rebuild_rent_schedule(session: Session) -> dict:
+    started = time.perf_counter()
+
+    active_tenants = select(Stay.id).where(
+        Stay.status == "active",
+        Stay.stay_type.in_(TENANT_STAY_TYPES),
+    )
+
+    stays = session.exec(
+        select(
+            Stay.id,
+            Stay.unit_id,
+            Stay.stay_type,
+            Stay.status,
+            Stay.check_in_date,
+            Stay.check_out_date,
+            Stay.planned_months,
+            Stay.monthly_due_day,
+            Stay.monthly_rent,
+        ).where(
+            Stay.status == "active",
+            Stay.stay_type.in_(TENANT_STAY_TYPES),
+        )
+    ).all()
+
+    # (stay_id, period) → (id, "YYYY-MM-DD", amount, status)
+    # Dates stay as stored text: parsing tens of thousands
+    # of them costs more than the rest of the rebuild
+    existing = {
+        (stay_id, period): (rent_id, due, amount, status)
+        for rent_id, stay_id, period, due, amount, status in session.exec(
+            select(
+                RentDue.id,
+                RentDue.stay_id,
+                RentDue.period,
+                type_coerce(RentDue.due_date, String),
+                RentDue.amount,
+                RentDue.status,
+            ).where(RentDue.stay_id.in_(active_tenants))
+        )
+    }
+
+    to_insert = []
+    keep = set()
+
+    for stay in stays:
+        amount = stay.monthly_rent
+
+        for period, due, status in installments(stay):
+            key = (stay.id, period)
+            current = existing.get(key)
+
+            if current is not None and (
+                current[3] == "paid"
+                or current[1:] == (due.isoformat(), amount, status)
+            ):
+                keep.add(key)
+            else:
+                to_insert.append(installment_row(stay, period, due, status))
+
+    to_delete = [
+        current[0]
+        for key, current in existing.items()
+        if key not in keep and current[3] != "paid"
+    ]
+
+    for i in range(0, len(to_delete), REBUILD_CHUNK_SIZE):
+        session.execute(
+            delete(RentDue)
+            .where(RentDue.id.in_(to_delete[i : i + REBUILD_CHUNK_SIZE]))
+            .execution_options(synchronize_session=False)
+        )
+
+    if to_insert:
+        session.execute(insert(RentDue.__table__), to_insert)
+
+    session.commit()
+
+    return {
+        "tenants": len(stays),
+        "installments": len(keep) + len(to_insert),
+        "inserted": len(to_insert),
+        "deleted": len(to_delete),
+        "ms": round((time.perf_counter() - started) * 1000, 3),
+    }
+
+
+def load_rent_schedule():
+    with Session(engine) as session:
+        rebuild_rent_schedule(session)
@@ -0,0 +1,192 @@
+import logging
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import delete, func, insert, literal, text
+from sqlmodel import Session, select
+
+from app.core.config import (
+    STAY_ARCHIVE_AFTER_DAYS,
+    STAY_ARCHIVE_BATCH_SIZE,
+    STAY_ARCHIVE_INTERVAL_SECONDS,
+    STAY_ARCHIVE_PAUSE_MS,
+)
+from app.core.database import engine
+from app.core.periodic import PeriodicJob
+from app.models.rent_due import RentDue
+from app.models.stay import Stay
+from app.models.stay_archive import StayArchive
+
+logger = logging.getLogger("sukha.archive")
+
+
+# ======================================================
+# STAY ARCHIVE (HOT / COLD SPLIT)
+#
+# Completed stays whose checkout is older than
+# STAY_ARCHIVE_AFTER_DAYS move from stay to stay_archive,
+# ids unchanged. Every request path that only needs the
+# present (occupancy, availability, departures, rent due,
+# check-in) then works on a table of recent stays whose
+# pages stay in SQLite's cache.
+#
+# Each batch is one short transaction: copy, then delete.
+# Core statements, so no mapper events fire: the rollup
+# and rent schedule already hold these stays as they are.
+# Stays with rent still pending stay behind until it is
+# settled, so the rent lists keep finding them.
+#
+# History, export and guest search read both tables
+# (history_models()).
+# ======================================================
+
+def history_models(status: Optional[str]) -> tuple:
+    """
+    The tables holding stays with this status filter
+    (None = any). Archived stays are all completed.
+    """
+    if status == "active":
+        return (Stay,)
+    return (Stay, StayArchive)
+
+
+def archive_cutoff(today: date, after_days: int) -> date:
+    return today - timedelta(days=after_days)
+
+
+def archivable_statement(cutoff: date, limit: int):
+    # Walks (status, estimated_checkout_date): the estimate
+    # is the checkout of daily stays and the planned end of
+    # tenancies, so a tenant who left early waits until the
+    # planned end passes the cutoff too.
+    # Stays with pending rent: one set per batch, read off
+    # (status, due_date).
+    pending_rent = select(RentDue.stay_id).where(RentDue.status == "pending")
+
+    return (
+        select(Stay.id)
+        .where(
+            Stay.status == "completed",
+            Stay.estimated_checkout_date < cutoff,
+            Stay.check_out_date < cutoff,
+            Stay.id.not_in(pending_rent),
+        )
+        .order_by(Stay.estimated_checkout_date)
+        .limit(limit)
+    )
+
+
+def archive_batch(session: Session, stay_ids: list[int], archived_at: datetime):
+    columns = [column.name for column in Stay.__table__.columns]
+    stay = Stay.__table__
+
+    connection = session.connection()
+    connection.execute(
+        insert(StayArchive.__table__).from_select(
+            [*columns, "archived_at"],
+            select(*stay.columns, literal(archived_at)).where(stay.c.id.in_(stay_ids)),
+        )
+    )
+    connection.execute(delete(stay).where(stay.c.id.in_(stay_ids)))
+    session.commit()
+
+
+def archive_stays(
+    session: Session,
+    after_days: int = STAY_ARCHIVE_AFTER_DAYS,
+    batch_size: int = STAY_ARCHIVE_BATCH_SIZE,
+    pause_ms: int = STAY_ARCHIVE_PAUSE_MS,
+    stop: Optional[threading.Event] = None,
+) -> dict:
+    started = time.perf_counter()
+    cutoff = archive_cutoff(date.today(), after_days)
+    archived_at = datetime.utcnow()
+
+    archived = 0
+    batches = 0
+
+    while stop is None or not stop.is_set():
+        stay_ids = session.exec(archivable_statement(cutoff, batch_size)).all()
+        if not stay_ids:
+            break
+
+        archive_batch(session, stay_ids, archived_at)
+        archived += len(stay_ids)
+        batches += 1
+
+        if len(stay_ids) < batch_size:
+            break
+        if pause_ms:
+            time.sleep(pause_ms / 1000)
+
+    return {
+        "cutoff": cutoff,
+        "archived": archived,
+        "batches": batches,
+        "ms": round((time.perf_counter() - started) * 1000, 3),
+    }
+
+
+def reserve_archived_stay_ids():
+    """
+    Keep stay's AUTOINCREMENT counter past every archived
+    id, so a new stay never takes the id of one that moved
+    out (databases that reused them before the table had
+    AUTOINCREMENT, or were rebuilt without the newest ids).
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    with Session(engine) as session:
+        archived_max = session.exec(select(func.max(StayArchive.id))).one()
+        if archived_max is None:
+            return
+
+        connection = session.connection()
+        updated = connection.execute(
+            text(
+                "UPDATE sqlite_sequence SET seq = :seq "
+                "WHERE name = 'stay' AND seq < :seq"
+            ),
+            {"seq": archived_max},
+        ).rowcount
+        if not updated:
+            connection.execute(
+                text(
+                    "INSERT INTO sqlite_sequence (name, seq) "
+                    "SELECT 'stay', :seq "
+                    "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'stay')"
+                ),
+                {"seq": archived_max},
+            )
+        session.commit()
+
+
+# ======================================================
+# BACKGROUND RUNS
+# Every STAY_ARCHIVE_INTERVAL_SECONDS, and on demand from
+# POST /admin/stay-archive/run.
+# ======================================================
+
+def run_stay_archive(stop: threading.Event) -> dict:
+    with Session(engine) as session:
+        result = archive_stays(session, stop=stop)
+
+    if result["archived"]:
+        logger.info(
+            "Archived %d stays (checkout before %s) in %.0f ms",
+            result["archived"],
+            result["cutoff"],
+            result["ms"],
+        )
+    return result
+
+
+stay_archiver = PeriodicJob(
+    "stay-archive",
+    STAY_ARCHIVE_INTERVAL_SECONDS,
+    run_stay_archive,
+    enabled=STAY_ARCHIVE_AFTER_DAYS > 0,
+)
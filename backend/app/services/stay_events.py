@@ -0,0 +1,54 @@
+from typing import Optional
+
+from app.core.dependencies import TokenClaims
+from app.models.stay import Stay
+from app.services.audit import audit_trail
+from app.services.availability import availability_index
+from app.services.board_cache import board_cache
+from app.services.board_stream import board_stream
+from app.services.housekeeping import housekeeping_queue
+from app.services.occupancy import occupancy_index
+
+
+# ======================================================
+# STAY EVENTS
+# Called by the stay routes AFTER a successful commit,
+# so in-memory views never see rolled back changes.
+# Blocking calls (the audit queue may wait for room or
+# write inline, housekeeping reads the task): async
+# routes run these in the threadpool.
+# The board version is bumped and the change pushed to
+# live board clients last, once the indexes show it.
+# The acting user goes to the audit trail.
+# Housekeeping reads the occupancy index, so it follows
+# it: a checkout queues the cleaning, a check-in makes a
+# unit still waiting for it more urgent.
+# ======================================================
+
+def stay_checked_in(stay: Stay, actor: TokenClaims, detail: Optional[str] = None):
+    occupancy_index.record_check_in(stay)
+    availability_index.record_stay(stay)
+    housekeeping_queue.record_check_in(stay)
+    board_cache.bump()
+    board_stream.publish_unit(stay.unit_id, occupancy_index.active_stay(stay.unit_id))
+    audit_stay("check_in", stay, actor, detail)
+
+
+def stay_checked_out(stay: Stay, actor: TokenClaims, detail: Optional[str] = None):
+    occupancy_index.record_checkout(stay)
+    availability_index.record_stay(stay)
+    housekeeping_queue.record_checkout(stay)
+    board_cache.bump()
+    board_stream.publish_unit(stay.unit_id, occupancy_index.active_stay(stay.unit_id))
+    audit_stay("checkout", stay, actor, detail)
+
+
+def audit_stay(action: str, stay: Stay, actor: TokenClaims, detail: Optional[str]):
+    audit_trail.record(
+        action,
+        actor.user_id,
+        actor.role,
+        unit_id=stay.unit_id,
+        stay_id=stay.id,
+        detail=detail,
+    )
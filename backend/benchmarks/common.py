@@ -0,0 +1,155 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+BENCH_PASSWORD = "bench-password"
+
+
+# ======================================================
+# DATABASE FOR A BENCHMARK RUN
+# Must be called before any app module is imported,
+# because app.core.config reads the URL at import time.
+# ======================================================
+
+def use_database(path: str) -> str:
+    url = f"sqlite:///{path}"
+    os.environ["SUKHA_DATABASE_URL"] = url
+
+    # The archiver would move seeded history out of stay
+    # mid-run: every run measures the same dataset
+    os.environ["SUKHA_STAY_ARCHIVE_AFTER_DAYS"] = "0"
+    return url
+
+
+def prepare_database(users: int = 20):
+    """
+    Create tables, seed the standard units and add
+    bench users: admin0, reception1, reception2...
+    """
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    from sqlmodel import Session, select
+
+    from app.core.database import create_db_and_tables, engine
+    from app.core.security import hash_password
+    from app.models.user import User
+    from app.seeders.unit_seeder import seed_units
+    import app.models.stay  # noqa: F401  (register table)
+
+    create_db_and_tables()
+    seed_units()
+
+    hashed = hash_password(BENCH_PASSWORD)
+
+    with Session(engine) as session:
+        existing = set(session.exec(select(User.username)).all())
+
+        for i in range(users):
+            username = bench_username(i)
+            if username in existing:
+                continue
+            session.add(
+                User(
+                    username=username,
+                    hashed_password=hashed,
+                    full_name=f"Bench User {i}",
+                    role="admin" if i == 0 else "reception",
+                )
+            )
+        session.commit()
+
+
+def bench_username(i: int) -> str:
+    return "admin0" if i == 0 else f"reception{i}"
+
+
+# ======================================================
+# UVICORN SERVER IN A SUBPROCESS
+# ======================================================
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(env: dict, workers: int = 1):
+    port = free_port()
+
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+        ],
+        cwd=BACKEND_DIR,
+        env={**os.environ, **env},
+    )
+
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 30
+
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(base_url + "/").status_code == 200:
+                return process, base_url
+        except httpx.TransportError:
+            time.sleep(0.2)
+
+    process.kill()
+    raise RuntimeError("Server did not start")
+
+
+def stop_server(process):
+    process.terminate()
+    try:
+        process.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+async def login(client: httpx.AsyncClient, username: str) -> dict:
+    response = await client.post(
+        "/auth/login",
+        data={"username": username, "password": BENCH_PASSWORD},
+    )
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+# ======================================================
+# STATS
+# ======================================================
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(latencies_ms: list[float]) -> dict:
+    return {
+        "count": len(latencies_ms),
+        "p50_ms": round(percentile(latencies_ms, 50), 2),
+        "p90_ms": round(percentile(latencies_ms, 90), 2),
+        "p99_ms": round(percentile(latencies_ms, 99), 2),
+        "max_ms": round(max(latencies_ms, default=0.0), 2),
+    }
@@ -0,0 +1,150 @@
+"""
+Sync vs async request path throughput.
+
+Runs the same client mix (board polls, unit detail,
+/auth/me and check-in + checkout cycles) against uvicorn
+with SUKHA_ASYNC_ROUTES off and on, at several levels of
+concurrency, and reports requests/sec and latency.
+
+Run from backend/:
+    python -m benchmarks.concurrency --clients 50 200 --seconds 10
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from benchmarks.common import (
+    login,
+    prepare_database,
+    start_server,
+    stop_server,
+    summarize,
+    use_database,
+)
+
+
+MODES = {
+    "sync": {"SUKHA_ASYNC_ROUTES": "0"},
+    "async": {"SUKHA_ASYNC_ROUTES": "1"},
+}
+
+UNIT_COUNT = 27
+
+
+async def client_loop(client, headers, client_id: int, deadline: float, latencies, errors):
+    rng = random.Random(client_id)
+
+    async def timed(method, url, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, headers=headers, **kwargs)
+        except httpx.TransportError:
+            errors.append(0)
+            return None
+        latencies.append((time.perf_counter() - started) * 1000)
+        if response.status_code >= 500:
+            errors.append(response.status_code)
+        return response
+
+    while time.monotonic() < deadline:
+        roll = rng.random()
+
+        if roll < 0.5:
+            await timed("GET", "/units/")
+        elif roll < 0.7:
+            await timed("GET", "/units/available")
+        elif roll < 0.85:
+            await timed("GET", f"/units/{rng.randint(1, UNIT_COUNT)}")
+        elif roll < 0.95:
+            await timed("GET", "/auth/me")
+        else:
+            unit_id = rng.randint(1, UNIT_COUNT)
+            response = await timed(
+                "POST",
+                "/stays/",
+                json={
+                    "unit_id": unit_id,
+                    "guest_name": f"Bench Guest {client_id}",
+                    "guest_source": "sukha",
+                    "stay_type": "daily",
+                    "check_in_date": "2030-01-01",
+                    "check_out_date": "2030-01-03",
+                },
+            )
+            if response is not None and response.status_code == 200:
+                stay_id = response.json()["stay_id"]
+                await timed("PATCH", f"/stays/{stay_id}/checkout")
+
+
+async def run_level(base_url: str, clients: int, seconds: float) -> dict:
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+        headers = await login(client, "admin0")
+
+        latencies: list[float] = []
+        errors: list[int] = []
+        deadline = time.monotonic() + seconds
+        started = time.perf_counter()
+
+        await asyncio.gather(
+            *(
+                client_loop(client, headers, i, deadline, latencies, errors)
+                for i in range(clients)
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+    return {
+        "clients": clients,
+        "requests": len(latencies),
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "errors": len(errors),
+        **summarize(latencies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="sukha-bench-")
+    use_database(str(Path(workdir) / "bench.db"))
+    prepare_database(users=1)
+
+    results = {}
+
+    for mode, env in MODES.items():
+        process, base_url = start_server(env)
+        try:
+            results[mode] = [
+                asyncio.run(run_level(base_url, clients, args.seconds))
+                for clients in args.clients
+            ]
+        finally:
+            stop_server(process)
+
+    print(f"{'mode':<8}{'clients':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for mode, levels in results.items():
+        for level in levels:
+            print(
+                f"{mode:<8}{level['clients']:>8}{level['requests_per_sec']:>10}"
+                f"{level['p50_ms']:>10}{level['p99_ms']:>10}{level['errors']:>8}"
+            )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
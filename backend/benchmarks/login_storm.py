@@ -0,0 +1,134 @@
+"""
+Login storm benchmark.
+
+Measures p50/p99 of unrelated endpoints (/units/, /auth/me)
+while many staff log in at once, with Argon2 running inline
+in the threadpool ("before") and in the password process
+pool ("after").
+
+Run from backend/:
+    python -m benchmarks.login_storm --logins 48 --concurrency 12
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from benchmarks.common import (
+    bench_username,
+    login,
+    prepare_database,
+    start_server,
+    stop_server,
+    summarize,
+    use_database,
+)
+
+
+MODES = {
+    "before (inline argon2)": {"SUKHA_PASSWORD_WORKERS": "0"},
+    "after (process pool)": {"SUKHA_PASSWORD_WORKERS": "2"},
+}
+
+
+async def probe(client, headers, stop: asyncio.Event, latencies: list[float]):
+    paths = ["/units/", "/auth/me"]
+    i = 0
+
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get(paths[i % len(paths)], headers=headers)
+        latencies.append((time.perf_counter() - started) * 1000)
+        i += 1
+
+
+async def storm(client, logins: int, concurrency: int, users: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    statuses: dict[int, int] = {}
+
+    async def one(i):
+        async with semaphore:
+            response = await client.post(
+                "/auth/login",
+                data={"username": bench_username(1 + i % (users - 1)), "password": "bench-password"},
+            )
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    await asyncio.gather(*(one(i) for i in range(logins)))
+    return statuses
+
+
+async def run_mode(base_url: str, args) -> dict:
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+        headers = await login(client, "admin0")
+
+        # Baseline: probes only
+        idle: list[float] = []
+        stop = asyncio.Event()
+        task = asyncio.create_task(probe(client, headers, stop, idle))
+        await asyncio.sleep(args.idle_seconds)
+        stop.set()
+        await task
+
+        # Probes during the storm
+        during: list[float] = []
+        stop = asyncio.Event()
+        probes = [
+            asyncio.create_task(probe(client, headers, stop, during))
+            for _ in range(args.probes)
+        ]
+        started = time.perf_counter()
+        statuses = await storm(client, args.logins, args.concurrency, args.users)
+        storm_seconds = time.perf_counter() - started
+        stop.set()
+        await asyncio.gather(*probes)
+
+    return {
+        "idle": summarize(idle),
+        "during_storm": summarize(during),
+        "storm_seconds": round(storm_seconds, 2),
+        "login_statuses": statuses,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=48)
+    parser.add_argument("--concurrency", type=int, default=12)
+    parser.add_argument("--users", type=int, default=49)
+    parser.add_argument("--probes", type=int, default=4)
+    parser.add_argument("--idle-seconds", type=float, default=3)
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="sukha-bench-")
+    use_database(str(Path(workdir) / "bench.db"))
+    prepare_database(users=args.users)
+
+    results = {}
+
+    for mode, env in MODES.items():
+        process, base_url = start_server(env)
+        try:
+            results[mode] = asyncio.run(run_mode(base_url, args))
+        finally:
+            stop_server(process)
+
+    print(f"{'mode':<26}{'phase':<14}{'p50 ms':>10}{'p99 ms':>10}{'n':>8}")
+    for mode, result in results.items():
+        for phase in ("idle", "during_storm"):
+            stats = result[phase]
+            print(f"{mode:<26}{phase:<14}{stats['p50_ms']:>10}{stats['p99_ms']:>10}{stats['count']:>8}")
+        print(f"{'':<26}storm took {result['storm_seconds']}s, statuses {result['login_statuses']}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,434 @@
+"""
+API hot path benchmark suite.
+
+Generates a synthetic dataset, starts main.app under uvicorn
+and measures latency percentiles and throughput for the hot
+endpoints. SQL statement counts per request are measured
+in-process with count_statements(). Results are written as
+JSON; pass an earlier result as --baseline to flag
+regressions (exit status 1 when any are found).
+
+Run from backend/:
+    python -m benchmarks.suite --output bench.json
+    python -m benchmarks.suite --baseline bench.json --output new.json
+
+Reuse a generated dataset between runs with --db PATH.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import httpx
+
+from benchmarks.common import (
+    BACKEND_DIR,
+    BENCH_PASSWORD,
+    bench_username,
+    login,
+    prepare_database,
+    start_server,
+    stop_server,
+    summarize,
+    use_database,
+)
+
+
+ENDPOINTS = [
+    "POST /auth/login",
+    "GET /auth/me",
+    "GET /units/",
+    "GET /units/available",
+    "GET /units/{id}",
+    "POST /stays/",
+    "PATCH /stays/{id}/checkout",
+]
+
+# Relative slowdown allowed before a latency or
+# throughput change counts as a regression
+DEFAULT_TOLERANCE = 0.20
+
+
+# ======================================================
+# DATASET
+# ======================================================
+
+def prepare_dataset(args) -> dict:
+    from sqlmodel import Session, func, select
+
+    from app.core.database import engine
+    from app.models.stay import Stay
+    from app.models.unit import Unit
+    from app.seeders.synthetic_seeder import seed_synthetic
+
+    prepare_database(users=args.users)
+    seed_synthetic(
+        properties=args.properties,
+        units_per_property=args.units_per_property,
+        stays=args.stays,
+    )
+
+    with Session(engine) as session:
+        unit_ids = list(session.exec(select(Unit.id).order_by(Unit.id)).all())
+        occupied = set(
+            session.exec(select(Stay.unit_id).where(Stay.status == "active")).all()
+        )
+        vacant = list(
+            session.exec(
+                select(Unit.id).where(Unit.status == "active").order_by(Unit.id)
+            ).all()
+        )
+        stay_count = session.exec(select(func.count()).select_from(Stay)).one()
+
+    return {
+        "units": len(unit_ids),
+        "stays": stay_count,
+        "unit_ids": unit_ids,
+        "vacant_unit_ids": [unit_id for unit_id in vacant if unit_id not in occupied],
+    }
+
+
+def check_in_payload(unit_id: int, guest: str) -> dict:
+    check_in = date.today()
+    return {
+        "unit_id": unit_id,
+        "guest_name": guest,
+        "guest_source": "sukha",
+        "stay_type": "daily",
+        "check_in_date": check_in.isoformat(),
+        "check_out_date": (check_in + timedelta(days=2)).isoformat(),
+    }
+
+
+# ======================================================
+# SQL STATEMENTS PER REQUEST (in-process)
+# One warm-up request, then one counted request, so
+# caches are in the same state as under load.
+# ======================================================
+
+def measure_sql_counts(dataset: dict) -> dict:
+    from fastapi.testclient import TestClient
+
+    from app.core.database import count_statements
+    from main import app
+
+    unit_id = dataset["unit_ids"][0]
+    vacant = dataset["vacant_unit_ids"]
+    counts = {}
+
+    with TestClient(app) as client:
+        form = {"username": bench_username(0), "password": BENCH_PASSWORD}
+        token = client.post("/auth/login", data=form).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        def counted(name, send):
+            send()
+            with count_statements() as counter:
+                response = send()
+            response.raise_for_status()
+            counts[name] = counter.count
+            return response
+
+        counted("POST /auth/login", lambda: client.post("/auth/login", data=form))
+        counted("GET /auth/me", lambda: client.get("/auth/me", headers=headers))
+        counted("GET /units/", lambda: client.get("/units/", headers=headers))
+        counted(
+            "GET /units/available",
+            lambda: client.get("/units/available", headers=headers),
+        )
+        counted(
+            "GET /units/{id}",
+            lambda: client.get(f"/units/{unit_id}", headers=headers),
+        )
+
+        # Writes can't be repeated on the same unit, so the
+        # warm-up cycle uses a different vacant unit
+        stay_ids = []
+
+        for i, counting in enumerate([False, True]):
+            payload = check_in_payload(vacant[i], "SQL Count Guest")
+
+            if counting:
+                with count_statements() as counter:
+                    response = client.post("/stays/", json=payload, headers=headers)
+                counts["POST /stays/"] = counter.count
+            else:
+                response = client.post("/stays/", json=payload, headers=headers)
+            response.raise_for_status()
+            stay_ids.append(response.json()["stay_id"])
+
+        client.patch(f"/stays/{stay_ids[0]}/checkout", headers=headers).raise_for_status()
+        with count_statements() as counter:
+            response = client.patch(f"/stays/{stay_ids[1]}/checkout", headers=headers)
+        response.raise_for_status()
+        counts["PATCH /stays/{id}/checkout"] = counter.count
+
+    return counts
+
+
+# ======================================================
+# LOAD (uvicorn subprocess)
+# ======================================================
+
+class Recorder:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = {name: [] for name in ENDPOINTS}
+        self.errors: dict[str, int] = {name: 0 for name in ENDPOINTS}
+
+    async def send(self, client, name: str, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            self.errors[name] += 1
+            return None
+
+        self.latencies[name].append((time.perf_counter() - started) * 1000)
+        if response.status_code >= 400:
+            self.errors[name] += 1
+        return response
+
+
+async def run_phase(base_url: str, clients: int, seconds: float, loop) -> float:
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+        headers = await login(client, bench_username(0))
+        deadline = time.monotonic() + seconds
+        started = time.perf_counter()
+
+        await asyncio.gather(
+            *(loop(client, headers, i, deadline) for i in range(clients))
+        )
+
+    return time.perf_counter() - started
+
+
+async def run_load(base_url: str, dataset: dict, args) -> dict:
+    recorder = Recorder()
+    elapsed: dict[str, float] = {}
+    unit_ids = dataset["unit_ids"]
+    vacant = dataset["vacant_unit_ids"]
+
+    def reads(name, url_for):
+        async def loop(client, headers, client_id, deadline):
+            rng = random.Random(client_id)
+            while time.monotonic() < deadline:
+                await recorder.send(client, name, "GET", url_for(rng), headers=headers)
+
+        return loop
+
+    async def login_loop(client, headers, client_id, deadline):
+        username = bench_username(client_id % args.users)
+        while time.monotonic() < deadline:
+            await recorder.send(
+                client,
+                "POST /auth/login",
+                "POST",
+                "/auth/login",
+                data={"username": username, "password": BENCH_PASSWORD},
+            )
+
+    # Each client owns one vacant unit: check in, check out, repeat
+    async def stay_loop(client, headers, client_id, deadline):
+        unit_id = vacant[client_id]
+        while time.monotonic() < deadline:
+            response = await recorder.send(
+                client,
+                "POST /stays/",
+                "POST",
+                "/stays/",
+                json=check_in_payload(unit_id, f"Bench Guest {client_id}"),
+                headers=headers,
+            )
+            if response is None or response.status_code != 200:
+                continue
+            await recorder.send(
+                client,
+                "PATCH /stays/{id}/checkout",
+                "PATCH",
+                f"/stays/{response.json()['stay_id']}/checkout",
+                headers=headers,
+            )
+
+    phases = [
+        ("POST /auth/login", login_loop, min(args.clients, args.users)),
+        ("GET /auth/me", reads("GET /auth/me", lambda rng: "/auth/me"), args.clients),
+        ("GET /units/", reads("GET /units/", lambda rng: "/units/"), args.clients),
+        (
+            "GET /units/available",
+            reads("GET /units/available", lambda rng: "/units/available"),
+            args.clients,
+        ),
+        (
+            "GET /units/{id}",
+            reads("GET /units/{id}", lambda rng: f"/units/{rng.choice(unit_ids)}"),
+            args.clients,
+        ),
+        ("POST /stays/", stay_loop, min(args.clients, len(vacant))),
+    ]
+
+    for name, loop, clients in phases:
+        elapsed[name] = await run_phase(base_url, clients, args.seconds, loop)
+
+    # Check-in and checkout share one phase
+    elapsed["PATCH /stays/{id}/checkout"] = elapsed["POST /stays/"]
+
+    results = {}
+    for name in ENDPOINTS:
+        latencies = recorder.latencies[name]
+        results[name] = {
+            **summarize(latencies),
+            "requests_per_sec": round(len(latencies) / elapsed[name], 1),
+            "errors": recorder.errors[name],
+        }
+    return results
+
+
+# ======================================================
+# COMPARE WITH A BASELINE
+# ======================================================
+
+def find_regressions(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+
+    for name, now in current["endpoints"].items():
+        before = baseline.get("endpoints", {}).get(name)
+        if not before:
+            continue
+
+        for key in ["p50_ms", "p99_ms"]:
+            if before[key] and now[key] > before[key] * (1 + tolerance):
+                regressions.append(f"{name}: {key} {before[key]} → {now[key]}")
+
+        if before["requests_per_sec"] and (
+            now["requests_per_sec"] < before["requests_per_sec"] * (1 - tolerance)
+        ):
+            regressions.append(
+                f"{name}: requests_per_sec "
+                f"{before['requests_per_sec']} → {now['requests_per_sec']}"
+            )
+
+        # Query counts are deterministic, any increase counts
+        if now.get("sql_statements", 0) > before.get("sql_statements", 0):
+            regressions.append(
+                f"{name}: sql_statements "
+                f"{before['sql_statements']} → {now['sql_statements']}"
+            )
+
+        if now["errors"] > before["errors"]:
+            regressions.append(f"{name}: errors {before['errors']} → {now['errors']}")
+
+    return regressions
+
+
+# ======================================================
+# REPORT
+# ======================================================
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_table(endpoints: dict):
+    print(
+        f"{'endpoint':<30}{'req/s':>10}{'p50 ms':>10}{'p90 ms':>10}"
+        f"{'p99 ms':>10}{'sql':>6}{'errors':>8}"
+    )
+    for name, row in endpoints.items():
+        print(
+            f"{name:<30}{row['requests_per_sec']:>10}{row['p50_ms']:>10}"
+            f"{row['p90_ms']:>10}{row['p99_ms']:>10}{row['sql_statements']:>6}"
+            f"{row['errors']:>8}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", help="dataset file, generated when missing")
+    parser.add_argument("--properties", type=int, default=10)
+    parser.add_argument("--units-per-property", type=int, default=50)
+    parser.add_argument("--stays", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--password-workers", type=int, default=2)
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--baseline", help="earlier JSON result to compare with")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    db_path = args.db or str(Path(tempfile.mkdtemp(prefix="sukha-bench-")) / "bench.db")
+    use_database(db_path)
+
+    # In-process passes hash inline; the server gets its own pool
+    os.environ["SUKHA_PASSWORD_WORKERS"] = "0"
+
+    dataset = prepare_dataset(args)
+    if len(dataset["vacant_unit_ids"]) < 2:
+        sys.exit("Dataset needs at least two vacant units")
+
+    sql_counts = measure_sql_counts(dataset)
+
+    process, base_url = start_server(
+        {"SUKHA_PASSWORD_WORKERS": str(args.password_workers)}
+    )
+    try:
+        endpoints = asyncio.run(run_load(base_url, dataset, args))
+    finally:
+        stop_server(process)
+
+    for name, row in endpoints.items():
+        row["sql_statements"] = sql_counts[name]
+
+    result = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+            "clients": args.clients,
+            "seconds": args.seconds,
+            "dataset": {"units": dataset["units"], "stays": dataset["stays"]},
+        },
+        "endpoints": endpoints,
+    }
+
+    print_table(endpoints)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2))
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = find_regressions(result, baseline, args.tolerance)
+
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) vs {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+
+        print(f"\nNo regressions vs {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
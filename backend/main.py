@@ -1,27 +1,110 @@
+import logging
+
 from fastapi import FastAPI
 from app.routes.auth import router as auth_router
 from app.routes.unit import router as unit_router
-from app.core.database import create_db_and_tables
+from app.core.config import ASYNC_ROUTES, LOG_LEVEL
+from app.core.database import (
+    create_db_and_tables,
+    dispose_async_engines,
+    log_engine_profile,
+)
 # Import models so tables get created
 from app.models.user import User
 from app.models.unit import Unit   # 👈 ADD THIS LINE
 from app.routes.unit import router as unit_router
 from app.models.stay import Stay
+from app.models.revoked_token import RevokedToken
+from app.models.rent_due import RentDue
+from app.models.occupancy_rollup import OccupancyRollup
+from app.models.stay_archive import StayArchive
+from app.models.change_log import ChangeLog, ChangeLogCompaction
+from app.models.audit_event import AuditEvent
+from app.models.housekeeping_task import HousekeepingTask
 from app.routes.stay import router as stay_router
+from app.routes.admin import router as admin_router
+from app.routes.rent import router as rent_router
+from app.routes.reports import router as reports_router
+from app.routes.metrics import router as metrics_router
+from app.routes.sync import router as sync_router
+from app.routes.audit import router as audit_router
+from app.routes.housekeeping import router as housekeeping_router
+from app.core.metrics import MetricsMiddleware, instrument_engines
+from app.services.occupancy import load_occupancy_index
+from app.services.availability import load_availability_index
+from app.services.rent_schedule import load_rent_schedule
+from app.services.occupancy_rollup import load_occupancy_rollup
+from app.services.departures import load_estimated_checkout
+from app.services.guest_search import create_guest_search_index
+from app.core.password_pool import password_pool
+from app.services.board_stream import board_stream
+from app.services.stay_archive import reserve_archived_stay_ids, stay_archiver
+from app.services.change_log import change_log_compactor
+from app.services.audit import audit_trail
+from app.services.housekeeping import load_housekeeping_queue
+
 
 
 
 
+# App logs (sukha.*) go to stderr next to uvicorn's own lines
+logging.basicConfig(format="%(levelname)s:     %(name)s - %(message)s")
+logging.getLogger("sukha").setLevel(LOG_LEVEL)
 
 app = FastAPI(title="SUKHA PMS API")
 
+# Per-route latency, SQL count and DB time → /metrics
+app.add_middleware(MetricsMiddleware)
+
+# Async hot paths go first: they shadow the matching sync
+# handlers, everything else falls through to the sync routers
+if ASYNC_ROUTES:
+    from app.routes.auth_async import router as auth_async_router
+    from app.routes.unit_async import router as unit_async_router
+    from app.routes.stay_async import router as stay_async_router
+
+    # Same paths and bodies as the sync routes, so keep docs single
+    app.include_router(auth_async_router, include_in_schema=False)
+    app.include_router(unit_async_router, include_in_schema=False)
+    app.include_router(stay_async_router, include_in_schema=False)
+
 app.include_router(auth_router)
 app.include_router(unit_router)
 app.include_router(stay_router)
+app.include_router(rent_router)
+app.include_router(reports_router)
+app.include_router(sync_router)
+app.include_router(audit_router)
+app.include_router(housekeeping_router)
+app.include_router(admin_router)
+app.include_router(metrics_router)
 
 @app.on_event("startup")
 def on_startup():
     create_db_and_tables()
+    reserve_archived_stay_ids()
+    log_engine_profile()
+    instrument_engines()
+    load_estimated_checkout()
+    create_guest_search_index()
+    load_occupancy_index()
+    load_availability_index()
+    load_rent_schedule()
+    load_occupancy_rollup()
+    load_housekeeping_queue()
+    password_pool.warm_up()
+    stay_archiver.start()
+    change_log_compactor.start()
+    audit_trail.start()
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    board_stream.close()
+    stay_archiver.stop()
+    change_log_compactor.stop()
+    audit_trail.stop()
+    password_pool.shutdown()
+    await dispose_async_engines()
 
 @app.get("/")
 def root():
@@ -0,0 +1,110 @@
+import os
+import sys
+import tempfile
+from itertools import count
+
+# Settings are read at import time: point the app at a
+# throwaway database before anything imports it
+_db_dir = tempfile.mkdtemp(prefix="sukha-tests-")
+os.environ["SUKHA_DATABASE_URL"] = f"sqlite:///{_db_dir}/sukha.db"
+os.environ["SUKHA_PASSWORD_WORKERS"] = "0"
+os.environ["SUKHA_STAY_ARCHIVE_INTERVAL_SECONDS"] = "0"
+os.environ["SUKHA_SYNC_COMPACT_INTERVAL_SECONDS"] = "0"
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+import main
+from app.core.database import engine
+from app.core.security import hash_password
+from app.models.unit import Unit
+from app.models.user import User
+
+
+# ======================================================
+# SHARED FIXTURES
+# One database and one app for the whole run. Tests do
+# not clean up: each works on units it creates itself.
+# ======================================================
+
+_property_ids = count(1)
+
+PASSWORD = "pw"
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(main.app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def admin(client):
+    with Session(engine) as session:
+        session.add(
+            User(
+                username="admin",
+                hashed_password=hash_password(PASSWORD),
+                full_name="Test Admin",
+                role="admin",
+            )
+        )
+        session.commit()
+    return "admin"
+
+
+def login(client, username: str) -> dict:
+    response = client.post(
+        "/auth/login", data={"username": username, "password": PASSWORD}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def bearer(tokens: dict) -> dict:
+    return {"Authorization": f"Bearer {tokens['access_token']}"}
+
+
+@pytest.fixture
+def headers(client, admin):
+    return bearer(login(client, admin))
+
+
+@pytest.fixture
+def make_units():
+    """
+    make_units(n) → ids of n new rooms in a property of
+    their own.
+    """
+    def _make_units(n: int, floor_number: int = 1) -> list[int]:
+        property_name = f"Test Property {next(_property_ids)}"
+        units = [
+            Unit(
+                property_name=property_name,
+                unit_number=f"T{number}",
+                unit_type="room",
+                floor_number=floor_number,
+            )
+            for number in range(1, n + 1)
+        ]
+        with Session(engine) as session:
+            session.add_all(units)
+            session.commit()
+            return [unit.id for unit in units]
+
+    return _make_units
+
+
+def daily_stay(unit_id: int, check_in: str, check_out: str, **fields) -> dict:
+    return {
+        "unit_id": unit_id,
+        "guest_name": "Test Guest",
+        "guest_source": "sukha",
+        "stay_type": "daily",
+        "check_in_date": check_in,
+        "check_out_date": check_out,
+        **fields,
+    }
@@ -0,0 +1,66 @@
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.models.housekeeping_task import HousekeepingTask
+from app.models.stay import Stay
+from app.services.board_stream import board_stream
+
+from test_availability import free_windows
+from test_housekeeping import queued
+
+
+def test_rebuild_picks_up_rows_written_through_core(client, headers, make_units):
+    # Core inserts fire no mapper events and no hooks: the
+    # in-memory indexes only learn of them from the rebuild
+    occupied_id, dirty_id = make_units(2)
+    today = date.today()
+    checkout = today + timedelta(days=3)
+
+    with Session(engine) as session:
+        connection = session.connection()
+        stay_id = connection.execute(
+            insert(Stay.__table__).values(
+                unit_id=occupied_id,
+                guest_name="Imported Guest",
+                guest_source="sukha",
+                stay_type="daily",
+                check_in_date=today,
+                check_out_date=checkout,
+                estimated_checkout_date=checkout,
+                advance_refunded=False,
+                status="active",
+                created_at=datetime.utcnow(),
+            )
+        ).inserted_primary_key[0]
+        connection.execute(
+            insert(HousekeepingTask.__table__).values(
+                unit_id=dirty_id,
+                stay_id=stay_id,
+                status="pending",
+                created_at=datetime.utcnow(),
+            )
+        )
+        session.commit()
+
+    board = client.get("/units/", headers=headers)
+    assert free_windows(client, headers, occupied_id, today, checkout) != []
+    assert queued(client, headers, dirty_id) == []
+    seq = board_stream.stats()["seq"]
+
+    response = client.post("/admin/occupancy-index/rebuild", headers=headers)
+    assert response.status_code == 200
+
+    assert free_windows(client, headers, occupied_id, today, checkout) == []
+    assert len(queued(client, headers, dirty_id)) == 1
+
+    # Board clients drop what they hold and reload
+    assert board_stream.stats()["seq"] == seq + 1
+    response = client.get(
+        "/units/", headers={**headers, "If-None-Match": board.headers["ETag"]}
+    )
+    assert response.status_code == 200
+    (unit,) = [unit for unit in response.json() if unit["id"] == occupied_id]
+    assert unit["estimated_checkout"] == str(checkout)
@@ -0,0 +1,39 @@
+from conftest import bearer, login
+
+
+def refresh(client, tokens):
+    return client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+
+
+def test_refresh_rotates_tokens(client, admin):
+    tokens = login(client, admin)
+
+    response = refresh(client, tokens)
+    assert response.status_code == 200
+    rotated = response.json()
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+    assert client.get("/auth/me", headers=bearer(rotated)).status_code == 200
+
+
+def test_reused_refresh_token_revokes_the_family(client, admin):
+    tokens = login(client, admin)
+    rotated = refresh(client, tokens).json()
+
+    # The old token again: replay
+    response = refresh(client, tokens)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Refresh token reuse detected"
+
+    # Everything issued from that login is dead now
+    response = refresh(client, rotated)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Refresh token revoked"
+
+    # Other logins are not affected
+    assert refresh(client, login(client, admin)).status_code == 200
+
+
+def test_refresh_token_is_not_an_access_token(client, admin):
+    tokens = login(client, admin)
+    headers = {"Authorization": f"Bearer {tokens['refresh_token']}"}
+    assert client.get("/auth/me", headers=headers).status_code == 401
@@ -0,0 +1,47 @@
+from datetime import date, timedelta
+
+from app.core.database import engine
+from app.models.stay import Stay
+from app.services.availability import availability_index
+from sqlmodel import Session
+
+from conftest import daily_stay
+
+
+def free_windows(client, headers, unit_id, from_date, to_date):
+    response = client.get(
+        "/units/availability",
+        params={"from": str(from_date), "to": str(to_date)},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    for row in response.json()["units"]:
+        if row["id"] == unit_id:
+            return [(w["from"], w["to"]) for w in row["free_windows"]]
+    return []
+
+
+def test_early_checkout_frees_the_remaining_nights(client, headers, make_units):
+    (unit_id,) = make_units(1)
+    today = date.today()
+    planned = today + timedelta(days=5)
+
+    stay_id = client.post(
+        "/stays/",
+        json=daily_stay(unit_id, str(today - timedelta(days=2)), str(planned)),
+        headers=headers,
+    ).json()["stay_id"]
+    assert free_windows(client, headers, unit_id, today, planned) == []
+
+    response = client.patch(f"/stays/{stay_id}/checkout", headers=headers)
+    assert response.status_code == 200
+    with Session(engine) as session:
+        assert session.get(Stay, stay_id).check_out_date == today
+
+    expected = [(str(today), str(planned))]
+    assert free_windows(client, headers, unit_id, today, planned) == expected
+
+    # Same answer after a rebuild from the database
+    with Session(engine) as session:
+        availability_index.rebuild(session)
+    assert free_windows(client, headers, unit_id, today, planned) == expected
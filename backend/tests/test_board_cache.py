@@ -0,0 +1,31 @@
+from datetime import date, timedelta
+
+from conftest import daily_stay
+
+
+def test_stay_write_changes_the_board_etag(client, headers, make_units):
+    (unit_id,) = make_units(1)
+    today = date.today()
+
+    etags = {}
+    for path in ["/units/", "/units/available"]:
+        response = client.get(path, headers=headers)
+        etags[path] = response.headers["ETag"]
+
+        cached = client.get(path, headers={**headers, "If-None-Match": etags[path]})
+        assert cached.status_code == 304
+
+    body = daily_stay(unit_id, str(today), str(today + timedelta(days=1)))
+    stay_id = client.post("/stays/", json=body, headers=headers).json()["stay_id"]
+
+    for path, etag in etags.items():
+        response = client.get(path, headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+    assert unit_id not in [unit["id"] for unit in response.json()]
+
+    # Checkout too, and the new tag holds until then
+    etag = client.get("/units/", headers=headers).headers["ETag"]
+    assert client.get("/units/", headers={**headers, "If-None-Match": etag}).status_code == 304
+    client.patch(f"/stays/{stay_id}/checkout", headers=headers)
+    assert client.get("/units/", headers={**headers, "If-None-Match": etag}).status_code == 200
@@ -0,0 +1,51 @@
+from datetime import date, timedelta
+
+from app.core.database import count_statements, read_engine
+from app.services.board_cache import board_cache
+
+from conftest import daily_stay
+
+
+BOARD_PATHS = ["/units/", "/units/available"]
+
+
+def check_in_all(client, headers, unit_ids):
+    today = date.today()
+    for unit_id in unit_ids:
+        response = client.post(
+            "/stays/",
+            json=daily_stay(unit_id, str(today), str(today + timedelta(days=2))),
+            headers=headers,
+        )
+        assert response.status_code == 200
+
+
+def board_statements(client, headers, unit_id) -> dict:
+    counts = {}
+    for path in BOARD_PATHS + [f"/units/{unit_id}"]:
+        # Measure the query path, not the response cache
+        board_cache.bump()
+
+        # Board routes read through the read-only pool; the
+        # write engine also carries the audit writer's batches
+        with count_statements(read_engine) as counter:
+            response = client.get(path, headers=headers)
+        assert response.status_code == 200
+        counts[path.replace(str(unit_id), "{unit_id}")] = counter.count
+    return counts
+
+
+def test_board_statement_count_does_not_grow_with_units(client, headers, make_units):
+    small = make_units(5)
+    check_in_all(client, headers, small[:3])
+
+    # Warm up the user cache so only the routes are counted
+    client.get("/units/", headers=headers)
+    before = board_statements(client, headers, small[0])
+
+    large = make_units(60)
+    check_in_all(client, headers, large[:40])
+    after = board_statements(client, headers, large[0])
+
+    assert before == after
+    assert all(count <= 2 for count in after.values())
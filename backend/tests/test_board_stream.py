@@ -0,0 +1,89 @@
+import asyncio
+import json
+from datetime import date, timedelta
+
+from app.core.config import BOARD_STREAM_BUFFER_SIZE, BOARD_STREAM_QUEUE_SIZE
+from app.routes.unit import board_events
+from app.services.board_stream import board_stream
+
+from conftest import daily_stay
+
+
+def parse_frame(frame: str) -> tuple[str, str, dict]:
+    fields = dict(line.split(": ", 1) for line in frame.strip().splitlines())
+    return fields["event"], fields["id"], json.loads(fields["data"])
+
+
+def read_frames(last_event_id, count):
+    """
+    The first `count` frames a client resuming from
+    last_event_id would receive.
+    """
+    async def read():
+        events = board_events(last_event_id)
+        try:
+            return [parse_frame(await anext(events)) for _ in range(count)]
+        finally:
+            await events.aclose()
+
+    return asyncio.run(read())
+
+
+def test_resume_sends_only_the_missed_events(client, headers, make_units):
+    unit_ids = make_units(2)
+    today = date.today()
+    last_event_id = board_stream.event_id(board_stream.seq)
+
+    for unit_id in unit_ids:
+        body = daily_stay(unit_id, str(today), str(today + timedelta(days=1)))
+        client.post("/stays/", json=body, headers=headers)
+
+    frames = read_frames(last_event_id, 2)
+    assert [(kind, data["id"], data["status"]) for kind, _, data in frames] == [
+        ("unit", unit_ids[0], "occupied"),
+        ("unit", unit_ids[1], "occupied"),
+    ]
+    assert frames[-1][1] == board_stream.event_id(board_stream.seq)
+
+
+def test_resume_falls_back_to_a_snapshot(client, make_units):
+    (unit_id,) = make_units(1)
+    last_event_id = board_stream.event_id(board_stream.seq)
+
+    # More events than the buffer keeps: the missed ones are gone
+    for _ in range(BOARD_STREAM_BUFFER_SIZE + 1):
+        board_stream.publish_unit(unit_id, None)
+
+    ((kind, event_id, data),) = read_frames(last_event_id, 1)
+    assert kind == "snapshot"
+    assert event_id == board_stream.event_id(board_stream.seq)
+    assert unit_id in [unit["id"] for unit in data["units"]]
+
+    # Ids from another process (or before a restart) too
+    ((kind, _, _),) = read_frames("0123abcd:1", 1)
+    assert kind == "snapshot"
+
+
+def test_lagging_subscriber_gets_a_snapshot(client, make_units):
+    (unit_id,) = make_units(1)
+
+    async def read():
+        events = board_events(None)
+        try:
+            kind, _, _ = parse_frame(await anext(events))
+            assert kind == "snapshot"
+
+            # Published faster than the client reads
+            for _ in range(BOARD_STREAM_QUEUE_SIZE + 10):
+                board_stream.publish_unit(unit_id, None)
+
+            frames = []
+            while not frames or frames[-1][0] != "snapshot":
+                frames.append(parse_frame(await anext(events)))
+            return frames
+        finally:
+            await events.aclose()
+
+    frames = asyncio.run(read())
+    assert len(frames) < BOARD_STREAM_QUEUE_SIZE
+    assert frames[-1][1] == board_stream.event_id(board_stream.seq)
@@ -0,0 +1,96 @@
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+from sqlalchemy import event
+
+from app.core.database import engine
+
+from conftest import daily_stay
+
+
+@contextmanager
+def count_stay_commits():
+    """
+    Commits of transactions that wrote to the stay table
+    (the audit writer commits on its own).
+    """
+    writers = set()
+    commits = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith(("INSERT INTO stay ", "UPDATE stay ")):
+            writers.add(conn)
+
+    def on_commit(conn):
+        if conn in writers:
+            writers.discard(conn)
+            commits.append(conn)
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    event.listen(engine, "commit", on_commit)
+    try:
+        yield commits
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+        event.remove(engine, "commit", on_commit)
+
+
+def test_bulk_check_in_reports_each_item_and_commits_once(client, headers, make_units):
+    free_id, occupied_id, other_id = make_units(3)
+    today = str(date.today())
+    tomorrow = str(date.today() + timedelta(days=1))
+    client.post("/stays/", json=daily_stay(occupied_id, today, tomorrow), headers=headers)
+
+    body = [
+        daily_stay(free_id, today, tomorrow),
+        daily_stay(occupied_id, today, tomorrow),
+        daily_stay(10_000_000, today, tomorrow),
+        daily_stay(other_id, "not a date", tomorrow),
+        daily_stay(free_id, today, tomorrow),
+    ]
+    with count_stay_commits() as commits:
+        response = client.post("/stays/bulk", json=body, headers=headers)
+
+    assert response.status_code == 200
+    assert len(commits) == 1
+
+    results = response.json()["results"]
+    assert [result["status_code"] for result in results] == [200, 409, 404, 422, 409]
+    assert response.json()["succeeded"] == 1
+    assert response.json()["failed"] == 4
+
+    # Field errors come through as a list, not their repr
+    (error,) = results[3]["detail"]
+    assert error["loc"] == ["check_in_date"]
+
+    stays = client.get("/stays/", params={"unit_id": free_id}, headers=headers).json()
+    assert [stay["id"] for stay in stays] == [results[0]["stay_id"]]
+
+
+def test_bulk_checkout_reports_each_item_and_commits_once(client, headers, make_units):
+    unit_ids = make_units(2)
+    today = str(date.today())
+    tomorrow = str(date.today() + timedelta(days=1))
+    stay_ids = [
+        client.post("/stays/", json=daily_stay(unit_id, today, tomorrow), headers=headers).json()[
+            "stay_id"
+        ]
+        for unit_id in unit_ids
+    ]
+    assert client.patch(f"/stays/{stay_ids[1]}/checkout", headers=headers).status_code == 200
+
+    with count_stay_commits() as commits:
+        response = client.patch(
+            "/stays/bulk-checkout",
+            json={"stay_ids": [stay_ids[0], stay_ids[1], 10_000_000]},
+            headers=headers,
+        )
+
+    assert response.status_code == 200
+    assert len(commits) == 1
+    assert [result["status_code"] for result in response.json()["results"]] == [200, 409, 404]
+
+    stays = client.get(
+        "/stays/", params={"unit_id": unit_ids[0], "status": "all"}, headers=headers
+    ).json()
+    assert [stay["status"] for stay in stays] == ["completed"]
@@ -0,0 +1,66 @@
+import csv
+import io
+import json
+from datetime import date, timedelta
+
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.models.stay import Stay
+from app.models.unit import Unit
+from app.services.stay_archive import archive_stays
+
+from conftest import daily_stay
+
+
+def test_units_csv_has_a_header_and_one_row_per_unit(client, headers, make_units):
+    unit_ids = make_units(3)
+    with Session(engine) as session:
+        property_name = session.get(Unit, unit_ids[0]).property_name
+
+    response = client.get(
+        "/units/export", params={"property_name": property_name}, headers=headers
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    header, *rows = list(csv.reader(io.StringIO(response.text)))
+    assert header == [column.name for column in Unit.__table__.columns]
+    assert [int(row[0]) for row in rows] == unit_ids
+
+
+def test_stays_ndjson_includes_archived_stays(client, headers, make_units):
+    unit_ids = make_units(2)
+    with Session(engine) as session:
+        property_name = session.get(Unit, unit_ids[0]).property_name
+    long_ago = date.today() - timedelta(days=800)
+    today = date.today()
+
+    body = daily_stay(unit_ids[0], str(long_ago), str(long_ago + timedelta(days=2)))
+    archived_id = client.post("/stays/", json=body, headers=headers).json()["stay_id"]
+    client.patch(f"/stays/{archived_id}/checkout", headers=headers)
+    with Session(engine) as session:
+        archive_stays(session)
+        assert session.get(Stay, archived_id) is None
+
+    body = daily_stay(unit_ids[1], str(today), str(today + timedelta(days=1)))
+    active_id = client.post("/stays/", json=body, headers=headers).json()["stay_id"]
+
+    response = client.get(
+        "/stays/export",
+        params={"format": "ndjson", "property_name": property_name},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [(row["id"], row["status"]) for row in rows] == [
+        (archived_id, "completed"),
+        (active_id, "active"),
+    ]
+    assert set(rows[0]) == {
+        *[column.name for column in Stay.__table__.columns],
+        "unit_number",
+        "property_name",
+    }
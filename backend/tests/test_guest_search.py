@@ -0,0 +1,79 @@
+from datetime import date, timedelta
+
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.models.stay_archive import StayArchive
+from app.models.unit import Unit
+from app.services.stay_archive import archive_stays
+
+from conftest import daily_stay
+
+
+def check_in(client, headers, unit_id, guest_name, days_ago=0):
+    check_in_date = date.today() - timedelta(days=days_ago)
+    body = daily_stay(
+        unit_id, str(check_in_date), str(check_in_date + timedelta(days=1)), guest_name=guest_name
+    )
+    response = client.post("/stays/", json=body, headers=headers)
+    assert response.status_code == 200
+    return response.json()["stay_id"]
+
+
+def search(client, headers, q):
+    response = client.get("/stays/search", params={"q": q}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["mode"] == "fts"
+    return [(match["stay_id"], match["match"]) for match in response.json()["matches"]]
+
+
+def test_tiers_come_in_order_name_exact_prefix(client, headers, make_units):
+    name_unit, prefix_unit = make_units(2)
+    with Session(engine) as session:
+        unit = Unit(property_name="Zorvik House", unit_number="Z1", unit_type="room", floor_number=1)
+        session.add(unit)
+        session.commit()
+        exact_unit = unit.id
+
+    by_prefix = check_in(client, headers, prefix_unit, "Anil Zorvikson")
+    by_property = check_in(client, headers, exact_unit, "Test Guest")
+    by_name = check_in(client, headers, name_unit, "Asha Zorvik")
+
+    assert search(client, headers, "zorvik") == [
+        (by_name, "name"),
+        (by_property, "exact"),
+        (by_prefix, "prefix"),
+    ]
+
+    # Nothing matches as typed: the close terms instead
+    assert set(search(client, headers, "zorvick")) == {(by_name, "fuzzy"), (by_property, "fuzzy")}
+
+
+def test_fuzzy_match_counts_a_swapped_pair_as_one_edit(client, headers, make_units):
+    (unit_id,) = make_units(1)
+    stay_id = check_in(client, headers, unit_id, "Devika Nair")
+
+    assert (stay_id, "fuzzy") in search(client, headers, "niar")
+
+
+def test_diacritics_are_folded(client, headers, make_units):
+    (unit_id,) = make_units(1)
+    stay_id = check_in(client, headers, unit_id, "Hans Müller")
+
+    assert search(client, headers, "muller") == [(stay_id, "name")]
+    assert search(client, headers, "Müller") == [(stay_id, "name")]
+
+
+def test_archived_stays_are_still_found(client, headers, make_units):
+    (unit_id,) = make_units(1)
+    stay_id = check_in(client, headers, unit_id, "Ilse Quandrey", days_ago=800)
+    assert client.patch(f"/stays/{stay_id}/checkout", headers=headers).status_code == 200
+
+    with Session(engine) as session:
+        archive_stays(session)
+        assert session.get(StayArchive, stay_id) is not None
+
+    response = client.get("/stays/search", params={"q": "quandrey"}, headers=headers)
+    (match,) = response.json()["matches"]
+    assert match["stay_id"] == stay_id
+    assert match["status"] == "completed"
@@ -0,0 +1,33 @@
+from datetime import date, timedelta
+
+from conftest import daily_stay
+
+
+def queued(client, headers, unit_id):
+    response = client.get("/housekeeping/queue", params={"limit": 200}, headers=headers)
+    assert response.status_code == 200
+    return [task for task in response.json()["tasks"] if task["unit_id"] == unit_id]
+
+
+def test_checkout_queues_cleaning_and_arrival_raises_it(client, headers, make_units):
+    (unit_id,) = make_units(1)
+    today = date.today()
+
+    body = daily_stay(unit_id, str(today - timedelta(days=2)), str(today))
+    stay_id = client.post("/stays/", json=body, headers=headers).json()["stay_id"]
+    client.patch(f"/stays/{stay_id}/checkout", headers=headers)
+
+    (task,) = queued(client, headers, unit_id)
+    assert task["status"] == "pending"
+    assert task["next_arrival"] is None
+
+    # A guest due in today: the same task, now with a deadline
+    body = daily_stay(unit_id, str(today), str(today + timedelta(days=1)))
+    client.post("/stays/", json=body, headers=headers)
+    (rekeyed,) = queued(client, headers, unit_id)
+    assert rekeyed["task_id"] == task["task_id"]
+    assert rekeyed["next_arrival"] == str(today)
+
+    response = client.patch(f"/housekeeping/tasks/{task['task_id']}/done", headers=headers)
+    assert response.status_code == 200
+    assert queued(client, headers, unit_id) == []
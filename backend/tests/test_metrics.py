@@ -0,0 +1,25 @@
+import pytest
+
+from app.core.security import create_access_token
+from app.routes import metrics
+
+
+def test_metrics_needs_authentication(client):
+    assert client.get("/metrics").status_code == 401
+
+
+def test_metrics_for_admins_only(client, headers):
+    response = client.get("/metrics", headers=headers)
+    assert response.status_code == 200
+    assert "# TYPE" in response.text
+
+    reception = create_access_token({"sub": "999", "role": "reception"})
+    response = client.get("/metrics", headers={"Authorization": f"Bearer {reception}"})
+    assert response.status_code == 403
+
+
+@pytest.mark.parametrize("token, expected", [("scrape-secret", 200), ("wrong", 401)])
+def test_metrics_scrape_token(client, monkeypatch, token, expected):
+    monkeypatch.setattr(metrics, "METRICS_TOKEN", "scrape-secret")
+    response = client.get("/metrics", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == expected
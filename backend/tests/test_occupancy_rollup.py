@@ -0,0 +1,70 @@
+from datetime import date, timedelta
+
+from sqlmodel import Session, select
+
+from app.core.database import engine
+from app.models.occupancy_rollup import OccupancyRollup
+from app.models.unit import Unit
+from app.services.occupancy_rollup import rebuild_occupancy_rollup
+
+from conftest import daily_stay
+from test_rent import monthly_stay
+
+
+def rollup_rows(property_name):
+    with Session(engine) as session:
+        rows = session.exec(
+            select(OccupancyRollup).where(OccupancyRollup.property_name == property_name)
+        ).all()
+
+    return sorted(
+        (
+            row.granularity,
+            row.day,
+            row.unit_type,
+            row.guest_source,
+            row.occupied_nights,
+            row.arrivals,
+            row.departures,
+            row.tenant_nights,
+            row.rent_total,
+        )
+        for row in rows
+    )
+
+
+def test_incremental_rollup_matches_a_backfill(client, headers, make_units):
+    unit_ids = make_units(4)
+    with Session(engine) as session:
+        property_name = session.get(Unit, unit_ids[0]).property_name
+    today = date.today()
+
+    def check_in(body):
+        response = client.post("/stays/", json=body, headers=headers)
+        assert response.status_code == 200
+        return response.json()["stay_id"]
+
+    # Leaves three nights early
+    early = check_in(
+        daily_stay(unit_ids[0], str(today - timedelta(days=3)), str(today + timedelta(days=3)))
+    )
+    assert client.patch(f"/stays/{early}/checkout", headers=headers).status_code == 200
+
+    # A tenant and a guest leaving together
+    tenant = check_in(monthly_stay(unit_ids[1], str(today - timedelta(days=40)), 2, 5))
+    guest = check_in(daily_stay(unit_ids[2], str(today - timedelta(days=2)), str(today)))
+    response = client.patch(
+        "/stays/bulk-checkout", json={"stay_ids": [tenant, guest]}, headers=headers
+    )
+    assert response.json()["succeeded"] == 2
+
+    # Still in: only its arrival counts
+    check_in(daily_stay(unit_ids[3], str(today), str(today + timedelta(days=2))))
+
+    incremental = rollup_rows(property_name)
+    assert incremental
+
+    with Session(engine) as session:
+        rebuild_occupancy_rollup(session)
+
+    assert rollup_rows(property_name) == incremental
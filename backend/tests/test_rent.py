@@ -0,0 +1,48 @@
+from datetime import date
+
+from app.services.rent_schedule import due_date
+
+
+def monthly_stay(unit_id, check_in, months, due_day):
+    return {
+        "unit_id": unit_id,
+        "guest_name": "Test Tenant",
+        "guest_source": "sukha",
+        "stay_type": "monthly",
+        "check_in_date": check_in,
+        "planned_months": months,
+        "monthly_due_day": due_day,
+        "monthly_rent": 15000.0,
+    }
+
+
+def schedule(client, headers, body):
+    stay_id = client.post("/stays/", json=body, headers=headers).json()["stay_id"]
+    response = client.get(f"/rent/stays/{stay_id}", headers=headers)
+    assert response.status_code == 200
+    return [row["due_date"] for row in sorted(response.json(), key=lambda row: row["period"])]
+
+
+def test_due_date_is_clamped_to_the_month():
+    assert due_date(2027, 2, 31) == date(2027, 2, 28)
+    assert due_date(2028, 2, 31) == date(2028, 2, 29)
+    assert due_date(2027, 4, 31) == date(2027, 4, 30)
+    assert due_date(2027, 5, 31) == date(2027, 5, 31)
+
+
+def test_schedule_clamps_due_day_31(client, headers, make_units):
+    (unit_id,) = make_units(1)
+    body = monthly_stay(unit_id, "2027-12-10", 5, 31)
+    assert schedule(client, headers, body) == [
+        "2027-12-31",
+        "2028-01-31",
+        "2028-02-29",
+        "2028-03-31",
+        "2028-04-30",
+    ]
+
+
+def test_first_installment_due_on_arrival_when_day_has_passed(client, headers, make_units):
+    (unit_id,) = make_units(1)
+    body = monthly_stay(unit_id, "2027-01-20", 2, 5)
+    assert schedule(client, headers, body) == ["2027-01-20", "2027-02-05"]
@@ -0,0 +1,121 @@
+from datetime import date, timedelta
+
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.models.stay import Stay
+from app.services.audit import audit_trail
+from app.services.stay_archive import archive_stays
+
+from conftest import daily_stay
+
+
+def test_second_check_in_to_occupied_unit_is_409(client, headers, make_units):
+    (unit_id,) = make_units(1)
+    today = date.today()
+    body = daily_stay(unit_id, str(today), str(today + timedelta(days=2)))
+
+    assert client.post("/stays/", json=body, headers=headers).status_code == 200
+
+    response = client.post("/stays/", json=body, headers=headers)
+    assert response.status_code == 409
+    assert response.json()["detail"] == "This unit already has an active stay"
+
+
+def test_database_rejects_check_in_the_index_missed(client, headers, make_units):
+    # Written behind the API's back: the occupancy index
+    # does not know, so only the unique index can stop it
+    (unit_id,) = make_units(1)
+    today = date.today()
+    with Session(engine) as session:
+        session.add(
+            Stay(
+                unit_id=unit_id,
+                guest_name="Walk-in",
+                guest_source="sukha",
+                stay_type="daily",
+                check_in_date=today,
+                check_out_date=today + timedelta(days=1),
+            )
+        )
+        session.commit()
+
+    body = daily_stay(unit_id, str(today), str(today + timedelta(days=2)))
+    response = client.post("/stays/", json=body, headers=headers)
+    assert response.status_code == 409
+    assert response.json()["detail"] == "This unit already has an active stay"
+
+
+def test_stay_list_is_a_list_paged_through_headers(client, headers, make_units):
+    unit_ids = make_units(5)
+    today = date.today()
+    created = set()
+    for unit_id in unit_ids:
+        body = daily_stay(unit_id, str(today), str(today + timedelta(days=1)))
+        created.add(client.post("/stays/", json=body, headers=headers).json()["stay_id"])
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = client.get("/stays/", params=params, headers=headers)
+        assert response.status_code == 200
+        assert isinstance(response.json(), list)
+        seen += [stay["id"] for stay in response.json()]
+
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            assert "Link" not in response.headers
+            break
+        assert 'rel="next"' in response.headers["Link"]
+        params = {"limit": 2, "cursor": cursor}
+
+    assert len(seen) == len(set(seen))
+    assert created <= set(seen)
+
+
+def test_second_checkout_is_409_and_audited_once(client, headers, make_units):
+    (unit_id,) = make_units(1)
+    today = date.today()
+    body = daily_stay(unit_id, str(today), str(today + timedelta(days=1)))
+    stay_id = client.post("/stays/", json=body, headers=headers).json()["stay_id"]
+
+    assert client.patch(f"/stays/{stay_id}/checkout", headers=headers).status_code == 200
+
+    response = client.patch(f"/stays/{stay_id}/checkout", headers=headers)
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Stay is not active"
+
+    # The writer flushes within SUKHA_AUDIT_FLUSH_MS
+    audit_trail.stop()
+    audit_trail.start()
+    events = client.get(
+        "/audit/events", params={"unit_id": unit_id, "action": "checkout"}, headers=headers
+    ).json()["items"]
+    assert [event["stay_id"] for event in events] == [stay_id]
+
+
+def test_archiving_the_newest_stay_does_not_free_its_id(client, headers, make_units):
+    # Without AUTOINCREMENT the next check-in took the
+    # archived stay's id and clashed in the search index
+    (unit_id,) = make_units(1)
+    long_ago = date.today() - timedelta(days=800)
+    body = daily_stay(
+        unit_id, str(long_ago), str(long_ago + timedelta(days=2)), guest_name="Archived Newest"
+    )
+    archived_id = client.post("/stays/", json=body, headers=headers).json()["stay_id"]
+    assert client.patch(f"/stays/{archived_id}/checkout", headers=headers).status_code == 200
+
+    with Session(engine) as session:
+        assert archive_stays(session)["archived"] >= 1
+        assert session.get(Stay, archived_id) is None
+
+    today = date.today()
+    body = daily_stay(unit_id, str(today), str(today + timedelta(days=1)), guest_name="Archived Newest")
+    response = client.post("/stays/", json=body, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["stay_id"] > archived_id
+
+    matches = client.get(
+        "/stays/search", params={"q": "Archived Newest"}, headers=headers
+    ).json()["matches"]
+    assert {match["stay_id"] for match in matches} == {archived_id, response.json()["stay_id"]}
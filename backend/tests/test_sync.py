@@ -0,0 +1,48 @@
+from datetime import date, timedelta
+
+from conftest import daily_stay
+
+
+def sync(client, headers, since=None):
+    params = {} if since is None else {"since": since}
+    response = client.get("/sync", params=params, headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_first_sync_is_a_snapshot(client, headers, make_units):
+    unit_ids = make_units(2)
+
+    first = sync(client, headers)
+    assert first["mode"] == "snapshot"
+    assert set(unit_ids) <= {unit["id"] for unit in first["units"]}
+    assert all(stay["status"] == "active" for stay in first["stays"])
+
+
+def test_delta_carries_only_what_changed(client, headers, make_units):
+    (unit_id,) = make_units(1)
+    cursor = sync(client, headers)["cursor"]
+
+    empty = sync(client, headers, cursor)
+    assert empty["mode"] == "delta"
+    assert empty["cursor"] == cursor
+    assert empty["units"] == [] and empty["stays"] == []
+
+    today = date.today()
+    body = daily_stay(unit_id, str(today), str(today + timedelta(days=1)))
+    stay_id = client.post("/stays/", json=body, headers=headers).json()["stay_id"]
+
+    delta = sync(client, headers, cursor)
+    assert delta["mode"] == "delta"
+    assert delta["cursor"] > cursor
+    assert [stay["id"] for stay in delta["stays"]] == [stay_id]
+    assert delta["stays"][0]["status"] == "active"
+
+    client.patch(f"/stays/{stay_id}/checkout", headers=headers)
+    after_checkout = sync(client, headers, delta["cursor"])
+    assert [stay["status"] for stay in after_checkout["stays"]] == ["completed"]
+
+
+def test_unknown_cursor_gets_a_snapshot(client, headers):
+    head = sync(client, headers)["cursor"]
+    assert sync(client, headers, head + 1000)["mode"] == "snapshot"